@@ -1,14 +1,27 @@
 # -*- coding: utf-8 -*-
 #!/usr/bin/env python3
 
-import random
+import os
+import time
 import tkinter as tk
-from tkinter import ttk
-
-from typing import Dict, List
-from lib.edit.editfile import Editfile
-from lib.edit import STARKE_UNREGELMEASSIE
+from tkinter import messagebox, ttk
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional, Tuple
+from lib.edit import PATH_TO_PLAYER_STORE, PATH_TO_REVIEW_STATE, STARKE_UNREGELMEASSIE
+from lib.edit.player_store import PlayerStore, default_player_name
+from lib.events import EVENTS_FILE_ENV, emit, enable_events
+from lib.game import (
+    AnswerMatcher,
+    GameSession,
+    HandlerTenseVerbs,
+    NearMissClassifier,
+    SpacedRepetitionScheduler,
+    describe_near_misses,
+)
 from lib.constant_values import (
+    AnswerStrictness,
+    EventName,
     TenseKey,
     TkFilling,
     TkRelief,
@@ -25,103 +38,57 @@ from lib.windows import (
     GameConclusionTemplate,
     check_input,
 )
-from scripts import clean_file
-
-
-class HandlerTenseVerbs:
-    def __init__(
-        self, file_name: str = STARKE_UNREGELMEASSIE, max_game: int = 20
-    ) -> None:
-        """
-        :param file_name: Name of the file to import
-        :param max_game: Maximum game possible to play"""
-
-        check_input([(file_name, str), (max_game, int)])
-
-        # clear data before manipulation
-        clean_file()
-
-        self.file_name = file_name
-        self.max_game = max_game
-        self._file_to_edit = Editfile(self.file_name)
-        # think about switch from list to numpy array (1.22.4) for perform in the future...
-        # python: 3.7 -> 3.8.10 or 3.8.14 (3.8 lowest python sw vs supported by numpy)
-        self._verbs_list = self._file_to_edit.read_txt()
-        self._length_verbs_list = len(self._verbs_list)
-        self._random_numbers = self._get_random_numbers()
-        self._not_used_verbs = self._get_game_verbs()
-        self._used_verbs = []
-
-    def _get_random_numbers(self) -> List[int]:
-        """Generate a list of number which represents the tense verbs to play with"""
-        return random.sample(range(self._length_verbs_list), self.max_game)
-
-    def _get_game_verbs(self) -> List[str]:
-        """Get the tense verbs to be used during the game.
-        Only generated one time, for each HandlerTenseVerbs object instanciation"""
-
-        return [self._verbs_list[ind] for ind in self._random_numbers]
-
-    def select_verb(self) -> Dict:
-        """Select random tense verbs in a list of tense verbs and order it in
-        a dictionary with the corresponding key.
-        "Fahren","Fährt", "Fuhr","ist gefahren", "A2"
-        e.g:
-            dict =
-                {
-                    "infinitive": "Fahren"
-                    "verb singular third form": "Fährt"
-                    "preterite": "Fuhr"
-                    "perfect": "ist gefahren"
-                    "level": "A2"
-                }
-        return tense_verb (dict)"""
-
-        if not self._not_used_verbs:  # check if list empty
-            return dict()  # empty dict
-
-        _tense_verb = self._not_used_verbs.pop()
-        _split_tense_verb = _tense_verb.split()
-        self._used_verbs.append(_tense_verb)
-
-        return {
-            TenseKey.INFINITIVE.value: _split_tense_verb[0],
-            TenseKey.THIRD_FORM.value: _split_tense_verb[1],
-            TenseKey.PRETERITE.value: _split_tense_verb[2],
-            TenseKey.PERFECT.value: _split_tense_verb[3] + " " + _split_tense_verb[4],
-            TenseKey.LEVEL.value: _split_tense_verb[5],
-        }
-
-
-class PlayerScore:
-    def __init__(self, score: int) -> None:
-        """:param score: player score"""
-        self._current_score = score
-
-    @property
-    def current_score(self):
-        return self._current_score
-
-    @current_score.setter
-    def current_score(self, score):
-        if not isinstance(score, int):
-            # add log warning -> wrong score type set
-            self._current_score = self._current_score
-        if score < 0 or score > 20:
-            # add log warning -> wrong range
-            self._current_score = self._current_score
-        self._current_score = score
+from lib.windows.countdown import CountdownScheduler
 
 
 class VerbenLernenApp(tk.Tk):
     """Game class."""
 
     def __init__(
-        self, file_name: str = STARKE_UNREGELMEASSIE, max_game: int = 20
+        self,
+        file_name: str = STARKE_UNREGELMEASSIE,
+        max_game: int = 20,
+        levels: Optional[Iterable[str]] = None,
+        review_state: Optional[str] = PATH_TO_REVIEW_STATE,
+        player_name: Optional[str] = None,
+        player_store: Optional[str] = PATH_TO_PLAYER_STORE,
+        strictness: AnswerStrictness = AnswerStrictness.LENIENT,
+        answer_time: int = 40,
+        events_file: Optional[str] = None,
     ) -> None:
-        """TO DO"""
+        """
+        :param file_name: Name of the file to import
+        :param max_game: Maximum game possible to play
+        :param levels: (Optional) Only play with verbs of these levels, e.g ("A1", "A2")
+        :param review_state: (Optional) File where the spaced repetition state is saved
+        between games. Set to None to play with random verbs only
+        :param player_name: (Optional) Name used to save the scores.
+        Default set to the session user name
+        :param player_store: (Optional) SQLite database where answers and scores are
+        saved. Set to None to keep the scores in memory only
+        :param strictness: (Optional) How close the answers should be to the tense
+        verbs. Default set to AnswerStrictness.LENIENT
+        :param answer_time: (Optional) Seconds given to answer each verb.
+        Default set to 40
+        :param events_file: (Optional) JSON Lines file where page transitions and
+        answers events are written, see lib.events. Default set to None, no event"""
+
+        check_input(
+            [
+                (file_name, str),
+                (max_game, int),
+                (levels, (list, tuple, set, frozenset, type(None))),
+                (review_state, (str, type(None))),
+                (player_name, (str, type(None))),
+                (player_store, (str, type(None))),
+                (strictness, AnswerStrictness),
+                (answer_time, int),
+                (events_file, (str, type(None))),
+            ]
+        )
 
-        check_input([(file_name, str), (max_game, int)])
+        if events_file:
+            enable_events(events_file)
 
         tk.Tk.__init__(self)
 
@@ -130,6 +97,18 @@ class VerbenLernenApp(tk.Tk):
         self.resizable(0, 0)  # make sure full screen is not availabe
         self.file_name = file_name
         self.max_game = max_game
+        self.levels = levels
+        self.scheduler = (
+            SpacedRepetitionScheduler(review_state) if review_state else None
+        )
+        self.player_name = player_name or default_player_name()
+        self.player_store = PlayerStore(player_store) if player_store else None
+        self.strictness = strictness
+        self.answer_time = answer_time
+        # every countdown of the app, cancelled when the page is switched
+        self.countdowns = CountdownScheduler(self)
+        self.answer_matcher = None
+        self.near_miss_classifier = None
         self._current_frame = None
         self._previous_frame_name = None
         self._is_first_switch = True
@@ -139,31 +118,87 @@ class VerbenLernenApp(tk.Tk):
         self.frames_container.pack(side=TkSide.TOP, fill=TkFilling.BOTH, expand=True)
 
         self.configure_style(self.frames_container)
+        # no time is lost while the window is minimized
+        self.bind("<Unmap>", self._pause_countdowns)
+        self.bind("<Map>", self._resume_countdowns)
+        # answers buffered by the player store are lost if the window is only destroyed
+        self.protocol("WM_DELETE_WINDOW", self.close)
         self._reset()
 
     def switch_frame(self, frame_class):
-        """TO DO"""
-        if self._current_frame is not None:
-            # TO DO: log which frame was destroyed
-            self._current_frame.destroy()
-            self.page_creator()
+        """Show a page. Pages are never destroyed: the previous page is only
+        unpacked, with its widgets kept for the next time it is shown.
+        Countdowns of the previous page are cancelled"""
+        start = time.monotonic()
+        self.countdowns.cancel_all()
+        previous_frame = self._current_frame
+        if previous_frame is not None and previous_frame is not frame_class:
+            previous_frame.pack_forget()
 
         self._current_frame = frame_class
-        # TO DO : log current frame
+        self._current_frame.pack(side=TkSide.TOP, fill=TkFilling.BOTH, expand=True)
+        self._current_frame.tkraise()
+        emit(
+            EventName.PAGE_SWITCH,
+            start,
+            previous=type(previous_frame).__name__ if previous_frame else None,
+            page=type(frame_class).__name__,
+        )
         if self._is_first_switch:  # to launch presentation page
             self._is_first_switch = False
             self._previous_frame_name = VerbenLernenEnum.START_PG.value
             self._current_frame.template_launcher()
 
     def switch_to_game_page(self):
-        """TO DO"""
+        """Start the game session and show the first game page"""
+        if self.session is None:
+            try:
+                self._start_session()
+            except ValueError as error:
+                # e.g levels not in the corpus: the game cannot be played
+                messagebox.showerror(self.title(), str(error))
+                self.close()
+                return
         self.switch_frame(self.game_pages)
         self._previous_frame_name = VerbenLernenEnum.GAME_PG.value
         self._current_frame.template_launcher(
-            self._verb_to_find[TenseKey.INFINITIVE],
-            len(self.verbs_handler._not_used_verbs),
-            self.player_score.current_score,
+            self.session.current_verb[TenseKey.INFINITIVE],
+            self.session.remaining_verbs,
+            self.session.score,
         )
+        self.start_answer_countdown()
+
+    def start_answer_countdown(self):
+        """Give answer_time seconds to answer the current verb, the answer
+        is submitted at the end of the countdown"""
+        self.session.start_answer_clock()
+        self.countdowns.start(
+            VerbenLernenEnum.GAME_PG.value,
+            self.answer_time,
+            self.choose_failed_or_success_page,
+            self.game_pages.show_remaining_time,
+        )
+
+    def close(self):
+        """Save the reviews and the buffered answers, then close the window.
+        A game left before its end is not finished: its score is not saved"""
+
+        self.countdowns.cancel_all()
+        if self.scheduler is not None:
+            self.scheduler.save()
+        if self.player_store is not None:
+            self.player_store.close()
+            self.player_store = None
+        self.destroy()
+
+    def _pause_countdowns(self, event):
+        # <Unmap> of the root window only, not of its pages
+        if event.widget is self:
+            self.countdowns.pause()
+
+    def _resume_countdowns(self, event):
+        if event.widget is self:
+            self.countdowns.resume()
 
     def configure_style(self, frame):
         """Customized ttk widgets style
@@ -199,61 +234,105 @@ class VerbenLernenApp(tk.Tk):
             font=("Arial Black", "18"),
         )
 
-    def page_creator(self):
-        """Create object to their default state.
-        Should be used after destroying a page"""
+    def _load_game(self) -> Tuple[HandlerTenseVerbs, AnswerMatcher, NearMissClassifier]:
+        """Load the corpus, the accepted answers and the forms of all verbs.
+        Run in a background thread: no tkinter call is allowed here"""
 
-        if self._previous_frame_name == VerbenLernenEnum.END_PG.value:
-            self.conclusion_page = GameConclusionTemplate(
-                self.frames_container, self.quit
+        verbs_handler = HandlerTenseVerbs(
+            self.file_name, self.max_game, levels=self.levels, scheduler=self.scheduler
+        )
+        answer_matcher = self.answer_matcher
+        near_miss_classifier = self.near_miss_classifier
+        if answer_matcher is None:
+            # accepted answers and forms of all verbs are indexed one time,
+            # for all the games
+            answer_matcher = AnswerMatcher(verbs_handler.corpus or (), self.strictness)
+            near_miss_classifier = NearMissClassifier(
+                verbs_handler.corpus or (), answer_matcher=answer_matcher
             )
+        return verbs_handler, answer_matcher, near_miss_classifier
+
+    def _start_session(self):
+        """Start the game session, waiting for the end of _load_game if needed"""
+
+        (
+            self.verbs_handler,
+            self.answer_matcher,
+            self.near_miss_classifier,
+        ) = self._game_loaded.result()
+        # game flow is handled by the headless engine, pages only display it
+        self.session = GameSession(
+            self.verbs_handler,
+            self.player_store,
+            self.player_name,
+            self.answer_matcher,
+            self.near_miss_classifier,
+        )
+        self.player_score = self.session.player_score
+
+    def _page(self, page_name: str) -> ttk.Frame:
+        """Get a page, created on its first use. Only the current page is packed
+        :param page_name: VerbenLernenEnum value of the page"""
+
+        page = self._pages.get(page_name)
+        if page is None:
+            start = time.monotonic()
+            template_class, func = self._page_templates[page_name]
+            page = template_class(self.frames_container, func)
+            page.pack_forget()
+            self._pages[page_name] = page
+            emit(EventName.PAGE_CREATE, start, page=template_class.__name__)
+        return page
 
-        elif self._previous_frame_name == VerbenLernenEnum.GAME_PG.value:
-            self.game_pages = GamePageTemplate(
-                self.frames_container, self.choose_failed_or_success_page
-            )
+    @property
+    def game_pages(self) -> GamePageTemplate:
+        return self._page(VerbenLernenEnum.GAME_PG.value)
 
-        elif self._previous_frame_name == VerbenLernenEnum.FAIL_PG.value:
-            self.fail_page = GameFailedTemplate(
-                self.frames_container, self.choose_game_or_conclusion_page
-            )
+    @property
+    def fail_page(self) -> GameFailedTemplate:
+        return self._page(VerbenLernenEnum.FAIL_PG.value)
 
-        elif self._previous_frame_name == VerbenLernenEnum.SUCCESS_PG.value:
-            self.success_page = GameSuccessTemplate(
-                self.frames_container, self.choose_game_or_conclusion_page
-            )
+    @property
+    def success_page(self) -> GameSuccessTemplate:
+        return self._page(VerbenLernenEnum.SUCCESS_PG.value)
 
-        elif self._previous_frame_name == VerbenLernenEnum.START_PG.value:
-            self.presentation_page = GamePresentationTemplate(
-                self.frames_container,
-                func=self.switch_to_game_page,
-            )
-        else:
-            pass
+    @property
+    def conclusion_page(self) -> GameConclusionTemplate:
+        return self._page(VerbenLernenEnum.END_PG.value)
 
     def _reset(self):
         """Set object or attributes to their default state"""
 
-        self.verbs_handler = HandlerTenseVerbs(self.file_name, self.max_game)
-        self._verb_to_find = self.verbs_handler.select_verb()
-
-        self.player_score = PlayerScore(score=0)
-
-        self.conclusion_page = GameConclusionTemplate(self.frames_container, self.quit)
-
-        self.game_pages = GamePageTemplate(
-            self.frames_container, self.choose_failed_or_success_page
-        )
-        self.fail_page = GameFailedTemplate(
-            self.frames_container, self.choose_game_or_conclusion_page
-        )
-        self.success_page = GameSuccessTemplate(
-            self.frames_container, self.choose_game_or_conclusion_page
-        )
+        self.session = None
+
+        # one instance of each page for the whole game, created on its first use:
+        # only the presentation page is needed to show the first frame
+        self._pages = {}
+        self._page_templates = {
+            VerbenLernenEnum.GAME_PG.value: (
+                GamePageTemplate,
+                self.choose_failed_or_success_page,
+            ),
+            VerbenLernenEnum.FAIL_PG.value: (
+                GameFailedTemplate,
+                self.choose_game_or_conclusion_page,
+            ),
+            VerbenLernenEnum.SUCCESS_PG.value: (
+                GameSuccessTemplate,
+                self.choose_game_or_conclusion_page,
+            ),
+            VerbenLernenEnum.END_PG.value: (GameConclusionTemplate, self.close),
+        }
         self.presentation_page = GamePresentationTemplate(
             self.frames_container,
             func=self.switch_to_game_page,
         )
+        self.presentation_page.pack_forget()
+
+        # the corpus is loaded while the player reads the rules
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._game_loaded: Future = executor.submit(self._load_game)
+        executor.shutdown(wait=False)
 
         # start game
         self.switch_frame(self.presentation_page)
@@ -261,48 +340,64 @@ class VerbenLernenApp(tk.Tk):
     def choose_failed_or_success_page(self):
         """Choose either to launch failure page or success page"""
 
-        if self.validate_user_input():
-            self.player_score.current_score = self.player_score.current_score + 1
+        # submitted before the end of the countdown: it should never fire later
+        self.countdowns.cancel(VerbenLernenEnum.GAME_PG.value)
+        is_correct = self.session.submit(
+            self.game_pages.imperfect_entried.get(),
+            self.game_pages.preterite_entried.get(),
+        )
+
+        if is_correct:
             self.switch_frame(self.success_page)
             self._previous_frame_name = VerbenLernenEnum.SUCCESS_PG.value
-            self.success_page.template_launcher(self._verb_to_find)
+            self.success_page.template_launcher(self.session.current_verb)
         else:
-            self.player_score.current_score = self.player_score.current_score
             self.switch_frame(self.fail_page)
             self._previous_frame_name = VerbenLernenEnum.FAIL_PG.value
-            self.fail_page.template_launcher(self._verb_to_find)
+            self.fail_page.template_launcher(
+                self.session.current_verb,
+                describe_near_misses(self.session.last_near_misses),
+            )
 
     def choose_game_or_conclusion_page(self):
         """Choose either to go to game page or conclusion page"""
 
-        self._verb_to_find = self.verbs_handler.select_verb()
+        self.session.next_verb()
 
-        if len(self.verbs_handler._used_verbs) == self.max_game:
+        if self.session.is_finished:
             self.switch_frame(self.conclusion_page)
             self._previous_frame_name = VerbenLernenEnum.END_PG.value
-            self.conclusion_page.template_launcher(self.player_score.current_score)
+            self.conclusion_page.template_launcher(self.session.score)
         else:
             self.switch_frame(self.game_pages)
             self._previous_frame_name = VerbenLernenEnum.GAME_PG.value
             self.game_pages.template_launcher(
-                self._verb_to_find[TenseKey.INFINITIVE],
-                len(self.verbs_handler._not_used_verbs),
-                self.player_score.current_score,
+                self.session.current_verb[TenseKey.INFINITIVE],
+                self.session.remaining_verbs,
+                self.session.score,
             )
-
-    def validate_user_input(self) -> bool:
-        """Check user entries, and return True if all entries are correct"""
-
-        if (
-            self.game_pages.imperfect_entried.get()
-            == self._verb_to_find[TenseKey.PERFECT.value]
-            and self.game_pages.preterite_entried.get()
-            == self._verb_to_find[TenseKey.PRETERITE.value]
-        ):
-            return True
-        return False
+            self.start_answer_countdown()
 
 
 if __name__ == "__main__":
-    game_app = VerbenLernenApp()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="VerbenLernen game")
+    parser.add_argument(
+        "--profile",
+        # lib.windows.profiling.PROFILE_ENV, the profiler is only imported if used
+        default=os.environ.get("VERBENLERNEN_PROFILE"),
+        metavar="PREFIX",
+        help="profile the Tk callbacks, stats written to PREFIX.* on exit "
+        + "(default: $VERBENLERNEN_PROFILE)",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        from lib.windows.profiling import CallbackProfiler
+
+        # before the app creation: only callbacks registered afterwards are profiled
+        CallbackProfiler(args.profile).install()
+
+    game_app = VerbenLernenApp(events_file=os.environ.get(EVENTS_FILE_ENV))
     game_app.mainloop()
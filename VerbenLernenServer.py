@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Launch the VerbenLernen quiz server, then open http://127.0.0.1:8765/"""
+
+import argparse
+import asyncio
+
+from lib.edit import PATH_TO_PLAYER_STORE, STARKE_UNREGELMEASSIE
+from lib.edit.player_store import PlayerStore
+from lib.server import QuizServer
+from lib.server.quiz_server import DEFAULT_HOST, DEFAULT_PORT
+
+
+async def main(args: argparse.Namespace):
+    player_store = PlayerStore(args.player_store) if args.player_store else None
+    server = QuizServer(args.file_name, player_store=player_store)
+    print(f"VerbenLernen server on http://{args.host}:{args.port}/")
+    try:
+        await server.serve_forever(args.host, args.port)
+    finally:
+        await server.stop()
+        if player_store is not None:
+            player_store.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--file-name", default=STARKE_UNREGELMEASSIE)
+    parser.add_argument(
+        "--player-store",
+        default=PATH_TO_PLAYER_STORE,
+        help="SQLite database of the scores, empty to keep them in memory only",
+    )
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
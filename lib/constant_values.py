@@ -93,6 +93,54 @@ class TenseKey(str, Enum):
     LEVEL = "level"
 
 
+@unique
+class AnswerStrictness(str, Enum):
+    """
+    How close a player answer should be to the tense verb
+    """
+
+    EXACT = "exact"  # same string
+    NORMAL = "normal"  # case and spaces are ignored
+    LENIENT = "lenient"  # ae/oe/ue/ss accepted for umlauts, auxiliary optional
+
+
+@unique
+class AnswerMistake(str, Enum):
+    """
+    Kind of mistake of a wrong tense given by the player
+    """
+
+    CORRECT = "correct"
+    TYPO = "typo"  # a few letters from the right tense
+    OTHER_VERB = "other verb"  # tense of another verb
+    WRONG = "wrong"
+
+
+@unique
+class ValidationMode(str, Enum):
+    """
+    Input validation of lib.validation
+    """
+
+    STRICT = "strict"  # every input type is checked, for development and tests
+    OFF = "off"  # nothing is checked, for production
+
+
+@unique
+class EventName(str, Enum):
+    """
+    Names of the events of lib.events
+    """
+
+    EVENTS_START = "events.start"  # first event of a file, with the wall clock time
+    PAGE_CREATE = "page.create"
+    PAGE_SWITCH = "page.switch"
+    VERB_SELECT = "verb.select"
+    ANSWER_SUBMIT = "answer.submit"
+    SCORE_UPDATE = "score.update"
+    SCORE_INVALID = "score.invalid"
+
+
 class TkErrors(Exception):
     """Raised for any Tkinter error"""
 
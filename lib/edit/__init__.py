@@ -9,3 +9,5 @@
 
 PATH_TO_STARKE_UNREGELMEASSIE = "./lib/edit/starke_unregelmeassie.txt"
 STARKE_UNREGELMEASSIE = "starke_unregelmeassie.txt"
+PATH_TO_REVIEW_STATE = "./lib/edit/review_state.json"
+PATH_TO_PLAYER_STORE = "./lib/edit/players.sqlite3"
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Compiled tense verbs corpus
+
+The text corpus (e.g starke_unregelmeassie.txt) is compiled one time into a
+binary file made of fixed-size records. The binary file is opened with mmap,
+so opening a corpus does not depend on the number of verbs it contains, and
+each record is already split into its tense verb fields.
+
+Compiled file layout:
+    - header (see _HEADER): magic, version, number of records, record size,
+      source size, source mtime, source sha256 checksum, width of each field,
+      number of levels
+    - records: one record per verb, each field is utf-8 encoded and padded
+      with null bytes up to the field width
+    - level table (see _LEVEL_ENTRY): one entry per level, with the position
+      and the number of its verbs in the level index
+    - level index: records index (uint32) grouped by level
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+COMPILED_EXTENSION = ".vlc"
+# infinitive, third form, preterite, auxiliary, participle, level
+NBER_FIELDS = 6
+LEVEL_FIELD = 5
+
+_MAGIC = b"VLCORPUS"
+_VERSION = 2
+_HEADER = struct.Struct("<8sHHIIQq32s" + "H" * NBER_FIELDS + "H")
+_LEVEL_ENTRY = struct.Struct("<8sII")
+_INDEX_TYPECODE = "I"
+_CHUNK_SIZE = 1 << 16
+
+
+def file_checksum(path_to_file: str) -> bytes:
+    """Compute the sha256 checksum of a file, read by chunks
+
+    :param path_to_file: path to the file
+
+    :return: sha256 digest (bytes)"""
+
+    checksum = hashlib.sha256()
+    with open(path_to_file, "rb") as binary_file:
+        for chunk in iter(lambda: binary_file.read(_CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return checksum.digest()
+
+
+def compiled_path_for(source_path: str) -> str:
+    """Get the compiled corpus path associated to a text corpus
+
+    :param source_path: path to the text corpus
+
+    :return: compiled corpus path (str)"""
+
+    return os.path.splitext(source_path)[0] + COMPILED_EXTENSION
+
+
+def parse_line(line: str) -> Optional[Tuple[str, ...]]:
+    """Split a corpus line into its tense verb fields
+
+    :param line: raw line, e.g "fahren fährt fuhr ist gefahren A2"
+
+    :return: fields (tuple) or None for an empty line
+
+    :raise ValueError: Error raised when the line does not have the expected fields number"""
+
+    fields = tuple(line.split())
+    if not fields:
+        return None
+    if len(fields) != NBER_FIELDS:
+        raise ValueError(
+            f"Corpus line does not respect the verben_lernen format: {line!r}"
+        )
+    return fields
+
+
+def compile_corpus(source_path: str, compiled_path: Optional[str] = None) -> int:
+    """Compile a text corpus into fixed-size records.
+    The compiled file is written into a temporary file then renamed,
+    so a reader never sees a partially written corpus.
+
+    :param source_path: path to the text corpus
+    :param compiled_path: (Optional) path to the compiled corpus.
+    Default set to the source path with COMPILED_EXTENSION
+
+    :return: number of compiled records (int)"""
+
+    compiled_path = compiled_path or compiled_path_for(source_path)
+    source_stat = os.stat(source_path)
+    checksum = hashlib.sha256()
+    records: List[Tuple[bytes, ...]] = []
+
+    with open(source_path, "rb") as txt_file:
+        for raw_line in txt_file:
+            checksum.update(raw_line)
+            fields = parse_line(raw_line.decode("utf-8"))
+            if fields is not None:
+                records.append(tuple(field.encode("utf-8") for field in fields))
+
+    widths = [1] * NBER_FIELDS
+    for record in records:
+        for index, field in enumerate(record):
+            if len(field) > widths[index]:
+                widths[index] = len(field)
+    record_struct = struct.Struct("<" + "".join(f"{width}s" for width in widths))
+
+    level_index: Dict[bytes, array] = {}
+    for index, record in enumerate(records):
+        level_index.setdefault(record[LEVEL_FIELD], array(_INDEX_TYPECODE)).append(
+            index
+        )
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        NBER_FIELDS,
+        len(records),
+        record_struct.size,
+        source_stat.st_size,
+        source_stat.st_mtime_ns,
+        checksum.digest(),
+        *widths,
+        len(level_index),
+    )
+
+    directory = os.path.dirname(os.path.abspath(compiled_path))
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as compiled_file:
+            compiled_file.write(header)
+            for record in records:
+                compiled_file.write(record_struct.pack(*record))
+            position = 0
+            for level in sorted(level_index):
+                compiled_file.write(
+                    _LEVEL_ENTRY.pack(level, position, len(level_index[level]))
+                )
+                position += len(level_index[level])
+            for level in sorted(level_index):
+                compiled_file.write(level_index[level].tobytes())
+        os.replace(tmp_path, compiled_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return len(records)
+
+
+class CompiledCorpus(Sequence):
+    """Read only access to a compiled corpus through mmap.
+
+    Each item is a tuple of the tense verb fields:
+        ("fahren", "fährt", "fuhr", "ist", "gefahren", "A2")
+
+    The compiled corpus is (re)built when missing or when the text corpus
+    content has changed (checksum mismatch).
+
+    level_index gives, for each level, the index of its records, read
+    directly from the compiled file."""
+
+    def __init__(self, source_path: str, compiled_path: Optional[str] = None):
+        """
+        :param source_path: path to the text corpus
+        :param compiled_path: (Optional) path to the compiled corpus.
+        Default set to the source path with COMPILED_EXTENSION
+        """
+
+        self.source_path = source_path
+        self.compiled_path = compiled_path or compiled_path_for(source_path)
+
+        self._file = None
+        self._mmap = None
+        self._index_view = None
+        self.level_index: Dict[str, memoryview] = {}
+        self._open()
+
+    def _read_header(self) -> Optional[tuple]:
+        """Read the compiled corpus header, None if missing or unknown format"""
+
+        try:
+            with open(self.compiled_path, "rb") as compiled_file:
+                header = compiled_file.read(_HEADER.size)
+        except FileNotFoundError:
+            return None
+
+        if len(header) != _HEADER.size:
+            return None
+        values = _HEADER.unpack(header)
+        if values[0] != _MAGIC or values[1] != _VERSION or values[2] != NBER_FIELDS:
+            return None
+        return values
+
+    def _is_up_to_date(self, header: Optional[tuple]) -> bool:
+        """Check if the compiled corpus matches the text corpus.
+        Size and mtime are checked first, the checksum is only computed
+        when they differ from the values recorded during compilation."""
+
+        if header is None:
+            return False
+
+        source_stat = os.stat(self.source_path)
+        if header[5] == source_stat.st_size and header[6] == source_stat.st_mtime_ns:
+            return True
+
+        if file_checksum(self.source_path) != header[7]:
+            return False
+
+        # same content, only refresh the recorded stat to avoid a new checksum
+        refreshed = _HEADER.pack(
+            *header[:5], source_stat.st_size, source_stat.st_mtime_ns, *header[7:]
+        )
+        with open(self.compiled_path, "r+b") as compiled_file:
+            compiled_file.write(refreshed)
+        return True
+
+    def _open(self):
+        """Map the compiled corpus in memory, compile it before if needed"""
+
+        header = self._read_header()
+        if not self._is_up_to_date(header):
+            compile_corpus(self.source_path, self.compiled_path)
+            header = self._read_header()
+
+        self._length = header[3]
+        self._record_size = header[4]
+        self._record_struct = struct.Struct(
+            "<" + "".join(f"{width}s" for width in header[8 : 8 + NBER_FIELDS])
+        )
+        nber_levels = header[8 + NBER_FIELDS]
+
+        self._file = open(self.compiled_path, "rb")
+        if self._length:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._open_level_index(nber_levels)
+
+    def _open_level_index(self, nber_levels: int):
+        """Map the level index without copying it
+        :param nber_levels: number of entries in the level table"""
+
+        table_offset = _HEADER.size + self._length * self._record_size
+        index_offset = table_offset + nber_levels * _LEVEL_ENTRY.size
+
+        self._index_view = memoryview(self._mmap)[index_offset:].cast(_INDEX_TYPECODE)
+        for nber in range(nber_levels):
+            level, position, count = _LEVEL_ENTRY.unpack_from(
+                self._mmap, table_offset + nber * _LEVEL_ENTRY.size
+            )
+            self.level_index[level.rstrip(b"\0").decode("utf-8")] = self._index_view[
+                position : position + count
+            ]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Tuple[str, ...]:
+        """Decode the record at the given index"""
+
+        if isinstance(index, slice):
+            return [self[ind] for ind in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("compiled corpus index out of range")
+
+        offset = _HEADER.size + index * self._record_size
+        return tuple(
+            field.rstrip(b"\0").decode("utf-8")
+            for field in self._record_struct.unpack_from(self._mmap, offset)
+        )
+
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
+        for index in range(self._length):
+            yield self[index]
+
+    def close(self):
+        """Release the mmap and the file handle"""
+
+        for level_view in self.level_index.values():
+            level_view.release()
+        self.level_index = {}
+        if self._index_view is not None:
+            self._index_view.release()
+            self._index_view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
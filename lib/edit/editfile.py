@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import os
-from typing import List
+import shutil
+import tempfile
+from typing import Dict, Iterable, Iterator, Optional
+
+from lib.edit.corpus import CompiledCorpus
 
 
 ERRORS_EDITFILE = {
@@ -9,13 +13,68 @@ ERRORS_EDITFILE = {
     2: "First element in the list is not a german infinitive verb",
     3: "The auxiliary enter is incorrect",
     4: "The level enter is incorrect",
+    5: "This verb is given several times in the data to add",
 }
 
+_AUXILIARIES = ["hat", "ist"]
+_LEVELS = ["A1", "A2", "B1", "B2", "C1", "C2"]
+
+
+class EditfileImportError(ValueError):
+    """Raised when one or several rows of a bulk import are incorrect"""
+
+    def __init__(self, errors: Dict[int, str]) -> None:
+        """
+        :param errors: row index -> error message from ERRORS_EDITFILE"""
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} incorrect row(s), nothing has been written: "
+            + ", ".join(f"row {row}: {msg}" for row, msg in sorted(errors.items()))
+        )
+
+
+def _find_format_error(data_to_check: list, infinitive_index: Optional[dict] = None):
+    """
+    Find the first verben_lernen format mistake of the entry data.
+    Known verbs are only checked when infinitive_index is given.
+    Module level function, so it can be used by a process pool.
+
+    :param data_to_check: list of data to check (see Editfile.add_txt_in_file)
+    :param infinitive_index: (Optional) all known tense verbs, indexed by infinitive verb
+
+    :return: ERRORS_EDITFILE key of the mistake, None if the format is correct
+    """
+
+    if len(data_to_check) != 5:
+        return 0
+
+    len_infinitive_verb = len(data_to_check[0])
+    infinive = [
+        v for i, v in enumerate(data_to_check[0]) if i >= len_infinitive_verb - 2
+    ]
+    if not (infinive == ["e", "n"]):
+        if not (infinive == ["r", "n"]):
+            return 2
+
+    if infinitive_index is not None and data_to_check[0] in infinitive_index:
+        return 1
+
+    perfect = data_to_check[3].split()
+    if not perfect or not (perfect[0] in _AUXILIARIES):
+        return 3
+
+    if not (data_to_check[4] in _LEVELS):
+        return 4
+
+    return None
+
 
 class Editfile:
     """Basic class to read and add verbs in the specific filename
 
     method read_txt: to read the specific filename
+    method iter_txt: to read the specific filename line by line
+    method load_corpus: to open the compiled corpus of the specific filename
     method add_txt_in_file: to add a line in the specific filename"""
 
     def __init__(self, filename: str):
@@ -30,6 +89,8 @@ class Editfile:
         self.data_path = os.path.join(os.path.dirname(__file__), self.filename)
 
         self._textfile = []
+        # infinitive verb -> tense verbs record, built once then kept updated
+        self._infinitive_index = {}
 
     def read_txt(self):
         """
@@ -42,29 +103,66 @@ class Editfile:
                 self._textfile = txt_file.readlines()
             return self._textfile
 
+    def iter_txt(self) -> Iterator[str]:
+        """
+        Only txt extension are readable by this function.
+        It will use the filename given during object creation.
+        Lines are read one by one, the file is never fully loaded.
+        """
+
+        if self.filename.split(".")[1] == "txt":
+            with open(self.data_path, "r", encoding="utf-8") as txt_file:
+                yield from txt_file
+
+    def load_corpus(self) -> CompiledCorpus:
+        """
+        Only txt extension are compilable by this function.
+        It will use the filename given during object creation.
+        The compiled corpus is rebuilt when the txt file content changes.
+
+        :return: pre-parsed tense verbs (CompiledCorpus)
+        """
+
+        if self.filename.split(".")[1] == "txt":
+            return CompiledCorpus(self.data_path)
+
     @classmethod
-    def __find_infinitive_verbs(cls, tense_verbs: list) -> List:
+    def __index_infinitive_verbs(cls, tense_verbs: list) -> Dict[str, str]:
         """
-        Find in the list, all infinitive verbs
+        Index all tense verbs by their infinitive verb
 
         :param tense_verbs: list of all tense verbs
 
-        :return: all infinitive verbs (list)
+        :return: infinitive verb -> tense verbs record (dict)
         """
 
-        infinitive = []
+        infinitive_index = {}
 
         for row_tense_verbs in tense_verbs:
-            infinitive.append(row_tense_verbs.split()[0])
+            split_row = row_tense_verbs.split()
+            if split_row:
+                infinitive_index[split_row[0]] = row_tense_verbs.strip()
+
+        return infinitive_index
 
-        return infinitive
+    @property
+    def infinitive_index(self) -> Dict[str, str]:
+        """Index of the known tense verbs, infinitive verb -> tense verbs record.
+        Built one time from the specific filename, then updated on each add."""
+
+        if not self._infinitive_index:
+            if not self._textfile:
+                self._textfile = self.read_txt()
+            self._infinitive_index = Editfile.__index_infinitive_verbs(self._textfile)
+
+        return self._infinitive_index
 
     @classmethod
-    def __check_data_format(cls, tense_verbs: list, data_to_check: list) -> int:
+    def __check_data_format(cls, infinitive_index: dict, data_to_check: list) -> int:
         """
         Check if the entry data respects the verben_lernen format.
 
-        :param tense_verbs: list of all tense verbs
+        :param infinitive_index: all known tense verbs, indexed by infinitive verb
         :param data_to_check: list of data to check, data should respect tense verben format:
             - Waiting format:
                 [
@@ -85,27 +183,9 @@ class Editfile:
             - The level enter is incorrect.
         """
 
-        if len(data_to_check) != 5:
-            raise ValueError(ERRORS_EDITFILE.get(0))
-
-        len_infinitive_verb = len(data_to_check[0])
-        infinive = [
-            v for i, v in enumerate(data_to_check[0]) if i >= len_infinitive_verb - 2
-        ]
-        if not (infinive == ["e", "n"]):
-            if not (infinive == ["r", "n"]):
-                raise ValueError(ERRORS_EDITFILE.get(2))
-
-        infinive_verbs = Editfile.__find_infinitive_verbs(tense_verbs)
-        if data_to_check[0] in infinive_verbs:
-            raise ValueError(ERRORS_EDITFILE.get(1))
-
-        perfect = data_to_check[3].split()
-        if not (perfect[0] in ["hat", "ist"]):
-            raise ValueError(ERRORS_EDITFILE.get(3))
-
-        if not (data_to_check[4] in ["A1", "A2", "B1", "B2", "C1", "C2"]):
-            raise ValueError(ERRORS_EDITFILE.get(4))
+        error = _find_format_error(data_to_check, infinitive_index)
+        if error is not None:
+            raise ValueError(ERRORS_EDITFILE.get(error))
 
         return 0
 
@@ -125,19 +205,111 @@ class Editfile:
                 ]
             - example: ["fahren","Fährt", "Fuhr","ist gefahren", "A2"]
         """
-        if not self._textfile:
-            self._textfile = self.read_txt()
-
         Editfile.__check_data_format(
-            self._textfile, data_to_write
+            self.infinitive_index, data_to_write
         )  # If nothing is raised, format is good, data can be written
 
         # map:convert each element from list, to str -> list object
-        str_data_to_write = "\n" + " ".join(list(map(str, data_to_write)))
+        record = " ".join(list(map(str, data_to_write)))
 
         if self.filename.split(".")[1] == "txt":
-            with open(self.data_path, "a") as txt_writable:
-                txt_writable.write(str_data_to_write)
+            with open(self.data_path, "a", encoding="utf-8") as txt_writable:
+                txt_writable.write("\n" + record)
+
+            self._infinitive_index[data_to_write[0]] = record
+
+    def add_many(
+        self,
+        data_to_write: Iterable[list],
+        processes: Optional[int] = None,
+        chunksize: int = 1000,
+    ) -> int:
+        """
+        Bulk version of add_txt_in_file. All rows are validated in one pass
+        (known verbs and verbs given several times included), then written
+        with a single atomic replace of the txt file: if one row is incorrect,
+        nothing is written.
+
+        :param data_to_write: rows to write, each row respects add_txt_in_file format
+        :param processes: (Optional) number of processes used to check the rows format,
+        only when there are more rows than chunksize.
+        Default set to None, rows are checked in the current process
+        :param chunksize: rows sent at once to each process. Default set to 1000
+
+        :return: number of written rows (int)
+
+        :raise EditfileImportError: Error raised with all the incorrect rows and their
+        ERRORS_EDITFILE message
+        """
+        rows = list(data_to_write)
+
+        if processes and len(rows) > chunksize:
+            # multiprocessing is only imported for large files
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                format_errors = list(
+                    executor.map(_find_format_error, rows, chunksize=chunksize)
+                )
+        else:
+            format_errors = [_find_format_error(row) for row in rows]
+
+        infinitive_index = self.infinitive_index
+        batch_infinitives = set()
+        errors = {}
+        for row_index, (row, error) in enumerate(zip(rows, format_errors)):
+            if error in (0, 2):
+                errors[row_index] = ERRORS_EDITFILE.get(error)
+                continue
+            # same precedence as __check_data_format: known verb before auxiliary/level
+            if row[0] in infinitive_index:
+                error = 1
+            elif row[0] in batch_infinitives:
+                error = 5
+            batch_infinitives.add(row[0])
+            if error is not None:
+                errors[row_index] = ERRORS_EDITFILE.get(error)
+
+        if errors:
+            raise EditfileImportError(errors)
+
+        records = [" ".join(list(map(str, row))) for row in rows]
+        if not records or self.filename.split(".")[1] != "txt":
+            return 0
+
+        self.__atomic_append(records)
+        for row, record in zip(rows, records):
+            self._infinitive_index[row[0]] = record
+
+        return len(records)
+
+    def __atomic_append(self, records: list) -> None:
+        """
+        Write the current txt file content followed by the records into a
+        temporary file, then replace the txt file with it.
+
+        :param records: lines to append, without line break
+        """
+
+        directory = os.path.dirname(os.path.abspath(self.data_path))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as tmp_file:
+                with open(self.data_path, "rb") as txt_file:
+                    shutil.copyfileobj(txt_file, tmp_file)
+                    is_empty = txt_file.tell() == 0
+                new_text = "\n".join(records)
+                if not is_empty:
+                    new_text = "\n" + new_text
+                tmp_file.write(new_text.encode("utf-8"))
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            shutil.copymode(self.data_path, tmp_path)
+            os.replace(tmp_path, self.data_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
 
 if __name__ == "__main__":
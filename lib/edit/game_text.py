@@ -40,6 +40,7 @@ close_app_text = "CLOSE GAME"
 score_text = "Your current score: "
 grade_text = "Your current grade: "
 remain_verbs_text = "Remain verbs: "
+remain_time_text = "Remain time: {seconds} s"
 conclusion_text = "See you next time for another VERBENLERNEN ! "
 
 
@@ -49,3 +50,6 @@ preterite_tense_text = "Preterite tense:"
 
 success_text = "Right Answer ! Bravo ! Here the complete answer:"
 failed_text = "Wrong Answer ! My Bad ! Here the complete answer:"
+
+typo_text = "Almost ! Check the spelling of your {tense}: {expected}"
+other_verb_text = "Careful ! {given} is the {tense} of {infinitive}"
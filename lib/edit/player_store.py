@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""SQLite store of players, games and answers
+
+Answers are buffered in memory and inserted in one transaction at the end
+of each game (or when the buffer is full), the database is opened in WAL
+mode so reading the history never blocks the game writes.
+Answers have their response time since schema version 2, answers saved
+before have a NULL response time.
+"""
+
+import os
+import sqlite3
+import time
+from typing import List, Mapping, Optional, Tuple
+
+from lib.constant_values import TenseKey
+
+
+_SCHEMA_VERSION = 2
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    max_game INTEGER NOT NULL,
+    score INTEGER
+);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    infinitive TEXT NOT NULL,
+    level TEXT NOT NULL,
+    is_correct INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    answered_at REAL NOT NULL,
+    response_time REAL
+);
+CREATE INDEX IF NOT EXISTS idx_games_player ON games(player_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_answers_player ON answers(player_id, answered_at);
+CREATE INDEX IF NOT EXISTS idx_answers_verb ON answers(infinitive, player_id);
+"""
+# schema version -> statements upgrading the previous version
+_UPGRADES = {
+    2: "ALTER TABLE answers ADD COLUMN response_time REAL;",
+}
+
+# statements are kept as constants: sqlite3 caches them as prepared statements
+_INSERT_PLAYER = "INSERT OR IGNORE INTO players (name, created_at) VALUES (?, ?)"
+_SELECT_PLAYER = "SELECT id FROM players WHERE name = ?"
+_INSERT_GAME = "INSERT INTO games (player_id, started_at, max_game) VALUES (?, ?, ?)"
+_FINISH_GAME = "UPDATE games SET finished_at = ?, score = ? WHERE id = ?"
+_INSERT_ANSWER = (
+    "INSERT INTO answers "
+    "(game_id, player_id, infinitive, level, is_correct, score, answered_at, "
+    "response_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# keyset pagination on (time, id): answers inserted by the same batch may
+# share their time, the id breaks the ties
+_SELECT_HISTORY = (
+    "SELECT infinitive, level, is_correct, score, answered_at, id FROM answers "
+    "WHERE player_id = ? AND (answered_at, id) < (?, ?) "
+    "ORDER BY answered_at DESC, id DESC LIMIT ?"
+)
+_SELECT_GAMES = (
+    "SELECT id, started_at, finished_at, max_game, score FROM games "
+    "WHERE player_id = ? AND (started_at, id) < (?, ?) "
+    "ORDER BY started_at DESC, id DESC LIMIT ?"
+)
+_FIRST_PAGE = (float("inf"), 0)
+_SELECT_ANSWER_TIMES = (
+    "SELECT infinitive, level, is_correct, response_time FROM answers "
+    "WHERE player_id = ?"
+)
+_SELECT_ALL_ANSWER_TIMES = (
+    "SELECT infinitive, level, is_correct, response_time FROM answers"
+)
+_SELECT_BEST_SCORE = "SELECT MAX(score) FROM games WHERE player_id = ?"
+_SELECT_VERB_STATS = (
+    "SELECT COUNT(*), COALESCE(SUM(is_correct), 0) FROM answers "
+    "WHERE infinitive = ? AND player_id = ?"
+)
+
+
+def default_player_name() -> str:
+    """Name of the session user, used when the player does not give a name"""
+    return os.environ.get("USERNAME") or os.environ.get("USER") or "player"
+
+
+class PlayerStore:
+    """Players profiles and scores history.
+
+    method start_game: to register a new game for a player
+    method record_answer: to buffer one answer of a game
+    method finish_game: to save the final score and insert the buffered answers
+    method player_history / player_games: to read a player history, newest first
+    method answer_times: to read the response times of the answers"""
+
+    def __init__(self, db_path: str, batch_size: int = 500):
+        """
+        :param db_path: Path to the SQLite database, created if missing
+        :param batch_size: (Optional) Buffered answers are inserted when this
+        number is reached, even if the game is not finished. Default set to 500
+        """
+
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._pending_answers: List[tuple] = []
+        self._player_ids = {}
+
+        self._connection = sqlite3.connect(db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._migrate()
+
+    def _migrate(self):
+        """Create the tables and indexes of the current schema version,
+        or upgrade the tables of an older version"""
+
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version < _SCHEMA_VERSION:
+            with self._connection:
+                if version == 0:
+                    self._connection.executescript(_SCHEMA)
+                else:
+                    for upgrade in range(version + 1, _SCHEMA_VERSION + 1):
+                        self._connection.executescript(_UPGRADES[upgrade])
+                self._connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def find_player_id(self, name: str) -> Optional[int]:
+        """Get the id of a player, None if unknown. Used by the read methods,
+        so reading the history of an unknown name never creates a player
+        :param name: player name"""
+
+        player_id = self._player_ids.get(name)
+        if player_id is None:
+            row = self._connection.execute(_SELECT_PLAYER, (name,)).fetchone()
+            if row is None:
+                return None
+            player_id = self._player_ids[name] = row[0]
+        return player_id
+
+    def player_id(self, name: str) -> int:
+        """Get the id of a player, the player is created if unknown
+        :param name: player name"""
+
+        player_id = self._player_ids.get(name)
+        if player_id is None:
+            with self._connection:
+                self._connection.execute(_INSERT_PLAYER, (name, time.time()))
+            player_id = self._connection.execute(_SELECT_PLAYER, (name,)).fetchone()[0]
+            self._player_ids[name] = player_id
+        return player_id
+
+    def start_game(self, name: str, max_game: int) -> int:
+        """Register a new game
+
+        :param name: player name
+        :param max_game: number of verbs to play
+
+        :return: game id (int)"""
+
+        player_id = self.player_id(name)
+        with self._connection:
+            cursor = self._connection.execute(
+                _INSERT_GAME, (player_id, time.time(), max_game)
+            )
+        return cursor.lastrowid
+
+    def record_answer(
+        self,
+        game_id: int,
+        name: str,
+        verb: Mapping,
+        is_correct: bool,
+        score: int,
+        answered_at: Optional[float] = None,
+        response_time: Optional[float] = None,
+    ):
+        """Buffer one answer, written with the next flush
+
+        :param game_id: id returned by start_game
+        :param name: player name
+        :param verb: played tense verb (Verb or dict with TenseKey keys)
+        :param is_correct: True if the answer was correct
+        :param score: player score after the answer
+        :param answered_at: (Optional) answer time. Default set to now
+        :param response_time: (Optional) seconds taken to answer.
+        Default set to None, the answer is not timed"""
+
+        self._pending_answers.append(
+            (
+                game_id,
+                self.player_id(name),
+                verb[TenseKey.INFINITIVE.value],
+                verb[TenseKey.LEVEL.value],
+                int(is_correct),
+                score,
+                answered_at if answered_at is not None else time.time(),
+                response_time,
+            )
+        )
+        if len(self._pending_answers) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Insert all buffered answers in a single transaction"""
+
+        if not self._pending_answers:
+            return
+        with self._connection:
+            self._connection.executemany(_INSERT_ANSWER, self._pending_answers)
+        self._pending_answers = []
+
+    def finish_game(self, game_id: int, score: int):
+        """Save the final score of a game and its buffered answers
+
+        :param game_id: id returned by start_game
+        :param score: final score"""
+
+        self.flush()
+        with self._connection:
+            self._connection.execute(_FINISH_GAME, (time.time(), score, game_id))
+
+    def player_history(
+        self, name: str, limit: int = 100, before: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple]:
+        """Get the answers of a player, newest first.
+        Use the (answered_at, id) of the last row as before to read the next page.
+
+        :param name: player name
+        :param limit: (Optional) maximum number of answers. Default set to 100
+        :param before: (Optional) only answers older than this (answered_at, id).
+        Default set to None, the newest answers
+
+        :return: (infinitive, level, is_correct, score, answered_at, id) rows (list)"""
+
+        self.flush()
+        player_id = self.find_player_id(name)
+        if player_id is None:
+            return []
+        return self._connection.execute(
+            _SELECT_HISTORY, (player_id, *(before or _FIRST_PAGE), limit)
+        ).fetchall()
+
+    def player_games(
+        self, name: str, limit: int = 20, before: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple]:
+        """Get the games of a player, newest first.
+        Use the (started_at, id) of the last row as before to read the next page.
+
+        :param name: player name
+        :param limit: (Optional) maximum number of games. Default set to 20
+        :param before: (Optional) only games started before this (started_at, id).
+        Default set to None, the newest games
+
+        :return: (id, started_at, finished_at, max_game, score) rows (list)"""
+
+        player_id = self.find_player_id(name)
+        if player_id is None:
+            return []
+        return self._connection.execute(
+            _SELECT_GAMES, (player_id, *(before or _FIRST_PAGE), limit)
+        ).fetchall()
+
+    def answer_times(self, name: Optional[str] = None) -> List[Tuple]:
+        """Get the answers with their response time, see lib.game.analytics
+
+        :param name: (Optional) player name. Default set to None, answers of
+        all players
+
+        :return: (infinitive, level, is_correct, response_time) rows (list),
+        response_time is None for the answers not timed"""
+
+        self.flush()
+        if name is None:
+            return self._connection.execute(_SELECT_ALL_ANSWER_TIMES).fetchall()
+        player_id = self.find_player_id(name)
+        if player_id is None:
+            return []
+        return self._connection.execute(_SELECT_ANSWER_TIMES, (player_id,)).fetchall()
+
+    def best_score(self, name: str) -> Optional[int]:
+        """Get the best finished game score of a player, None if no game finished
+        or if the player is unknown
+        :param name: player name"""
+
+        player_id = self.find_player_id(name)
+        if player_id is None:
+            return None
+        return self._connection.execute(_SELECT_BEST_SCORE, (player_id,)).fetchone()[0]
+
+    def verb_stats(self, name: str, infinitive: str) -> Tuple[int, int]:
+        """Get how many times a player answered a verb, and how many were correct
+
+        :param name: player name
+        :param infinitive: infinitive verb
+
+        :return: (answers, correct answers) (tuple)"""
+
+        self.flush()
+        player_id = self.find_player_id(name)
+        if player_id is None:
+            return (0, 0)
+        return self._connection.execute(
+            _SELECT_VERB_STATS, (infinitive, player_id)
+        ).fetchone()
+
+    def close(self):
+        """Insert buffered answers and close the database"""
+
+        self.flush()
+        self._connection.close()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Random selection helpers for tense verbs"""
+
+import math
+import random
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Iterable, List, Optional, Sequence
+
+
+def _open_unit_random(rng: random.Random) -> float:
+    """Uniform random number in the open interval (0, 1)"""
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
+
+
+def reservoir_sample(
+    iterable: Iterable, k: int, rng: Optional[random.Random] = None
+) -> List:
+    """
+    Select k items uniformly from an iterable of unknown length, in one pass
+    and with a memory of O(k) (reservoir sampling, algorithm L).
+    The selected items are shuffled, so the result has the same distribution
+    as random.sample.
+
+    :param iterable: items to select from, e.g lines of a file
+    :param k: number of items to select
+    :param rng: (Optional) random generator, seed it to get a reproducible selection
+
+    :return: k selected items (list)
+
+    :raise ValueError: Error raised when the iterable has less than k items
+    """
+
+    if k < 0:
+        raise ValueError("Sample size must be a positive number")
+    rng = rng or random.Random()
+    iterator = iter(iterable)
+
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k:
+        raise ValueError("Sample larger than population")
+
+    if k:
+        weight = math.exp(math.log(_open_unit_random(rng)) / k)
+        while True:
+            if weight < 1.0:
+                skip = math.floor(
+                    math.log(_open_unit_random(rng)) / math.log(1.0 - weight)
+                )
+            else:
+                skip = 0
+            # skip items which are not selected, without storing them
+            next_items = list(islice(iterator, skip, skip + 1))
+            if not next_items:
+                break
+            reservoir[rng.randrange(k)] = next_items[0]
+            weight *= math.exp(math.log(_open_unit_random(rng)) / k)
+
+    rng.shuffle(reservoir)
+    return reservoir
+
+
+def bucket_sample(
+    buckets: Sequence[Sequence], k: int, rng: Optional[random.Random] = None
+) -> List:
+    """
+    Select k items uniformly from the union of several buckets, without
+    merging them: only k positions are drawn, so the cost is O(k log(buckets))
+    whatever the buckets size.
+
+    :param buckets: items to select from, e.g records index of each level
+    :param k: number of items to select
+    :param rng: (Optional) random generator, seed it to get a reproducible selection
+
+    :return: k selected items (list)
+
+    :raise ValueError: Error raised when the buckets have less than k items
+    """
+
+    rng = rng or random.Random()
+    ends = list(accumulate(len(bucket) for bucket in buckets))
+    total = ends[-1] if ends else 0
+
+    selected = []
+    for position in rng.sample(range(total), k):
+        nber = bisect_right(ends, position)
+        start = ends[nber - 1] if nber else 0
+        selected.append(buckets[nber][position - start])
+    return selected
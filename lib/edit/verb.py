@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tense verb record types
+
+Verb: one tense verb, parsed one time, readable like the dictionary
+returned before by HandlerTenseVerbs.select_verb (keys from TenseKey).
+The whole corpus is stored by lib.edit.corpus.CompiledCorpus: Verb records
+are only built for the verbs of a game.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Iterator, Tuple
+
+from lib.constant_values import TenseKey
+
+
+AUXILIARIES = ("hat", "ist", "hat/ist")
+LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+_KEY_TO_SLOT = {
+    TenseKey.INFINITIVE.value: "infinitive",
+    TenseKey.THIRD_FORM.value: "third_form",
+    TenseKey.PRETERITE.value: "preterite",
+    TenseKey.PERFECT.value: "perfect",
+    TenseKey.LEVEL.value: "level",
+}
+
+
+class Verb(Mapping):
+    """Tense verb record.
+
+    e.g:
+        Verb("fahren", "fährt", "fuhr", "ist", "gefahren", "A2")
+        verb[TenseKey.PERFECT.value] == verb.perfect == "ist gefahren"
+    """
+
+    __slots__ = (
+        "infinitive",
+        "third_form",
+        "preterite",
+        "auxiliary",
+        "participle",
+        "level",
+        "perfect",
+    )
+
+    def __init__(
+        self,
+        infinitive: str,
+        third_form: str,
+        preterite: str,
+        auxiliary: str,
+        participle: str,
+        level: str,
+    ):
+        """
+        :param infinitive: Infinitive verb
+        :param third_form: Verb conjugated to 3rd singular form
+        :param preterite: Preterite verb in 3rd singular form
+        :param auxiliary: Auxiliary of the perfect tense (hat, ist)
+        :param participle: Past participle of the perfect tense
+        :param level: Verb level, A1-C2
+        """
+        self.infinitive = infinitive
+        self.third_form = third_form
+        self.preterite = preterite
+        # shared values: a single string object for all verbs
+        self.auxiliary = sys.intern(auxiliary)
+        self.participle = participle
+        self.level = sys.intern(level)
+        self.perfect = auxiliary + " " + participle
+
+    @classmethod
+    def from_fields(cls, fields: Tuple[str, ...]) -> "Verb":
+        """Create a verb from the fields of a corpus record
+        :param fields: (infinitive, third form, preterite, auxiliary, participle, level)"""
+        return cls(*fields)
+
+    def fields(self) -> Tuple[str, ...]:
+        """Get the corpus record fields of the verb"""
+        return (
+            self.infinitive,
+            self.third_form,
+            self.preterite,
+            self.auxiliary,
+            self.participle,
+            self.level,
+        )
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, _KEY_TO_SLOT[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEY_TO_SLOT)
+
+    def __len__(self) -> int:
+        return len(_KEY_TO_SLOT)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self.fields()!r}"
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Structured events of VerbenLernen, without tkinter dependency.
+
+Events are dicts with a name (EventName), a monotonic timestamp "t" and,
+for timed events, a "duration" in seconds. When events are enabled, they
+are written as JSON Lines by a background thread: emitting an event only
+puts it in a queue. When disabled (default), emit returns at once.
+    :e.g:
+        enable_events("events.jsonl")
+        start = time.monotonic()
+        ...
+        emit(EventName.PAGE_SWITCH, start, page="GamePageTemplate")
+"""
+
+import atexit
+import json
+import queue
+import threading
+import time
+from typing import Optional, TextIO
+
+from lib.constant_values import EventName
+
+
+EVENTS_FILE_ENV = "VERBENLERNEN_EVENTS"
+
+_STOP = object()
+
+
+class JsonLinesSink:
+    """Write events in a JSON Lines file from a background thread.
+
+    method put: to queue an event, never blocks
+    method close: to write the queued events and stop the thread"""
+
+    def __init__(self, path_to_file: str, batch_size: int = 256):
+        """
+        :param path_to_file: JSON Lines file, events are appended
+        :param batch_size: (Optional) Maximum events written before a flush.
+        Default set to 256
+        """
+
+        self.path_to_file = path_to_file
+        self.batch_size = batch_size
+        self.written = 0
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._file: TextIO = open(path_to_file, "a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._write_events, name="events-sink", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, event: dict):
+        """Queue an event
+        :param event: JSON serializable event"""
+        self._queue.put(event)
+
+    def _write_events(self):
+        while True:
+            events = [self._queue.get()]
+            # drain what is already queued, written with one flush
+            while len(events) < self.batch_size:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            is_stopped = events[-1] is _STOP
+            if is_stopped:
+                events.pop()
+            self._file.writelines(
+                json.dumps(event, ensure_ascii=False, default=str) + "\n"
+                for event in events
+            )
+            self._file.flush()
+            self.written += len(events)
+            if is_stopped:
+                return
+
+    def close(self):
+        """Write all queued events, then close the file"""
+
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._file.close()
+
+
+_sink: Optional[JsonLinesSink] = None
+
+
+def is_enabled() -> bool:
+    return _sink is not None
+
+
+def enable_events(path_to_file: str) -> JsonLinesSink:
+    """Write the next events in a JSON Lines file, until disable_events or exit
+
+    :param path_to_file: JSON Lines file, events are appended
+
+    :return: events sink (JsonLinesSink)"""
+
+    global _sink
+    disable_events()
+    _sink = JsonLinesSink(path_to_file)
+    # relate the monotonic timestamps of the file to the wall clock
+    _sink.put(
+        {
+            "event": EventName.EVENTS_START.value,
+            "t": time.monotonic(),
+            "time": time.time(),
+        }
+    )
+    return _sink
+
+
+def disable_events():
+    """Stop writing events, queued events are written first"""
+
+    global _sink
+    sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
+
+
+def emit(name: EventName, start: Optional[float] = None, **fields):
+    """Emit an event, nothing is done when events are disabled
+
+    :param name: event name
+    :param start: (Optional) time.monotonic at the beginning of a timed event.
+    Default set to None, the event has no duration
+    :param fields: JSON serializable values of the event"""
+
+    sink = _sink
+    if sink is None:
+        return
+    now = time.monotonic()
+    if start is None:
+        sink.put({"event": name.value, "t": now, **fields})
+    else:
+        sink.put({"event": name.value, "t": start, "duration": now - start, **fields})
+
+
+atexit.register(disable_events)
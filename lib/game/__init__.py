@@ -0,0 +1,33 @@
+"""GAME package
+
+Game logic of VerbenLernen App, independent from tkinter."""
+
+from lib.game.answers import AnswerMatcher, normalize_answer
+from lib.game.grade import get_player_grade
+from lib.game.near_miss import (
+    DeletionIndex,
+    NearMiss,
+    NearMissClassifier,
+    bounded_levenshtein,
+    describe_near_misses,
+)
+from lib.game.scheduler import ReviewState, SpacedRepetitionScheduler
+from lib.game.verbs_handler import HandlerTenseVerbs, PlayerScore
+from lib.game.session import GameSession
+
+
+__all__ = [
+    "AnswerMatcher",
+    "normalize_answer",
+    "get_player_grade",
+    "DeletionIndex",
+    "NearMiss",
+    "NearMissClassifier",
+    "bounded_levenshtein",
+    "describe_near_misses",
+    "ReviewState",
+    "SpacedRepetitionScheduler",
+    "HandlerTenseVerbs",
+    "PlayerScore",
+    "GameSession",
+]
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Response time analytics of the answers, vectorized with NumPy.
+
+Answers are stored as columns (AnswerTimes): verbs and levels are integer
+codes of their names. Timed answers are grouped with one sort of the
+response times and one stable sort of the group codes: each group is then
+a slice of sorted response times, and the percentiles of all the groups are
+read at once. Error rates are computed on all the answers, latencies only on the
+timed answers (NaN response time otherwise).
+Not imported by lib.game: NumPy is only loaded when analytics are needed.
+    :e.g:
+        answers = AnswerTimes.from_rows(player_store.answer_times())
+        latency_by_level(answers).as_dict()
+"""
+
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+AnswerRow = Tuple[str, str, int, Optional[float]]
+
+
+def _factorize(values: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """Integer code of each value, codes by order of first appearance
+
+    :return: codes (array), values of the codes (list)"""
+
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in values),
+        dtype=np.int64,
+        count=len(values),
+    )
+    return codes, list(index)
+
+
+class AnswerTimes:
+    """Answers as NumPy columns, one value by answer in each column"""
+
+    def __init__(
+        self,
+        verb_codes: np.ndarray,
+        verbs: Sequence[str],
+        level_codes: np.ndarray,
+        levels: Sequence[str],
+        is_correct: np.ndarray,
+        response_times: np.ndarray,
+    ):
+        """
+        :param verb_codes: index of the infinitive verb of each answer in verbs
+        :param verbs: infinitive verbs
+        :param level_codes: index of the level of each answer in levels
+        :param levels: verb levels
+        :param is_correct: True for the correct answers
+        :param response_times: seconds taken to answer, NaN if not timed
+        """
+
+        self.verb_codes = np.asarray(verb_codes, dtype=np.int64)
+        self.verbs = list(verbs)
+        self.level_codes = np.asarray(level_codes, dtype=np.int64)
+        self.levels = list(levels)
+        self.is_correct = np.asarray(is_correct, dtype=bool)
+        self.response_times = np.asarray(response_times, dtype=np.float64)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[AnswerRow]) -> "AnswerTimes":
+        """Build the columns from rows of PlayerStore.answer_times
+
+        :param rows: (infinitive, level, is_correct, response_time) rows,
+        response_time is None for the answers not timed
+
+        :return: answers (AnswerTimes)"""
+
+        rows = list(rows)
+        # one list by column: zip(*rows) is slow for many rows
+        infinitives, levels, is_correct, response_times = (
+            list(map(itemgetter(column), rows)) for column in range(4)
+        )
+        verb_codes, verbs = _factorize(infinitives)
+        level_codes, levels = _factorize(levels)
+        return cls(
+            verb_codes,
+            verbs,
+            level_codes,
+            levels,
+            np.array(is_correct, dtype=bool),
+            # None is converted to NaN
+            np.array(response_times, dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.response_times)
+
+
+@dataclass
+class LatencyTable:
+    """Latencies and error rate of groups of answers, one row by group"""
+
+    names: List[str]
+    answers: np.ndarray  # answers of each group
+    timed_answers: np.ndarray  # answers with a response time
+    error_rates: np.ndarray  # wrong answers / answers
+    percentiles: Tuple[float, ...]
+    latencies: np.ndarray  # (group, percentile) response times, NaN if not timed
+
+    def as_dict(self) -> Dict[str, dict]:
+        """:return: group name -> answers, timed answers, error rate and
+        p<percentile> latencies in seconds (dict)"""
+
+        table = {}
+        for row, name in enumerate(self.names):
+            table[name] = {
+                "answers": int(self.answers[row]),
+                "timed_answers": int(self.timed_answers[row]),
+                "error_rate": float(self.error_rates[row]),
+            }
+            for column, percentile in enumerate(self.percentiles):
+                table[name][f"p{percentile:g}"] = float(self.latencies[row, column])
+        return table
+
+
+def group_latencies(
+    codes: np.ndarray,
+    names: Sequence[str],
+    is_correct: np.ndarray,
+    response_times: np.ndarray,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> LatencyTable:
+    """Latency percentiles and error rate of each group of answers.
+    Percentiles are interpolated as numpy.percentile does by default.
+
+    :param codes: index of the group of each answer in names
+    :param names: group names
+    :param is_correct: True for the correct answers
+    :param response_times: seconds taken to answer, NaN if not timed
+    :param percentiles: (Optional) percentiles between 0 and 100.
+    Default set to DEFAULT_PERCENTILES
+
+    :return: one row by group name (LatencyTable)"""
+
+    groups = len(names)
+    quantiles = np.asarray(percentiles, dtype=np.float64) / 100
+    answers = np.bincount(codes, minlength=groups)
+    correct_answers = np.bincount(codes, weights=is_correct, minlength=groups)
+    # latencies of the timed answers only: NaN slow down the sort
+    is_timed = ~np.isnan(response_times)
+    timed_codes = codes[is_timed]
+    timed_times = response_times[is_timed]
+    timed_answers = np.bincount(timed_codes, minlength=groups)
+
+    # sorted by response time, then by group: each group is a sorted slice
+    order = np.argsort(timed_times)
+    sorted_codes = timed_codes[order]
+    if groups <= 1 << 16:
+        # 16 bits codes are sorted with a radix sort, 5 times faster
+        sorted_codes = sorted_codes.astype(np.uint16)
+    order = order[np.argsort(sorted_codes, kind="stable")]
+    sorted_times = timed_times[order]
+
+    starts = np.cumsum(timed_answers) - timed_answers
+    positions = np.maximum(timed_answers - 1, 0)[:, None] * quantiles[None, :]
+    fractions = positions - np.floor(positions)
+    lower = starts[:, None] + np.floor(positions).astype(np.int64)
+    upper = starts[:, None] + np.ceil(positions).astype(np.int64)
+
+    latencies = np.full((groups, len(quantiles)), np.nan)
+    is_group_timed = timed_answers > 0
+    lower_times = sorted_times[lower[is_group_timed]]
+    upper_times = sorted_times[upper[is_group_timed]]
+    latencies[is_group_timed] = (
+        lower_times + (upper_times - lower_times) * fractions[is_group_timed]
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        error_rates = 1 - correct_answers / answers
+    return LatencyTable(
+        list(names),
+        answers,
+        timed_answers,
+        error_rates,
+        tuple(percentiles),
+        latencies,
+    )
+
+
+def latency_by_verb(
+    answers: AnswerTimes, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> LatencyTable:
+    """Latency percentiles and error rate of each infinitive verb
+
+    :param answers: answers to aggregate
+    :param percentiles: (Optional) percentiles between 0 and 100.
+    Default set to DEFAULT_PERCENTILES"""
+
+    return group_latencies(
+        answers.verb_codes,
+        answers.verbs,
+        answers.is_correct,
+        answers.response_times,
+        percentiles,
+    )
+
+
+def latency_by_level(
+    answers: AnswerTimes, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> LatencyTable:
+    """Latency percentiles and error rate of each verb level
+
+    :param answers: answers to aggregate
+    :param percentiles: (Optional) percentiles between 0 and 100.
+    Default set to DEFAULT_PERCENTILES"""
+
+    return group_latencies(
+        answers.level_codes,
+        answers.levels,
+        answers.is_correct,
+        answers.response_times,
+        percentiles,
+    )
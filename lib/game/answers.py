@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Player answers matching
+
+Every accepted form of the tense verbs (auxiliary variants, umlaut
+spellings, ...) is normalized one time when the matcher is built, so
+checking an answer only normalizes the player entry then looks it up
+in a set.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple
+
+from lib.constant_values import AnswerStrictness, TenseKey
+from lib.edit.verb import Verb
+
+
+_SPACES = re.compile(r"\s+")
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_ALTERNATIVES_SEPARATOR = "/"
+
+
+def normalize_answer(answer: str, strictness: AnswerStrictness) -> str:
+    """Get the key of an answer for a strictness level
+
+    :param answer: tense verb form, e.g "ist  Gefahren"
+    :param strictness: how close the answer should be
+
+    :return: normalized answer, e.g "ist gefahren" (str)"""
+
+    if strictness is AnswerStrictness.EXACT:
+        return answer
+    answer = _SPACES.sub(" ", answer.strip()).lower()
+    if strictness is AnswerStrictness.LENIENT:
+        answer = answer.translate(_UMLAUTS)
+    return answer
+
+
+class AnswerMatcher:
+    """Accepted answers of the tense verbs, indexed by infinitive.
+
+    method is_correct: to check a player answer against a tense verb"""
+
+    def __init__(
+        self,
+        records: Iterable[Tuple[str, ...]] = (),
+        strictness: AnswerStrictness = AnswerStrictness.NORMAL,
+    ):
+        """
+        :param records: (Optional) corpus records,
+        (infinitive, third form, preterite, auxiliary, participle, level)
+        :param strictness: (Optional) how close the answers should be.
+        Default set to AnswerStrictness.NORMAL
+        """
+
+        self.strictness = AnswerStrictness(strictness)
+        self._accepted: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        for record in records:
+            self._accepted[record[0]] = self._accepted_forms(record)
+
+    def __len__(self) -> int:
+        return len(self._accepted)
+
+    def _accepted_forms(
+        self, fields: Tuple[str, ...]
+    ) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Normalized accepted perfect and preterite forms of a verb
+
+        :param fields: corpus record fields of the verb
+
+        :return: perfect keys, preterite keys (tuple)"""
+
+        _, _, preterite, auxiliary, participle, _ = fields
+        if self.strictness is AnswerStrictness.EXACT:
+            return frozenset((auxiliary + " " + participle,)), frozenset((preterite,))
+
+        # "hat/ist": both auxiliaries, or the record as written
+        auxiliaries = auxiliary.split(_ALTERNATIVES_SEPARATOR) + [auxiliary]
+        participles = participle.split(_ALTERNATIVES_SEPARATOR)
+        perfects = [aux + " " + form for aux in auxiliaries for form in participles]
+        if self.strictness is AnswerStrictness.LENIENT:
+            perfects.extend(participles)
+
+        return (
+            frozenset(normalize_answer(form, self.strictness) for form in perfects),
+            frozenset(
+                normalize_answer(form, self.strictness)
+                for form in preterite.split(_ALTERNATIVES_SEPARATOR)
+            ),
+        )
+
+    def accepted_forms(self, verb: Mapping) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Get the normalized accepted forms of a verb
+
+        :param verb: tense verb (Verb or dict with TenseKey keys)
+
+        :return: perfect keys, preterite keys (tuple)"""
+
+        accepted = self._accepted.get(verb[TenseKey.INFINITIVE.value])
+        if accepted is None:
+            # verb out of the corpus, e.g streamed games: indexed on first use
+            if isinstance(verb, Verb):
+                fields = verb.fields()
+            else:
+                auxiliary, _, participle = verb[TenseKey.PERFECT.value].partition(" ")
+                fields = (
+                    verb[TenseKey.INFINITIVE.value],
+                    verb[TenseKey.THIRD_FORM.value],
+                    verb[TenseKey.PRETERITE.value],
+                    auxiliary,
+                    participle,
+                    verb[TenseKey.LEVEL.value],
+                )
+            accepted = self._accepted_forms(fields)
+            self._accepted[fields[0]] = accepted
+        return accepted
+
+    def is_correct(self, verb: Mapping, perfect: str, preterite: str) -> bool:
+        """Check a player answer
+
+        :param verb: tense verb to find (Verb or dict with TenseKey keys)
+        :param perfect: perfect tense given by the player
+        :param preterite: preterite tense given by the player
+
+        :return: True if both tenses are accepted (bool)"""
+
+        perfect_keys, preterite_keys = self.accepted_forms(verb)
+        return (
+            normalize_answer(perfect, self.strictness) in perfect_keys
+            and normalize_answer(preterite, self.strictness) in preterite_keys
+        )
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Player grade according to the game score.
+
+"""
+
+from lib.constant_values import GradePlayer
+
+
+def get_player_grade(score: int) -> GradePlayer:
+    """
+    Get the grade according to the score
+        :e.g:
+            CREATOR:20,
+            MASTER:>20-18>=,
+            EXPERT:>18-16>=,
+            ELITE:>16-14>=,
+            DISCIPLE:>14-10>=,
+            OUTSIDER:>10-5>=,
+            ALIEN:>5-0>="""
+
+    if score == 0 or (score > 0 and score < 5):
+        return GradePlayer.ALIEN
+
+    elif score == 5 or (score > 5 and score < 10):
+        return GradePlayer.OUTSIDER
+
+    elif score == 10 or (score > 10 and score < 14):
+        return GradePlayer.DISCIPLE
+
+    elif score == 14 or (score > 14 and score < 16):
+        return GradePlayer.ELITE
+
+    elif score == 16 or (score > 16 and score < 18):
+        return GradePlayer.EXPERT
+
+    elif score == 18 or (score > 18 and score < 20):
+        return GradePlayer.MASTER
+
+    else:
+        return GradePlayer.CREATOR
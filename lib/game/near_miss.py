@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""Near-miss classification of wrong answers
+
+A wrong tense is either:
+    - a typo: a few edits (Levenshtein distance) from the right tense
+    - the tense of another verb: found in a dict of all the corpus forms, or
+      a few edits from one of them with a symmetric delete index
+    - simply wrong
+Answers are correct if the answer matcher of the game accepts them. Distances
+are computed on the lenient keys of lib.game.answers: an answer only rejected
+for its case, spaces or umlaut spellings is a typo.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from lib.constant_values import AnswerMistake, AnswerStrictness, TenseKey
+from lib.edit.game_text import other_verb_text, typo_text
+from lib.edit.verb import AUXILIARIES
+from lib.game.answers import AnswerMatcher, normalize_answer
+
+
+_AUXILIARY_PREFIXES = tuple(auxiliary + " " for auxiliary in AUXILIARIES)
+_TENSE_NAMES = {
+    TenseKey.PERFECT.value: "perfect tense",
+    TenseKey.PRETERITE.value: "preterite tense",
+}
+
+
+def _pattern_bits(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character of the pattern"""
+    char_bits: Dict[str, int] = {}
+    for position, char in enumerate(pattern):
+        char_bits[char] = char_bits.get(char, 0) | (1 << position)
+    return char_bits
+
+
+def _myers_distance(
+    char_bits: Dict[str, int], length: int, text: str, max_distance: int
+) -> int:
+    """Levenshtein distance between a non empty pattern and a text, with the
+    bit-parallel algorithm of Myers: each column of the distance matrix is
+    computed with a few integer operations.
+
+    :param char_bits: see _pattern_bits
+    :param length: pattern length
+    :param text: text compared to the pattern
+    :param max_distance: the computation stops above this distance
+
+    :return: distance, or max_distance + 1 if greater than max_distance (int)"""
+
+    all_bits = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    # vertical deltas +1 / -1 of the current column, one bit by pattern character
+    vertical_plus = all_bits
+    vertical_minus = 0
+    distance = length
+    remaining = len(text)
+
+    for char in text:
+        equal = char_bits.get(char, 0)
+        vertical = equal | vertical_minus
+        diagonal = (((equal & vertical_plus) + vertical_plus) ^ vertical_plus) | equal
+        horizontal_plus = vertical_minus | (all_bits & ~(diagonal | vertical_plus))
+        horizontal_minus = vertical_plus & diagonal
+        if horizontal_plus & last_bit:
+            distance += 1
+        elif horizontal_minus & last_bit:
+            distance -= 1
+        remaining -= 1
+        # the distance decreases at most by one for each remaining character
+        if distance - remaining > max_distance:
+            return max_distance + 1
+        horizontal_plus = ((horizontal_plus << 1) | 1) & all_bits
+        horizontal_minus = (horizontal_minus << 1) & all_bits
+        vertical_plus = horizontal_minus | (all_bits & ~(vertical | horizontal_plus))
+        vertical_minus = horizontal_plus & vertical
+
+    return min(distance, max_distance + 1)
+
+
+def bounded_levenshtein(
+    first: str, second: str, max_distance: Optional[int] = None
+) -> int:
+    """
+    Levenshtein distance between two strings. With max_distance, the
+    computation stops as soon as the distance can not be lower than
+    max_distance + 1.
+
+    :param first: first string
+    :param second: second string
+    :param max_distance: (Optional) distance above which the exact value is useless.
+    Default set to None, the exact distance is always computed
+
+    :return: distance, or max_distance + 1 if greater than max_distance (int)
+    """
+
+    if first == second:
+        return 0
+    if max_distance is None:
+        max_distance = max(len(first), len(second))
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+    if not first or not second:
+        return max(len(first), len(second))
+    return _myers_distance(_pattern_bits(first), len(first), second, max_distance)
+
+
+def _deletions(word: str, max_deletions: int) -> Set[str]:
+    """The word and all its variants with at most max_deletions characters removed"""
+    variants = {word}
+    last_variants = variants
+    for _ in range(max_deletions):
+        last_variants = {
+            variant[:position] + variant[position + 1 :]
+            for variant in last_variants
+            for position in range(len(variant))
+        }
+        variants |= last_variants
+    return variants
+
+
+class DeletionIndex:
+    """Symmetric delete index of strings for small Levenshtein distances.
+
+    Two words at most max_distance edits apart share a variant with at most
+    max_distance characters removed from each word. Every deletion variant of
+    the indexed words is a dict key: a search only looks up the variants of
+    the query, then checks the few candidates with bounded_levenshtein.
+
+    method add: to add a word and a value attached to it
+    method search: to get the words close to a query"""
+
+    __slots__ = ("max_distance", "_variants", "_values")
+
+    def __init__(self, words: Iterable[Tuple[str, object]] = (), max_distance: int = 1):
+        """
+        :param words: (Optional) (word, value) couples to add
+        :param max_distance: (Optional) largest search radius, the index size
+        grows quickly with it. Default set to 1
+        """
+        self.max_distance = max_distance
+        # deletion variant -> indexed word, or list of words: most variants
+        # belong to one word, no list is allocated for them
+        self._variants: Dict[str, Union[str, List[str]]] = {}
+        # word -> values
+        self._values: Dict[str, list] = {}
+        for word, value in words:
+            self.add(word, value)
+
+    def __len__(self) -> int:
+        """Number of distinct words"""
+        return len(self._values)
+
+    def add(self, word: str, value: object):
+        """Add a word, values of the same word are grouped
+        :param word: word to index
+        :param value: value attached to the word, e.g the verb infinitive"""
+
+        values = self._values.get(word)
+        if values is not None:
+            values.append(value)
+            return
+        self._values[word] = [value]
+        variants = self._variants
+        for variant in _deletions(word, self.max_distance):
+            words = variants.get(variant)
+            if words is None:
+                variants[variant] = word
+            elif isinstance(words, str):
+                variants[variant] = [words, word]
+            else:
+                words.append(word)
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str, list]]:
+        """Get the words at most at max_distance from word, closest first
+
+        :param word: query word
+        :param max_distance: search radius, at most the max_distance of the index
+
+        :return: (distance, word, values) (list)
+        :raise ValueError: if max_distance is above the max_distance of the index"""
+
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"search radius {max_distance} above the index radius "
+                f"{self.max_distance}"
+            )
+        candidates = set()
+        for variant in _deletions(word, max_distance):
+            words = self._variants.get(variant)
+            if words is None:
+                continue
+            if isinstance(words, str):
+                candidates.add(words)
+            else:
+                candidates.update(words)
+
+        found = []
+        for candidate in candidates:
+            distance = bounded_levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate, self._values[candidate]))
+        found.sort(key=lambda result: result[:2])
+        return found
+
+
+@dataclass
+class NearMiss:
+    """Classification of one tense given by the player"""
+
+    tense: str  # TenseKey value
+    mistake: AnswerMistake
+    given: str
+    expected: str
+    distance: int = field(default=0)
+    other_infinitive: Optional[str] = field(default=None)
+
+
+class NearMissClassifier:
+    """Tell typos from tenses of other verbs and wrong answers.
+
+    method classify: to classify the perfect and preterite given by the player"""
+
+    def __init__(
+        self,
+        records: Iterable[Tuple[str, ...]] = (),
+        max_typo_distance: int = 2,
+        max_other_verb_distance: int = 1,
+        answer_matcher: Optional[AnswerMatcher] = None,
+    ):
+        """
+        :param records: (Optional) corpus records,
+        (infinitive, third form, preterite, auxiliary, participle, level)
+        :param max_typo_distance: (Optional) maximum edits of a typo, reduced for
+        short tenses (one edit for 3 letters). Default set to 2
+        :param max_other_verb_distance: (Optional) maximum edits between the answer
+        and the tense of another verb. Default set to 1
+        :param answer_matcher: (Optional) matcher of the game, answers it accepts
+        are correct. Default set to None, lenient answers are correct
+        """
+
+        self.max_typo_distance = max_typo_distance
+        self.max_other_verb_distance = max_other_verb_distance
+        self._lenient_matcher = AnswerMatcher(strictness=AnswerStrictness.LENIENT)
+        # not "answer_matcher or": a matcher of no record has a length of 0
+        self._matcher = (
+            self._lenient_matcher if answer_matcher is None else answer_matcher
+        )
+        # normalized form -> infinitives, and deletion index of the same forms
+        self._forms: Dict[str, Dict[str, List[str]]] = {
+            TenseKey.PRETERITE.value: {},
+            TenseKey.PERFECT.value: {},
+        }
+        self._deletion_indexes: Dict[str, DeletionIndex] = {
+            TenseKey.PRETERITE.value: DeletionIndex(
+                max_distance=max_other_verb_distance
+            ),
+            TenseKey.PERFECT.value: DeletionIndex(max_distance=max_other_verb_distance),
+        }
+
+        for infinitive, _, preterite, _, participle, _ in records:
+            self._index(TenseKey.PRETERITE.value, preterite, infinitive)
+            self._index(TenseKey.PERFECT.value, participle, infinitive)
+
+    def _index(self, tense: str, form: str, infinitive: str):
+        key = normalize_answer(form, AnswerStrictness.LENIENT)
+        infinitives = self._forms[tense].get(key)
+        if infinitives is None:
+            self._forms[tense][key] = [infinitive]
+            self._deletion_indexes[tense].add(key, infinitive)
+        elif infinitive not in infinitives:
+            infinitives.append(infinitive)
+
+    @staticmethod
+    def _without_auxiliary(perfect_key: str) -> str:
+        """Participle of a normalized perfect tense"""
+        for prefix in _AUXILIARY_PREFIXES:
+            if perfect_key.startswith(prefix):
+                return perfect_key[len(prefix) :]
+        return perfect_key
+
+    def _classify_tense(
+        self,
+        verb: Mapping,
+        tense: str,
+        given: str,
+        correct_keys: Iterable[str],
+        accepted_keys: Iterable[str],
+    ) -> NearMiss:
+        expected = verb[tense]
+        if normalize_answer(given, self._matcher.strictness) in correct_keys:
+            return NearMiss(tense, AnswerMistake.CORRECT, given, expected)
+        key = normalize_answer(given, AnswerStrictness.LENIENT)
+        if not key:
+            return NearMiss(tense, AnswerMistake.WRONG, given, expected)
+
+        if tense == TenseKey.PERFECT.value:
+            # the auxiliary is optional in lenient keys: compare the participles
+            key = self._without_auxiliary(key)
+            accepted_keys = {self._without_auxiliary(form) for form in accepted_keys}
+
+        # one edit allowed for 3 letters, so "tat" -> "hat" is not a typo
+        max_distance = min(self.max_typo_distance, max(1, len(key) // 3))
+        distance = min(
+            bounded_levenshtein(key, accepted_key, max_distance)
+            for accepted_key in accepted_keys
+        )
+        if distance <= max_distance:
+            return NearMiss(tense, AnswerMistake.TYPO, given, expected, distance)
+
+        infinitive = verb[TenseKey.INFINITIVE.value]
+        # exact form of another verb first: a dict lookup, the deletion index
+        # is only searched for misspelled forms
+        matches = [(0, key)] if key in self._forms[tense] else []
+        if not matches:
+            matches = [
+                (distance, form)
+                for distance, form, _ in self._deletion_indexes[tense].search(
+                    key, self.max_other_verb_distance
+                )
+            ]
+        for distance, form in matches:
+            others = [
+                other for other in self._forms[tense][form] if other != infinitive
+            ]
+            if others:
+                return NearMiss(
+                    tense,
+                    AnswerMistake.OTHER_VERB,
+                    given,
+                    expected,
+                    distance,
+                    others[0],
+                )
+
+        return NearMiss(tense, AnswerMistake.WRONG, given, expected)
+
+    def classify(self, verb: Mapping, perfect: str, preterite: str) -> List[NearMiss]:
+        """Classify the answer of the player
+
+        :param verb: tense verb to find (Verb or dict with TenseKey keys)
+        :param perfect: perfect tense given by the player
+        :param preterite: preterite tense given by the player
+
+        :return: perfect and preterite classification (list)"""
+
+        perfect_keys, preterite_keys = self._matcher.accepted_forms(verb)
+        lenient_keys = self._lenient_matcher.accepted_forms(verb)
+        return [
+            self._classify_tense(
+                verb,
+                TenseKey.PERFECT.value,
+                perfect,
+                perfect_keys,
+                lenient_keys[0],
+            ),
+            self._classify_tense(
+                verb,
+                TenseKey.PRETERITE.value,
+                preterite,
+                preterite_keys,
+                lenient_keys[1],
+            ),
+        ]
+
+
+def describe_near_misses(near_misses: Iterable[NearMiss]) -> str:
+    """Text telling the player about typos and tenses of other verbs
+
+    :param near_misses: see NearMissClassifier.classify
+
+    :return: one line by near miss, empty if there is none (str)"""
+
+    lines = []
+    for near_miss in near_misses:
+        tense = _TENSE_NAMES[near_miss.tense]
+        if near_miss.mistake is AnswerMistake.TYPO:
+            lines.append(typo_text.format(tense=tense, expected=near_miss.expected))
+        elif near_miss.mistake is AnswerMistake.OTHER_VERB:
+            lines.append(
+                other_verb_text.format(
+                    given=near_miss.given,
+                    tense=tense,
+                    infinitive=near_miss.other_infinitive,
+                )
+            )
+    return "\n".join(lines)
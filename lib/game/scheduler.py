@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Spaced repetition scheduler (SM-2) for tense verbs
+
+Each played verb gets a review state: due time, interval, ease factor and
+number of successful repetitions. Verbs are kept in a heap ordered by due
+time, so selecting the next verb to review costs O(log n) whatever the
+size of the history. Heap entries are never removed when a verb is
+rescheduled: outdated entries are skipped when they reach the top (lazy
+deletion), and the heap is rebuilt when they become too many.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+SECONDS_PER_DAY = 86400.0
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+# answer quality, from 0 (no answer) to 5 (perfect answer)
+QUALITY_SUCCESS = 4
+QUALITY_FAILURE = 1
+
+
+@dataclass
+class ReviewState:
+    """Review state of one tense verb"""
+
+    fields: Tuple[str, ...]
+    due: float = field(default=0.0)
+    interval: float = field(default=0.0)  # days
+    ease: float = field(default=DEFAULT_EASE)
+    repetitions: int = field(default=0)
+    version: int = field(default=0)  # heap entry matching this state
+
+    @property
+    def infinitive(self) -> str:
+        return self.fields[0]
+
+
+class SpacedRepetitionScheduler:
+    """SM-2 scheduler of tense verbs, persisted into a json file.
+
+    method select: to get the verbs which should be reviewed first
+    method review: to reschedule a verb after an answer
+    method save: to write the review states into the json file"""
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param state_path: (Optional) json file where the review states are persisted.
+        Default set to None, states are only kept in memory
+        :param clock: (Optional) function giving the current time in seconds.
+        Default set to time.time
+        """
+
+        self.state_path = state_path
+        self._clock = clock
+        self._states: Dict[str, ReviewState] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._version = 0
+
+        if self.state_path and os.path.exists(self.state_path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, infinitive: str) -> bool:
+        return infinitive in self._states
+
+    def get_state(self, infinitive: str) -> Optional[ReviewState]:
+        """Get the review state of a verb, None if never played
+        :param infinitive: infinitive verb"""
+        return self._states.get(infinitive)
+
+    def _push(self, state: ReviewState):
+        """Add a heap entry for the state, previous entries become outdated"""
+
+        self._version += 1
+        state.version = self._version
+        heapq.heappush(self._heap, (state.due, state.version, state.infinitive))
+
+        # too many outdated entries: rebuild the heap, O(n) amortized over n pushes
+        if len(self._heap) > 2 * len(self._states) + 64:
+            self._heap = [
+                (state.due, state.version, state.infinitive)
+                for state in self._states.values()
+            ]
+            heapq.heapify(self._heap)
+
+    def _is_current(self, entry: Tuple[float, int, str]) -> bool:
+        """Check if the heap entry matches the verb review state"""
+        state = self._states.get(entry[2])
+        return state is not None and state.version == entry[1]
+
+    def select(
+        self,
+        count: int,
+        only_due: bool = True,
+        predicate: Optional[Callable[[Tuple[str, ...]], bool]] = None,
+    ) -> List[Tuple[str, ...]]:
+        """
+        Get the verbs to review first, ordered by due time.
+        Selected verbs stay scheduled until they are reviewed.
+
+        :param count: maximum number of verbs to select
+        :param only_due: (Optional) only select verbs which due time is passed.
+        Default set to True
+        :param predicate: (Optional) only select verbs which corpus record fields
+        match, e.g a level filter. Default set to None, all verbs can be selected
+
+        :return: corpus record fields of the selected verbs (list)
+        """
+
+        now = self._clock()
+        selected = []
+        skipped = []  # due verbs not matching the predicate, put back afterwards
+        while self._heap and len(selected) < count:
+            entry = self._heap[0]
+            if not self._is_current(entry):
+                heapq.heappop(self._heap)
+                continue
+            if only_due and entry[0] > now:
+                break
+            entry = heapq.heappop(self._heap)
+            if predicate is None or predicate(self._states[entry[2]].fields):
+                selected.append(entry)
+            else:
+                skipped.append(entry)
+
+        for entry in selected + skipped:
+            heapq.heappush(self._heap, entry)
+
+        return [self._states[entry[2]].fields for entry in selected]
+
+    def review(self, fields: Tuple[str, ...], quality: int) -> ReviewState:
+        """
+        Reschedule a verb according to the quality of the answer (SM-2).
+
+        :param fields: corpus record fields of the verb
+        :param quality: answer quality from 0 to 5, below 3 the answer is wrong.
+        See QUALITY_SUCCESS and QUALITY_FAILURE
+
+        :return: new review state of the verb (ReviewState)
+
+        :raise ValueError: Error raised when quality is out of range
+        """
+
+        if not 0 <= quality <= 5:
+            raise ValueError(f"Review quality should be between 0 and 5, not {quality}")
+
+        fields = tuple(fields)
+        state = self._states.get(fields[0])
+        if state is None:
+            state = ReviewState(fields)
+            self._states[fields[0]] = state
+        state.fields = fields
+
+        if quality < 3:
+            state.repetitions = 0
+            state.interval = 1.0
+        else:
+            state.repetitions += 1
+            if state.repetitions == 1:
+                state.interval = 1.0
+            elif state.repetitions == 2:
+                state.interval = 6.0
+            else:
+                state.interval = round(state.interval * state.ease, 2)
+
+        state.ease = max(
+            MIN_EASE,
+            state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+        )
+        state.due = self._clock() + state.interval * SECONDS_PER_DAY
+        self._push(state)
+
+        return state
+
+    def load(self):
+        """Read the review states from the json file"""
+
+        with open(self.state_path, "r", encoding="utf-8") as state_file:
+            saved_states = json.load(state_file)
+
+        self._states = {}
+        for fields, due, interval, ease, repetitions in saved_states:
+            state = ReviewState(tuple(fields), due, interval, ease, repetitions)
+            self._states[state.infinitive] = state
+        self._heap = []
+        for state in self._states.values():
+            self._version += 1
+            state.version = self._version
+            self._heap.append((state.due, state.version, state.infinitive))
+        heapq.heapify(self._heap)
+
+    def save(self):
+        """Write the review states into the json file, with an atomic replace"""
+
+        if not self.state_path:
+            return
+
+        saved_states = [
+            [state.fields, state.due, state.interval, state.ease, state.repetitions]
+            for state in self._states.values()
+        ]
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as tmp_file:
+                json.dump(saved_states, tmp_file, ensure_ascii=False)
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
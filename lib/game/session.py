@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Headless game engine: the whole game flow without any display.
+
+A session plays max_game tense verbs:
+    - current_verb: verb to find
+    - submit: check the player answer, update the score, time the answer
+    - next_verb: go to the next verb, until the session is finished
+    - finish: save the reviews and the final score
+VerbenLernenApp drives a GameSession from its pages.
+"""
+
+import time
+from typing import Callable, List, Mapping, Optional
+
+from lib.constant_values import EventName, GradePlayer, TenseKey
+from lib.edit.player_store import PlayerStore
+from lib.events import emit
+from lib.game.answers import AnswerMatcher
+from lib.game.grade import get_player_grade
+from lib.game.near_miss import NearMiss, NearMissClassifier
+from lib.game.verbs_handler import HandlerTenseVerbs, PlayerScore
+
+
+class GameSession:
+    """One game of VerbenLernen, independent from tkinter"""
+
+    def __init__(
+        self,
+        verbs_handler: HandlerTenseVerbs,
+        player_store: Optional[PlayerStore] = None,
+        player_name: Optional[str] = None,
+        answer_matcher: Optional[AnswerMatcher] = None,
+        near_miss_classifier: Optional[NearMissClassifier] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param verbs_handler: Tense verbs of the game
+        :param player_store: (Optional) Store where answers and final score are saved
+        :param player_name: (Optional) Player name used by the player store
+        :param answer_matcher: (Optional) Accepted answers of the verbs.
+        Default set to None, answers should be exactly the tense verbs
+        :param near_miss_classifier: (Optional) Classify the mistakes of wrong answers.
+        Default set to None, mistakes are not classified
+        :param clock: (Optional) clock of the response times, in seconds.
+        Default set to time.monotonic
+        """
+
+        self.verbs_handler = verbs_handler
+        self.max_game = verbs_handler.max_game
+        self.player_store = player_store
+        self.player_name = player_name
+        self.answer_matcher = answer_matcher
+        self.near_miss_classifier = near_miss_classifier
+        self.player_score = PlayerScore(score=0, max_score=self.max_game)
+        self.last_answer_correct: Optional[bool] = None
+        self.last_near_misses: List[NearMiss] = []
+        self.last_response_time: Optional[float] = None
+        self._clock = clock
+        self._is_answered = False
+        self._is_finished = False
+
+        self._game_id = None
+        if self.player_store is not None:
+            self._game_id = self.player_store.start_game(
+                self.player_name, self.max_game
+            )
+
+        self.current_verb: Mapping = self.verbs_handler.select_verb()
+        self._verb_shown_at = self._clock()
+
+    @property
+    def score(self) -> int:
+        return self.player_score.current_score
+
+    @property
+    def remaining_verbs(self) -> int:
+        """Number of verbs left after the current one"""
+        return len(self.verbs_handler._not_used_verbs)
+
+    @property
+    def played_verbs(self) -> int:
+        return len(self.verbs_handler._used_verbs)
+
+    @property
+    def is_finished(self) -> bool:
+        """True when all verbs have been answered"""
+        return self._is_finished or not self.current_verb
+
+    @property
+    def grade(self) -> GradePlayer:
+        return get_player_grade(self.score)
+
+    def start_answer_clock(self):
+        """Start the response time of the current verb from now, call it when
+        the verb is displayed. Otherwise it starts when the verb is selected"""
+        self._verb_shown_at = self._clock()
+
+    def is_correct(self, perfect: str, preterite: str) -> bool:
+        """Check a player answer against the current verb, without updating the game
+
+        :param perfect: perfect tense given by the player
+        :param preterite: preterite tense given by the player"""
+
+        if self.answer_matcher is not None:
+            return self.answer_matcher.is_correct(self.current_verb, perfect, preterite)
+        return (
+            perfect == self.current_verb[TenseKey.PERFECT.value]
+            and preterite == self.current_verb[TenseKey.PRETERITE.value]
+        )
+
+    def submit(self, perfect: str, preterite: str) -> bool:
+        """Answer the current verb: update the score, the reviews and the store.
+        Only the first answer of each verb is counted, and timed.
+
+        :param perfect: perfect tense given by the player
+        :param preterite: preterite tense given by the player
+
+        :return: True if the answer is correct (bool)"""
+
+        if self.is_finished or self._is_answered:
+            return bool(self.last_answer_correct)
+
+        start = time.monotonic()
+        response_time = self._clock() - self._verb_shown_at
+        is_correct = self.is_correct(perfect, preterite)
+        self._is_answered = True
+        self.last_answer_correct = is_correct
+        self.last_response_time = response_time
+
+        if is_correct:
+            self.player_score.current_score = self.player_score.current_score + 1
+        elif self.near_miss_classifier is not None:
+            self.last_near_misses = self.near_miss_classifier.classify(
+                self.current_verb, perfect, preterite
+            )
+        self.verbs_handler.record_answer(self.current_verb, is_correct)
+        if self.player_store is not None:
+            self.player_store.record_answer(
+                self._game_id,
+                self.player_name,
+                self.current_verb,
+                is_correct,
+                self.score,
+                response_time=response_time,
+            )
+
+        emit(
+            EventName.ANSWER_SUBMIT,
+            start,
+            infinitive=self.current_verb[TenseKey.INFINITIVE.value],
+            correct=is_correct,
+            response_time=response_time,
+            mistakes=[near_miss.mistake.value for near_miss in self.last_near_misses],
+        )
+        return is_correct
+
+    def next_verb(self) -> Mapping:
+        """Go to the next verb. The session is finished when no verb is left.
+
+        :return: next verb to find, empty dict when the session is finished"""
+
+        if len(self.verbs_handler._used_verbs) == self.max_game:
+            self.current_verb = dict()
+        else:
+            self.current_verb = self.verbs_handler.select_verb()
+        self._verb_shown_at = self._clock()
+        self._is_answered = False
+        self.last_answer_correct = None
+        self.last_near_misses = []
+        self.last_response_time = None
+
+        if self.is_finished:
+            self.finish()
+        return self.current_verb
+
+    def finish(self):
+        """Save the reviews and the final score, only done one time"""
+
+        if self._is_finished:
+            return
+        self._is_finished = True
+        self.current_verb = dict()
+        self.verbs_handler.save_reviews()
+        if self.player_store is not None:
+            self.player_store.finish_game(self._game_id, self.score)
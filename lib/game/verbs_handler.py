@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tense verbs selection and player score of a game.
+
+"""
+
+import random
+import time
+from typing import Iterable, List, Mapping, Optional
+
+from lib.constant_values import EventName, TenseKey
+from lib.edit import STARKE_UNREGELMEASSIE
+from lib.edit.corpus import CompiledCorpus, parse_line
+from lib.edit.editfile import Editfile
+from lib.edit.sampling import bucket_sample, reservoir_sample
+from lib.edit.verb import Verb
+from lib.events import emit
+from lib.game.scheduler import (
+    QUALITY_FAILURE,
+    QUALITY_SUCCESS,
+    SpacedRepetitionScheduler,
+)
+from lib.validation import check_input
+from scripts import clean_file
+
+
+class HandlerTenseVerbs:
+    def __init__(
+        self,
+        file_name: str = STARKE_UNREGELMEASSIE,
+        max_game: int = 20,
+        streaming: bool = False,
+        seed: Optional[int] = None,
+        levels: Optional[Iterable[str]] = None,
+        scheduler: Optional[SpacedRepetitionScheduler] = None,
+        corpus: Optional[CompiledCorpus] = None,
+    ) -> None:
+        """
+        :param file_name: Name of the file to import
+        :param max_game: Maximum game possible to play, reduced to the number of
+        verbs of the levels when there are less
+        :param streaming: (Optional) Select the tense verbs while reading the file line
+        by line, without loading the corpus. Default set to False
+        :param seed: (Optional) Seed of the random generator, for reproducible games
+        :param levels: (Optional) Only play with verbs of these levels, e.g ("A1", "A2").
+        Default set to None, all levels are played
+        :param scheduler: (Optional) Spaced repetition scheduler, verbs due for review
+        are played first, then verbs never played. Default set to None
+        :param corpus: (Optional) Already opened corpus, shared read only between
+        several handlers. Default set to None, the corpus of file_name is opened
+
+        :raise ValueError: Error raised when a level is not in the corpus"""
+
+        check_input(
+            [
+                (file_name, str),
+                (max_game, int),
+                (streaming, bool),
+                (seed, (int, type(None))),
+                (levels, (list, tuple, set, frozenset, type(None))),
+                (scheduler, (SpacedRepetitionScheduler, type(None))),
+                (corpus, (CompiledCorpus, type(None))),
+            ]
+        )
+
+        if corpus is None:
+            # clear data before manipulation
+            clean_file()
+
+        self.file_name = file_name
+        self.max_game = max_game
+        self.streaming = streaming
+        self.levels = frozenset(levels) if levels else None
+        self.scheduler = scheduler
+        self._rng = random.Random(seed)
+        self._file_to_edit = Editfile(self.file_name)
+
+        if self.streaming:
+            # memory O(max_game): only the selected lines are kept
+            self._verbs_list = None
+            self._random_numbers = []
+            self._not_used_verbs = self._get_streamed_game_verbs()
+        else:
+            # compiled corpus: mmap of pre-parsed fixed-size records,
+            # opening it does not depend on the number of verbs
+            self._verbs_list = (
+                corpus if corpus is not None else self._file_to_edit.load_corpus()
+            )
+            self._length_verbs_list = len(self._verbs_list)
+            self._check_levels()
+            self._random_numbers = self._get_random_numbers()
+            self._not_used_verbs = self._get_game_verbs()
+        if self.scheduler is not None:
+            self._not_used_verbs = self._get_scheduled_game_verbs(self._not_used_verbs)
+        self._used_verbs = []
+
+    @property
+    def corpus(self) -> Optional[CompiledCorpus]:
+        """Compiled corpus of the game, None when the verbs are streamed"""
+        return self._verbs_list
+
+    def _check_levels(self):
+        """Check the levels against the corpus, max_game is reduced to the number of
+        verbs to play with when there are not enough of them
+
+        :raise ValueError: Error raised when a level is not in the corpus"""
+
+        if self.levels:
+            level_index = self._verbs_list.level_index
+            unknown_levels = self.levels.difference(level_index)
+            if unknown_levels:
+                raise ValueError(
+                    f"Unknown levels {sorted(unknown_levels)}, "
+                    + f"levels of the corpus are {sorted(level_index)}"
+                )
+            population = sum(len(level_index[level]) for level in self.levels)
+        else:
+            population = self._length_verbs_list
+        self.max_game = min(self.max_game, population)
+
+    def _get_random_numbers(self) -> List[int]:
+        """Generate a list of number which represents the tense verbs to play with.
+        With levels, numbers are drawn from the precomputed level index of the corpus"""
+
+        if self.levels:
+            level_index = self._verbs_list.level_index
+            return bucket_sample(
+                [level_index[level] for level in sorted(self.levels)],
+                self.max_game,
+                self._rng,
+            )
+        return self._rng.sample(range(self._length_verbs_list), self.max_game)
+
+    def _get_streamed_game_verbs(self) -> List[Verb]:
+        """Get the tense verbs to be used during the game with reservoir sampling
+        over the file lines. Only generated one time, for each HandlerTenseVerbs
+        object instanciation"""
+
+        non_empty_lines = (
+            line
+            for line in self._file_to_edit.iter_txt()
+            if not line.isspace()
+            and (not self.levels or line.rsplit(None, 1)[-1] in self.levels)
+        )
+        return [
+            Verb.from_fields(parse_line(line))
+            for line in reservoir_sample(non_empty_lines, self.max_game, self._rng)
+        ]
+
+    def _get_game_verbs(self) -> List[Verb]:
+        """Get the tense verbs to be used during the game.
+        Only generated one time, for each HandlerTenseVerbs object instanciation"""
+
+        return [Verb.from_fields(self._verbs_list[ind]) for ind in self._random_numbers]
+
+    def _get_scheduled_game_verbs(self, random_verbs: List[Verb]) -> List[Verb]:
+        """Get the tense verbs due for review, completed with random verbs
+        never played, then with random verbs already known.
+
+        :param random_verbs: random tense verbs selected for the game
+
+        :return: game verbs, the first to play at the end of the list"""
+
+        # the level filter is applied while selecting: due verbs of other levels
+        # should not take the places of due verbs of the played levels
+        predicate = (lambda fields: fields[-1] in self.levels) if self.levels else None
+        game_verbs = [
+            Verb.from_fields(fields)
+            for fields in self.scheduler.select(self.max_game, predicate=predicate)
+        ]
+        chosen = {verb.infinitive for verb in game_verbs}
+
+        new_verbs = [
+            verb for verb in random_verbs if verb.infinitive not in self.scheduler
+        ]
+        known_verbs = [
+            verb for verb in random_verbs if verb.infinitive in self.scheduler
+        ]
+        for verb in new_verbs + known_verbs:
+            if len(game_verbs) == self.max_game:
+                break
+            if verb.infinitive not in chosen:
+                chosen.add(verb.infinitive)
+                game_verbs.append(verb)
+
+        game_verbs.reverse()  # select_verb pops from the end
+        return game_verbs
+
+    def record_answer(self, verb: Verb, is_correct: bool):
+        """Reschedule the verb in the spaced repetition scheduler, if any
+
+        :param verb: played tense verb
+        :param is_correct: True if the player answer was correct"""
+
+        if self.scheduler is not None and verb:
+            self.scheduler.review(
+                verb.fields(), QUALITY_SUCCESS if is_correct else QUALITY_FAILURE
+            )
+
+    def save_reviews(self):
+        """Persist the spaced repetition scheduler state, if any"""
+
+        if self.scheduler is not None:
+            self.scheduler.save()
+
+    def select_verb(self) -> Mapping:
+        """Select random tense verbs in a list of tense verbs.
+        The Verb record is read as a dictionary with the corresponding key.
+        "Fahren","Fährt", "Fuhr","ist gefahren", "A2"
+        e.g:
+            verb =
+                {
+                    "infinitive": "Fahren"
+                    "verb singular third form": "Fährt"
+                    "preterite": "Fuhr"
+                    "perfect": "ist gefahren"
+                    "level": "A2"
+                }
+        return tense_verb (Verb)"""
+
+        start = time.monotonic()
+        if not self._not_used_verbs:  # check if list empty
+            emit(EventName.VERB_SELECT, start, infinitive=None, remaining=0)
+            return dict()  # empty dict
+
+        _tense_verb = self._not_used_verbs.pop()  # parsed one time at load
+        self._used_verbs.append(_tense_verb)
+
+        emit(
+            EventName.VERB_SELECT,
+            start,
+            infinitive=_tense_verb[TenseKey.INFINITIVE.value],
+            remaining=len(self._not_used_verbs),
+        )
+        return _tense_verb
+
+
+class PlayerScore:
+    def __init__(self, score: int, max_score: Optional[int] = None) -> None:
+        """
+        :param score: player score
+        :param max_score: (Optional) highest valid score, e.g the number of verbs
+        of the game. Default set to None, no upper bound
+        """
+        self._current_score = score
+        self.max_score = max_score
+
+    @property
+    def current_score(self):
+        return self._current_score
+
+    @current_score.setter
+    def current_score(self, score):
+        # invalid scores are only reported, the score is set anyway
+        if not isinstance(score, int):
+            emit(EventName.SCORE_INVALID, score=score, reason="type")
+        elif score < 0 or (self.max_score is not None and score > self.max_score):
+            emit(EventName.SCORE_INVALID, score=score, reason="range")
+        else:
+            emit(EventName.SCORE_UPDATE, previous=self._current_score, score=score)
+        self._current_score = score
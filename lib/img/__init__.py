@@ -6,9 +6,66 @@
 # path_test = Path(__file__).resolve().parents[2]
 # sys.path.append(str(path_test))
 
+import json
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
 PATH_TO_IMG = "./lib/img"
 PATH_TO_POSITIVE_SMILEY = "./lib/img/positive_smiley.png"
 PATH_TO_SAD_SMILEY = "./lib/img/sad_smiley.jpg"
 PATH_TO_SAD_SMILEY_2 = "./lib/img/sad_smiley_2.png"
 PATH_TO_THUM_UP_SMILEY = "./lib/img/smiley_with_thumb_up.png"
 PATH_TO_TEAR_SMILEY = "./lib/img/smiley_with_tear.jpg"
+
+# pre-sized images built by scripts/build_assets.py, loaded without Pillow
+PATH_TO_SIZED_IMG = "./lib/img/sized"
+PATH_TO_IMG_MANIFEST = "./lib/img/sized/manifest.json"
+LANCZOS = 1  # value of PIL.Image.Resampling.LANCZOS
+
+
+@lru_cache(maxsize=4)
+def load_manifest(manifest_path: str = PATH_TO_IMG_MANIFEST) -> dict:
+    """Read the manifest of the pre-sized images, empty dict if not built
+
+    :param manifest_path: (Optional) Path to the manifest.
+    Default set to PATH_TO_IMG_MANIFEST"""
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def sized_image_path(
+    img_path: str,
+    resize_values: Tuple[int, int],
+    type_resize: int = LANCZOS,
+    image_format: str = "png",
+    manifest_path: str = PATH_TO_IMG_MANIFEST,
+) -> Optional[str]:
+    """Get the pre-sized variant of an image, readable by tk.PhotoImage
+
+    :param img_path: Path to the source image
+    :param resize_values: Image size as (x,y)
+    :param type_resize: (Optional) PIL resampling filter. Default set to LANCZOS
+    :param image_format: (Optional) "png", or "gif" for Tk older than 8.6
+    :param manifest_path: (Optional) Path to the manifest.
+    Default set to PATH_TO_IMG_MANIFEST
+
+    :return: path to the pre-sized image, None if not built or outdated"""
+
+    source = load_manifest(manifest_path).get(os.path.basename(img_path))
+    if source is None:
+        return None
+    variant = source["variants"].get("{}x{}".format(*resize_values))
+    if variant is None or variant["resample"] != int(type_resize):
+        return None
+    try:
+        # source replaced since the build: sizes differ (cheaper than a checksum)
+        if os.path.getsize(img_path) != source["size"]:
+            return None
+    except OSError:
+        return None
+    return os.path.join(os.path.dirname(manifest_path), variant[image_format])
@@ -0,0 +1,8 @@
+"""SERVER package
+
+Play VerbenLernen from a browser: asyncio HTTP/WebSocket quiz server."""
+
+from lib.server.quiz_server import QuizError, QuizServer
+
+
+__all__ = ["QuizError", "QuizServer"]
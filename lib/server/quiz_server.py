@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""
+Asyncio quiz server: many GameSession played at the same time, from a
+browser or any HTTP/WebSocket client on the local network.
+
+All sessions share one read only compiled corpus. The server only relies
+on the standard library: a small HTTP/1.1 parser (keep-alive, JSON
+bodies) and the WebSocket protocol (RFC 6455, text frames only).
+
+HTTP API (JSON):
+    GET    /                          front end page (WebSocket client)
+    POST   /sessions                  {"player", "max_game", "levels"} -> question
+    GET    /sessions/<id>             current question
+    POST   /sessions/<id>/answer      {"perfect", "preterite"} -> result + next question
+    DELETE /sessions/<id>             end the session
+WebSocket API on /ws, one session per connection:
+    {"type": "start", "player", "max_game", "levels"} -> question
+    {"type": "answer", "perfect", "preterite"}         -> result + next question
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import secrets
+import struct
+import time
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+
+from lib.constant_values import AnswerStrictness, TenseKey
+from lib.edit import STARKE_UNREGELMEASSIE
+from lib.edit.corpus import CompiledCorpus
+from lib.edit.editfile import Editfile
+from lib.edit.player_store import PlayerStore
+from lib.game import (
+    AnswerMatcher,
+    GameSession,
+    HandlerTenseVerbs,
+    NearMissClassifier,
+    describe_near_misses,
+)
+from scripts import clean_file
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SESSION_TTL = 3600.0  # seconds without answer before a session is dropped
+MAX_BODY_SIZE = 1 << 16
+
+_WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_WS_TEXT = 0x1
+_WS_CLOSE = 0x8
+_WS_PING = 0x9
+_WS_PONG = 0xA
+
+
+class QuizError(Exception):
+    """Raised for any incorrect client request"""
+
+    def __init__(
+        self,
+        msg: str = "Incorrect request",
+        status: HTTPStatus = HTTPStatus.BAD_REQUEST,
+    ) -> None:
+        """
+        :param msg: Error message sent to the client
+        :param status: HTTP status sent to the client"""
+        self.status = status
+        super().__init__(msg)
+
+
+class QuizServer:
+    """Host many quiz sessions over one shared corpus"""
+
+    def __init__(
+        self,
+        file_name: str = STARKE_UNREGELMEASSIE,
+        player_store: Optional[PlayerStore] = None,
+        max_sessions: int = 10000,
+        strictness: AnswerStrictness = AnswerStrictness.LENIENT,
+    ):
+        """
+        :param file_name: Name of the file to import
+        :param player_store: (Optional) Store where answers and scores are saved
+        :param max_sessions: (Optional) Maximum number of sessions at the same time
+        :param strictness: (Optional) How close the answers should be to the tense
+        verbs. Default set to AnswerStrictness.LENIENT
+        """
+
+        clean_file()
+        self.file_name = file_name
+        self.corpus: CompiledCorpus = Editfile(file_name).load_corpus()
+        self.answer_matcher = AnswerMatcher(self.corpus, strictness)
+        self.near_miss_classifier = NearMissClassifier(
+            self.corpus, answer_matcher=self.answer_matcher
+        )
+        self.player_store = player_store
+        self.max_sessions = max_sessions
+
+        self._sessions: Dict[str, GameSession] = {}
+        self._last_activity: Dict[str, float] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._cleaner: Optional[asyncio.Task] = None
+
+    # --- game -----------------------------------------------------------
+
+    def create_session(self, request: dict) -> Tuple[str, dict]:
+        """Start a new game session
+
+        :param request: {"player": str, "max_game": int, "levels": [str]}, all optional
+
+        :return: session id and first question (tuple)"""
+
+        if len(self._sessions) >= self.max_sessions:
+            raise QuizError("Too many sessions", HTTPStatus.SERVICE_UNAVAILABLE)
+
+        try:
+            handler = HandlerTenseVerbs(
+                self.file_name,
+                max_game=int(request.get("max_game", 20)),
+                levels=request.get("levels") or None,
+                corpus=self.corpus,
+            )
+        except (TypeError, ValueError) as error:
+            raise QuizError(str(error))
+
+        session_id = secrets.token_urlsafe(12)
+        self._sessions[session_id] = GameSession(
+            handler,
+            self.player_store,
+            str(request.get("player") or "player"),
+            self.answer_matcher,
+            self.near_miss_classifier,
+        )
+        self._last_activity[session_id] = time.monotonic()
+        return session_id, self.question(session_id)
+
+    def _get_session(self, session_id: str) -> GameSession:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise QuizError("Unknown session", HTTPStatus.NOT_FOUND)
+        self._last_activity[session_id] = time.monotonic()
+        return session
+
+    def question(self, session_id: str) -> dict:
+        """Current state of a session, without the answer"""
+
+        session = self._get_session(session_id)
+        state = {
+            "session_id": session_id,
+            "score": session.score,
+            "remaining": session.remaining_verbs,
+            "finished": session.is_finished,
+        }
+        if session.is_finished:
+            state["grade"] = session.grade.name
+            state["grade_message"] = session.grade.value
+        else:
+            state["infinitive"] = session.current_verb[TenseKey.INFINITIVE.value]
+        return state
+
+    def answer(self, session_id: str, request: dict) -> dict:
+        """Grade an answer then go to the next verb
+
+        :param session_id: id returned by create_session
+        :param request: {"perfect": str, "preterite": str}
+
+        :return: result, full answer and next question (dict)"""
+
+        session = self._get_session(session_id)
+        if session.is_finished:
+            raise QuizError("Session is finished", HTTPStatus.CONFLICT)
+
+        verb = dict(session.current_verb)
+        is_correct = session.submit(
+            str(request.get("perfect", "")), str(request.get("preterite", ""))
+        )
+        hint = describe_near_misses(session.last_near_misses)
+        mistakes = {
+            near_miss.tense: near_miss.mistake.value
+            for near_miss in session.last_near_misses
+        }
+        session.next_verb()
+        return {
+            "correct": is_correct,
+            "answer": verb,
+            "mistakes": mistakes,
+            "hint": hint,
+            **self.question(session_id),
+        }
+
+    def close_session(self, session_id: str):
+        """Drop a session, its score is saved if it was finished"""
+
+        session = self._sessions.pop(session_id, None)
+        self._last_activity.pop(session_id, None)
+        if session is None:
+            raise QuizError("Unknown session", HTTPStatus.NOT_FOUND)
+
+    async def _drop_idle_sessions(self):
+        """Periodically drop sessions without activity since SESSION_TTL"""
+
+        while True:
+            await asyncio.sleep(SESSION_TTL / 10)
+            limit = time.monotonic() - SESSION_TTL
+            for session_id, last_activity in list(self._last_activity.items()):
+                if last_activity < limit:
+                    self._sessions.pop(session_id, None)
+                    self._last_activity.pop(session_id, None)
+
+    # --- HTTP -----------------------------------------------------------
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Serve HTTP requests of one connection, until it is closed"""
+
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except QuizError as error:
+                    # the body was not read, the next request can not be found
+                    # in the stream: answer then close the connection
+                    payload = json.dumps({"error": str(error)}).encode("utf-8")
+                    self._write_response(
+                        writer, error.status, payload, "application/json", False
+                    )
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+
+                if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self._handle_websocket(reader, writer, headers)
+                    break
+
+                status, payload, content_type = self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, payload, content_type, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        """Read one HTTP request, None when the connection is closed
+
+        :raise QuizError: Error raised when the Content-Length header is
+        incorrect (400) or above MAX_BODY_SIZE (413)"""
+
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return None
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            raise QuizError("Incorrect Content-Length header") from None
+        if length < 0:
+            raise QuizError("Incorrect Content-Length header")
+        if length > MAX_BODY_SIZE:
+            raise QuizError(
+                "Request body too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), path.split("?", 1)[0], headers, body
+
+    def _route(self, method: str, path: str, body: bytes):
+        """Call the game method matching the request
+
+        :return: status, payload, content type (tuple)"""
+
+        if method == "GET" and path == "/":
+            return HTTPStatus.OK, FRONT_END_PAGE.encode("utf-8"), "text/html"
+
+        try:
+            request = json.loads(body) if body else {}
+            if not isinstance(request, dict):
+                raise QuizError("JSON object expected")
+
+            parts = [part for part in path.split("/") if part]
+            if parts == ["sessions"] and method == "POST":
+                _, result = self.create_session(request)
+                status = HTTPStatus.CREATED
+            elif len(parts) == 2 and parts[0] == "sessions" and method == "GET":
+                result, status = self.question(parts[1]), HTTPStatus.OK
+            elif len(parts) == 2 and parts[0] == "sessions" and method == "DELETE":
+                self.close_session(parts[1])
+                result, status = {}, HTTPStatus.OK
+            elif (
+                parts[:1] == ["sessions"]
+                and parts[2:] == ["answer"]
+                and method == "POST"
+            ):
+                result, status = self.answer(parts[1], request), HTTPStatus.OK
+            else:
+                raise QuizError("Not found", HTTPStatus.NOT_FOUND)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # the whole body was read: the connection can be kept alive
+            result, status = {"error": "Incorrect JSON body"}, HTTPStatus.BAD_REQUEST
+        except QuizError as error:
+            result, status = {"error": str(error)}, error.status
+
+        return status, json.dumps(result).encode("utf-8"), "application/json"
+
+    @staticmethod
+    def _write_response(
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: bytes,
+        content_type: str,
+        keep_alive: bool = True,
+    ):
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+            ).encode("latin-1")
+            + payload
+        )
+
+    # --- WebSocket ------------------------------------------------------
+
+    async def _handle_websocket(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        headers: dict,
+    ):
+        """Upgrade the connection then play one session per connection"""
+
+        key = headers.get("sec-websocket-key", "").encode("latin-1")
+        accept = base64.b64encode(hashlib.sha1(key + _WEBSOCKET_GUID).digest())
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        await writer.drain()
+
+        session_id = None
+        try:
+            while True:
+                opcode, payload = await read_websocket_frame(reader)
+                if opcode == _WS_CLOSE:
+                    writer.write(encode_websocket_frame(b"", _WS_CLOSE))
+                    break
+                if opcode == _WS_PING:
+                    writer.write(encode_websocket_frame(payload, _WS_PONG))
+                    continue
+                if opcode != _WS_TEXT:
+                    continue
+
+                try:
+                    message = json.loads(payload)
+                    if message.get("type") == "start":
+                        if session_id is not None:
+                            self._sessions.pop(session_id, None)
+                            self._last_activity.pop(session_id, None)
+                        session_id, result = self.create_session(message)
+                    elif message.get("type") == "answer" and session_id is not None:
+                        result = self.answer(session_id, message)
+                    else:
+                        raise QuizError("Unknown message")
+                except (QuizError, ValueError, AttributeError) as error:
+                    result = {"error": str(error)}
+
+                writer.write(encode_websocket_frame(json.dumps(result).encode("utf-8")))
+                await writer.drain()
+        finally:
+            if session_id is not None:
+                self._sessions.pop(session_id, None)
+                self._last_activity.pop(session_id, None)
+
+    # --- server ---------------------------------------------------------
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Start listening, return once the server is ready"""
+
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._cleaner = asyncio.ensure_future(self._drop_idle_sessions())
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        await self.start(host, port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._cleaner is not None:
+            self._cleaner.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self.player_store is not None:
+            self.player_store.flush()
+
+
+async def read_websocket_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """Read one WebSocket frame, fragmented messages are not supported
+
+    :return: opcode and unmasked payload (tuple)"""
+
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_BODY_SIZE:
+        raise ConnectionError("WebSocket frame too large")
+
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        # xor the whole payload at once with the repeated 4 bytes mask
+        repeated_mask = (mask * (length // 4 + 1))[:length]
+        payload = (
+            int.from_bytes(payload, "big") ^ int.from_bytes(repeated_mask, "big")
+        ).to_bytes(length, "big")
+    return opcode, payload
+
+
+def encode_websocket_frame(
+    payload: bytes, opcode: int = _WS_TEXT, mask: Optional[bytes] = None
+) -> bytes:
+    """Encode one final WebSocket frame. Clients must mask their frames
+
+    :param payload: frame data
+    :param opcode: (Optional) frame type. Default set to text
+    :param mask: (Optional) 4 bytes mask, for client frames"""
+
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < (1 << 16):
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+
+    if mask:
+        repeated_mask = (mask * (length // 4 + 1))[:length]
+        payload = (
+            int.from_bytes(payload, "big") ^ int.from_bytes(repeated_mask, "big")
+        ).to_bytes(length, "big")
+        return header + mask + payload
+    return header + payload
+
+
+FRONT_END_PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>VerbenLernen Spiel</title></head>
+<body style="font-family: Calibri, sans-serif; background: #7092BE">
+<h1>VerbenLernen Spiel</h1>
+<p>Name: <input id="player"> <button onclick="start()">START</button></p>
+<p>Infinitive verb: <b id="infinitive"></b></p>
+<p>Preterite tense: <input id="preterite"> Perfect tense: <input id="perfect">
+<button onclick="answer()">SUBMIT</button></p>
+<p id="result"></p>
+<p>Your current score: <span id="score">0</span> - Remain verbs: <span id="remaining"></span></p>
+<script>
+const ws = new WebSocket(`ws://${location.host}/ws`);
+const $ = (id) => document.getElementById(id);
+ws.onmessage = (event) => {
+  const state = JSON.parse(event.data);
+  if (state.error) { $("result").textContent = state.error; return; }
+  if ("correct" in state) {
+    const verb = Object.values(state.answer).join(", ");
+    $("result").textContent = (state.correct ? "Right Answer ! " : "Wrong Answer ! ") + verb + " " + state.hint;
+  }
+  $("score").textContent = state.score;
+  $("remaining").textContent = state.remaining;
+  $("infinitive").textContent = state.finished ? state.grade + ": " + state.grade_message : state.infinitive;
+  $("preterite").value = ""; $("perfect").value = "";
+};
+function start() { ws.send(JSON.stringify({type: "start", player: $("player").value})); }
+function answer() {
+  ws.send(JSON.stringify({type: "answer", perfect: $("perfect").value, preterite: $("preterite").value}));
+}
+</script>
+</body>
+</html>
+"""
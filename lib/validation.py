@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Input validation shared by VerbenLernen packages, without tkinter dependency.
+
+Validation is either strict (development and tests) or off (production),
+see ValidationMode. The mode is read from the VERBENLERNEN_VALIDATION
+environment variable, default set to strict.
+
+Functions called on each render are decorated with validate_input: the
+positions of the checked parameters are computed one time, when the function
+is decorated. In off mode, the function is not wrapped at all.
+"""
+
+import functools
+import inspect
+import os
+from typing import Callable, List, Union
+
+from lib.constant_values import ValidationMode
+
+
+VALIDATION_MODE_ENV = "VERBENLERNEN_VALIDATION"
+
+
+def _read_validation_mode() -> ValidationMode:
+    """Validation mode of the VERBENLERNEN_VALIDATION environment variable"""
+
+    value = os.environ.get(VALIDATION_MODE_ENV, ValidationMode.STRICT.value)
+    try:
+        return ValidationMode(value.strip().lower())
+    except ValueError:
+        raise ValueError(
+            f"{VALIDATION_MODE_ENV}={value} is not one of: "
+            + ", ".join(mode.value for mode in ValidationMode)
+        ) from None
+
+
+_validation_mode = _read_validation_mode()
+
+
+def get_validation_mode() -> ValidationMode:
+    return _validation_mode
+
+
+def set_validation_mode(mode: ValidationMode):
+    """Switch the input validation on or off.
+    check_input uses the new mode at once, validate_input only for the
+    functions decorated afterwards: set the mode before importing them.
+
+    :param mode: new validation mode"""
+
+    global _validation_mode
+    _validation_mode = ValidationMode(mode)
+
+
+def check_input(value_to_check: Union[tuple, List[tuple]]) -> Union[Exception, None]:
+    """Check if inputs have the right instance type
+
+    :param value_to_check: Inputs values to check their type.
+    It should be a tuple, e.g (input, expected_type)
+
+    :raise TypeError: Error raised when input type is different from expected type"""
+
+    if _validation_mode is ValidationMode.OFF:
+        return
+
+    if isinstance(value_to_check, tuple):
+        if not isinstance(value_to_check[0], value_to_check[1]):
+            raise TypeError(
+                f"Your Input has a type:{type(value_to_check[0])}, "
+                + f"which is different from expected input type: {value_to_check[1]}"
+            )
+
+    elif isinstance(value_to_check, list):
+        for index, value in enumerate(value_to_check):  # value == tuple
+            if not isinstance(value[0], value[1]):
+                raise TypeError(
+                    f"Your Input in index: {index} has a type: {type(value[0])}, "
+                    + f"which is different from expected input type: {value[1]}"
+                )
+
+    else:
+        raise TypeError(
+            f" parameter value_to_check type: {type(value_to_check[0])}, "
+            + "is different from tuple or list"
+        )
+
+    return
+
+
+def validate_input(**expected_types) -> Callable[[Callable], Callable]:
+    """Decorator checking the type of some parameters at each call.
+    Parameters not given at the call keep their default value, which is not checked.
+        :e.g:
+            @validate_input(frame=ttk.Frame, text=str)
+            def create_label(frame, text, tk_width=None): ...
+
+    :param expected_types: parameter name -> expected type, or tuple of types
+
+    :return: decorator, returning the function itself in off mode (Callable)
+
+    :raise TypeError: Error raised at the call when an input type is different
+    from expected type, or at the decoration for an unknown parameter name"""
+
+    def decorator(func: Callable) -> Callable:
+        if _validation_mode is ValidationMode.OFF:
+            return func
+
+        parameters = list(inspect.signature(func).parameters)
+        unknown_parameters = set(expected_types) - set(parameters)
+        if unknown_parameters:
+            raise TypeError(
+                f"{func.__qualname__} has no parameter: {sorted(unknown_parameters)}"
+            )
+        # checker compiled one time: (position, name, expected type)
+        checks = tuple(
+            (parameters.index(name), name, expected_type)
+            for name, expected_type in expected_types.items()
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nb_args = len(args)
+            for position, name, expected_type in checks:
+                if position < nb_args:
+                    value = args[position]
+                elif name in kwargs:
+                    value = kwargs[name]
+                else:
+                    continue
+                if not isinstance(value, expected_type):
+                    raise TypeError(
+                        f"Your Input {name} has a type: {type(value)}, "
+                        + f"which is different from expected input type: {expected_type}"
+                    )
+            return func(*args, **kwargs)
+
+        wrapper.expected_types = expected_types
+        return wrapper
+
+    return decorator
@@ -11,6 +11,7 @@ from lib.windows.templates import (
     create_label,
     create_photo_label,
     create_text,
+    update_text,
     create_entry,
     create_progress_bar,
     create_button,
@@ -29,6 +30,7 @@ __all__ = [
     create_label,
     create_photo_label,
     create_text,
+    update_text,
     create_entry,
     create_progress_bar,
     create_button,
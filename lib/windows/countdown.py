@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Countdowns of the app, driven by a single Tk tick
+
+Every countdown (e.g the time left to answer a verb) is owned by one
+CountdownScheduler: a single after() callback runs while a countdown is
+active, remaining times are computed from a monotonic clock, so late ticks
+never accumulate drift, and the next tick is aligned on the tick period.
+Cancelling a countdown guarantees its callback is never called.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from lib.validation import check_input
+
+
+@dataclass
+class Countdown:
+    """One running countdown"""
+
+    name: str
+    duration: float  # seconds
+    deadline: float  # clock time of the end
+    on_expire: Callable[[], None]
+    on_tick: Optional[Callable[[float, float], None]] = field(default=None)
+    paused_remaining: Optional[float] = field(default=None)
+
+
+class CountdownScheduler:
+    """All the countdowns of a Tk app.
+
+    method start: to start (or restart) a named countdown
+    method cancel / cancel_all: to stop countdowns without calling them
+    method pause / resume: to freeze all countdowns, e.g when the window is minimized
+    method remaining: to get the seconds left of a countdown"""
+
+    def __init__(
+        self,
+        widget,
+        tick_ms: int = 200,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param widget: Tk widget used to schedule the ticks (after / after_cancel)
+        :param tick_ms: (Optional) Period of the ticks in ms. Default set to 200
+        :param clock: (Optional) Monotonic clock in seconds. Default set to time.monotonic
+        """
+
+        check_input([(tick_ms, int)])
+
+        self._widget = widget
+        self.tick_ms = tick_ms
+        self._clock = clock
+        self._countdowns: Dict[str, Countdown] = {}
+        self._after_id = None
+        self._origin = clock()
+        self.is_paused = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._countdowns
+
+    def start(
+        self,
+        name: str,
+        duration: float,
+        on_expire: Callable[[], None],
+        on_tick: Optional[Callable[[float, float], None]] = None,
+    ) -> Countdown:
+        """Start a countdown, a running countdown of the same name is replaced
+
+        :param name: countdown name
+        :param duration: countdown duration in seconds
+        :param on_expire: called one time at the end of the countdown
+        :param on_tick: (Optional) called at each tick with (remaining, duration) seconds
+
+        :return: started countdown (Countdown)"""
+
+        check_input([(name, str), (duration, (int, float))])
+
+        now = self._clock()
+        countdown = Countdown(name, float(duration), now + duration, on_expire, on_tick)
+        if self.is_paused:
+            countdown.paused_remaining = float(duration)
+        self._countdowns[name] = countdown
+        if on_tick is not None:
+            on_tick(float(duration), float(duration))
+        self._schedule(now)
+        return countdown
+
+    def cancel(self, name: str) -> bool:
+        """Stop a countdown, its on_expire is never called
+
+        :param name: countdown name
+
+        :return: True if the countdown was running (bool)"""
+
+        countdown = self._countdowns.pop(name, None)
+        if not self._countdowns:
+            self._unschedule()
+        return countdown is not None
+
+    def cancel_all(self):
+        """Stop all countdowns"""
+        self._countdowns.clear()
+        self._unschedule()
+
+    def remaining(self, name: str) -> Optional[float]:
+        """Seconds left of a countdown, None if not running
+        :param name: countdown name"""
+
+        countdown = self._countdowns.get(name)
+        if countdown is None:
+            return None
+        if countdown.paused_remaining is not None:
+            return countdown.paused_remaining
+        return max(0.0, countdown.deadline - self._clock())
+
+    def pause(self):
+        """Freeze all countdowns"""
+
+        if self.is_paused:
+            return
+        now = self._clock()
+        self.is_paused = True
+        for countdown in self._countdowns.values():
+            countdown.paused_remaining = max(0.0, countdown.deadline - now)
+        self._unschedule()
+
+    def resume(self):
+        """Restart the frozen countdowns where they were paused"""
+
+        if not self.is_paused:
+            return
+        now = self._clock()
+        self.is_paused = False
+        for countdown in self._countdowns.values():
+            countdown.deadline = now + countdown.paused_remaining
+            countdown.paused_remaining = None
+        self._schedule(now)
+
+    def _schedule(self, now: float):
+        """Schedule the next tick on the tick period, if needed"""
+
+        if self.is_paused or not self._countdowns or self._after_id is not None:
+            return
+        elapsed_ms = (now - self._origin) * 1000.0
+        delay_ms = self.tick_ms - int(elapsed_ms % self.tick_ms)
+        # never later than the first deadline, rounded up: a tick a few µs
+        # before the deadline would be scheduled again at once
+        first_deadline = min(
+            countdown.deadline for countdown in self._countdowns.values()
+        )
+        delay_ms = min(delay_ms, max(0, math.ceil((first_deadline - now) * 1000.0)))
+        self._after_id = self._widget.after(delay_ms, self.tick)
+
+    def _unschedule(self):
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def tick(self):
+        """Update all countdowns and call the expired ones"""
+
+        self._after_id = None
+        if self.is_paused:
+            return
+        now = self._clock()
+        for countdown in list(self._countdowns.values()):
+            # a callback may have cancelled or restarted this countdown
+            if self._countdowns.get(countdown.name) is not countdown:
+                continue
+            remaining = max(0.0, countdown.deadline - now)
+            if countdown.on_tick is not None:
+                countdown.on_tick(remaining, countdown.duration)
+            if remaining <= 0.0:
+                del self._countdowns[countdown.name]
+                countdown.on_expire()
+        self._schedule(self._clock())
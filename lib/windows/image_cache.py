@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Process-wide cache of the resized images of the templates
+
+Pages are created once per game and keep their photo, so an image is looked
+up again only by a new page, e.g of another game or of another Tk root in
+the same process. Resized PIL images are kept in a LRU cache keyed by
+(path, size, resample), and their PhotoImage in a second cache for each Tk
+root (a PhotoImage belongs to one Tk interpreter). hits and misses count the
+lookups since the launch of the process.
+
+Images pre-sized by scripts/build_assets.py are loaded by tk.PhotoImage
+directly: Pillow is only imported for images missing from the manifest.
+"""
+
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Tuple, Union
+
+import tkinter as tk
+
+from lib.img import LANCZOS, sized_image_path
+
+if TYPE_CHECKING:
+    # Pillow is imported on first use only
+    import PIL.Image
+    import PIL.ImageTk
+
+
+ImageKey = Tuple[str, Tuple[int, int], int]
+# GIF only before Tk 8.6
+SIZED_IMAGE_FORMAT = "png" if tk.TkVersion >= 8.6 else "gif"
+
+
+class ImageCache:
+    """LRU cache of resized images and of their Tk photos.
+
+    method get_image: to get a resized PIL image
+    method get_photo: to get the Tk photo of a resized image for a Tk root"""
+
+    def __init__(self, maxsize: int = 32):
+        """
+        :param maxsize: (Optional) Maximum number of resized images kept.
+        Default set to 32
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._images: "OrderedDict[ImageKey, PIL.Image.Image]" = OrderedDict()
+        # Tk root -> {image key: photo}, dropped with the root
+        self._photos: "weakref.WeakKeyDictionary[tk.Misc, OrderedDict]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _key(
+        img_path: str, resize_values: Tuple[int, int], type_resize: int
+    ) -> ImageKey:
+        return (str(Path(img_path).resolve()), tuple(resize_values), int(type_resize))
+
+    def get_image(
+        self,
+        img_path: str,
+        resize_values: Tuple[int, int],
+        type_resize: int = LANCZOS,
+    ) -> "PIL.Image.Image":
+        """Get an image resized with Pillow, the file is only decoded on a cache miss
+
+        :param img_path: Path to image
+        :param resize_values: Reshape image size as (x,y)
+        :param type_resize: (Optional) See PIL Image.Resampling. Default set to LANCZOS
+
+        :return: resized image (PIL.Image.Image)"""
+
+        from PIL import Image
+
+        key = self._key(img_path, resize_values, type_resize)
+        image = self._images.get(key)
+        if image is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return image
+
+        self.misses += 1
+        with Image.open(key[0]) as image_file:
+            image = image_file.resize(key[1], Image.Resampling(key[2]))
+        self._images[key] = image
+        if len(self._images) > self.maxsize:
+            self._images.popitem(last=False)
+        return image
+
+    def get_photo(
+        self,
+        widget: tk.Misc,
+        img_path: str,
+        resize_values: Tuple[int, int],
+        type_resize: int = LANCZOS,
+    ) -> Union[tk.PhotoImage, "PIL.ImageTk.PhotoImage"]:
+        """Get the Tk photo of a resized image, shared by all the widgets of a Tk root
+
+        :param widget: any widget of the Tk root displaying the photo
+        :param img_path: Path to image
+        :param resize_values: Reshape image size as (x,y)
+        :param type_resize: (Optional) See PIL Image.Resampling. Default set to LANCZOS
+
+        :return: photo to display (tk.PhotoImage, or ImageTk.PhotoImage if not
+        pre-sized)"""
+
+        root = widget.winfo_toplevel()
+        photos = self._photos.setdefault(root, OrderedDict())
+        key = self._key(img_path, resize_values, type_resize)
+        photo = photos.get(key)
+        if photo is not None:
+            self.hits += 1
+            photos.move_to_end(key)
+            return photo
+
+        sized_path = sized_image_path(
+            img_path, resize_values, type_resize, SIZED_IMAGE_FORMAT
+        )
+        if sized_path is not None:
+            self.misses += 1
+            photo = tk.PhotoImage(file=sized_path, master=root)
+        else:
+            from PIL import ImageTk
+
+            # get_image counts the hit or miss of the resized image
+            photo = ImageTk.PhotoImage(
+                self.get_image(img_path, resize_values, type_resize), master=root
+            )
+        photos[key] = photo
+        if len(photos) > self.maxsize:
+            photos.popitem(last=False)
+        return photo
+
+    def clear(self):
+        """Drop all cached images and photos"""
+        self._images.clear()
+        self._photos.clear()
+
+
+image_cache = ImageCache()
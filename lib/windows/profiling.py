@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Opt-in profiling of the Tk callbacks of the app
+
+Every Python callback called by Tk (button commands, after callbacks, event
+bindings) goes through tkinter.CallWrapper. Once installed, the profiler
+replaces it: each callback is timed, and profiled with its own cProfile
+profile. On exit, the profiler writes:
+    - <prefix>.callbacks.json: calls, total, mean and max time of each callback
+    - <prefix>.prof: cProfile stats of all callbacks, see pstats or snakeviz
+    - <prefix>.collapsed: collapsed stacks for flame graphs (flamegraph.pl,
+      speedscope), rooted at the callback name, in microseconds
+Stacks are rebuilt from the cProfile call graph: the time of a function
+called from several places is shared in proportion to each caller.
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import pstats
+import time
+import tkinter as tk
+import types
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+PROFILE_ENV = "VERBENLERNEN_PROFILE"
+
+FunctionKey = Tuple[str, int, str]  # pstats (filename, line, function name)
+
+
+def callback_name(func: Callable) -> str:
+    """Readable name of a Tk callback, e.g VerbenLernenApp.switch_to_game_page
+    :param func: function registered in Tk"""
+
+    # after() registers a closure calling the function given to after()
+    code = getattr(func, "__code__", None)
+    if code is not None and func.__qualname__.endswith("after.<locals>.callit"):
+        cells = dict(zip(code.co_freevars, func.__closure__ or ()))
+        if "func" in cells:
+            func = cells["func"].cell_contents
+
+    bound_to = getattr(func, "__self__", None)
+    if bound_to is not None and not isinstance(bound_to, types.ModuleType):
+        return f"{type(bound_to).__name__}.{func.__name__}"
+    return getattr(func, "__qualname__", type(func).__name__)
+
+
+def _frame_name(function_key: FunctionKey) -> str:
+    filename, line, function_name = function_key
+    if filename == "~":  # built-in function
+        return function_name
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:  # other drive
+        pass
+    return f"{function_name} ({filename}:{line})"
+
+
+def collapsed_stacks(
+    stats: dict, root_name: str, min_time: float = 1e-6
+) -> Dict[str, float]:
+    """Rebuild the stacks of a cProfile profile
+
+    :param stats: pstats.Stats.stats of the profile
+    :param root_name: first frame of all the stacks
+    :param min_time: (Optional) stacks shorter than min_time seconds are dropped.
+    Default set to 1e-6
+
+    :return: "frame;frame;..." -> self time in seconds (dict)"""
+
+    callees: Dict[FunctionKey, List[Tuple[FunctionKey, float]]] = defaultdict(list)
+    for function_key, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, caller_cumulative) in callers.items():
+            callees[caller].append((function_key, caller_cumulative))
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def walk(function_key, path, frames, time_on_path):
+        cumulative = stats[function_key][3]
+        if cumulative <= 0 or time_on_path < min_time:
+            return
+        # share of the function time spent on this path
+        ratio = min(1.0, time_on_path / cumulative)
+        stacks[";".join(frames)] += stats[function_key][2] * ratio
+        for callee, caller_cumulative in callees.get(function_key, ()):
+            if callee in path:  # recursion: already counted by the caller
+                continue
+            walk(
+                callee,
+                path | {callee},
+                frames + [_frame_name(callee)],
+                caller_cumulative * ratio,
+            )
+
+    for function_key, (_, _, _, cumulative, callers) in stats.items():
+        if not callers and not function_key[2].startswith("<method 'disable'"):
+            walk(
+                function_key,
+                {function_key},
+                [root_name, _frame_name(function_key)],
+                cumulative,
+            )
+    return stacks
+
+
+class CallbackProfiler:
+    """Time and profile all the Tk callbacks.
+
+    method install: to profile the callbacks registered from now on
+    method uninstall: to stop profiling new callbacks
+    method dump: to write the stats files"""
+
+    def __init__(
+        self, output_prefix: str, clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        :param output_prefix: path of the stats files, without extension
+        :param clock: (Optional) clock of the callback times.
+        Default set to time.perf_counter
+        """
+
+        self.output_prefix = output_prefix
+        self._clock = clock
+        # callback name -> [calls, total time, max time]
+        self.timings: Dict[str, list] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._depth = 0
+        self._original_call_wrapper: Optional[type] = None
+        self._start = clock()
+
+    def install(self):
+        """Replace tkinter.CallWrapper: only the callbacks registered afterwards
+        are profiled, install before creating the app"""
+
+        if self._original_call_wrapper is not None:
+            return
+        self._original_call_wrapper = tk.CallWrapper
+        profiler = self
+
+        class ProfiledCallWrapper(tk.CallWrapper):
+            def __init__(self, func, subst, widget):
+                super().__init__(func, subst, widget)
+                self.callback_name = callback_name(func)
+
+            def __call__(self, *args):
+                return profiler.call(self.callback_name, super().__call__, *args)
+
+        tk.CallWrapper = ProfiledCallWrapper
+        atexit.register(self.dump)
+
+    def uninstall(self):
+        if self._original_call_wrapper is not None:
+            tk.CallWrapper = self._original_call_wrapper
+            self._original_call_wrapper = None
+
+    def call(self, name: str, func: Callable, *args):
+        """Call a callback, timed and profiled
+        :param name: callback name
+        :param func: callback"""
+
+        # callbacks run by update() inside a callback are only timed:
+        # one profile is active at a time
+        profile = None
+        if self._depth == 0:
+            profile = self._profiles.get(name)
+            if profile is None:
+                profile = self._profiles[name] = cProfile.Profile()
+        self._depth += 1
+        start = self._clock()
+        try:
+            if profile is None:
+                return func(*args)
+            profile.enable()
+            try:
+                return func(*args)
+            finally:
+                profile.disable()
+        finally:
+            elapsed = self._clock() - start
+            self._depth -= 1
+            timing = self.timings.get(name)
+            if timing is None:
+                self.timings[name] = [1, elapsed, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+                timing[2] = max(timing[2], elapsed)
+
+    def dump(self) -> Dict[str, str]:
+        """Write the stats of all the callbacks called so far
+
+        :return: kind of stats -> written file (dict)"""
+
+        files = {
+            "callbacks": self.output_prefix + ".callbacks.json",
+            "prof": self.output_prefix + ".prof",
+            "collapsed": self.output_prefix + ".collapsed",
+        }
+        directory = os.path.dirname(os.path.abspath(self.output_prefix))
+        os.makedirs(directory, exist_ok=True)
+
+        callbacks = {
+            name: {
+                "calls": calls,
+                "total_s": round(total, 6),
+                "mean_ms": round(total / calls * 1e3, 3),
+                "max_ms": round(maximum * 1e3, 3),
+            }
+            for name, (calls, total, maximum) in sorted(
+                self.timings.items(), key=lambda item: item[1][1], reverse=True
+            )
+        }
+        with open(files["callbacks"], "w", encoding="utf-8") as json_file:
+            wall_time = round(self._clock() - self._start, 3)
+            json.dump(
+                {"wall_s": wall_time, "callbacks": callbacks}, json_file, indent=2
+            )
+
+        profiles = [
+            profile for profile in self._profiles.values() if profile.getstats()
+        ]
+        if profiles:
+            pstats.Stats(*profiles).dump_stats(files["prof"])
+
+        with open(files["collapsed"], "w", encoding="utf-8") as collapsed_file:
+            for name, profile in self._profiles.items():
+                if not profile.getstats():
+                    continue
+                stacks = collapsed_stacks(pstats.Stats(profile).stats, name)
+                for stack, seconds in stacks.items():
+                    microseconds = round(seconds * 1e6)
+                    if microseconds:
+                        collapsed_file.write(f"{stack} {microseconds}\n")
+        return files
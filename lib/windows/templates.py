@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
-from pathlib import Path
-from typing import Optional, Union, List, Callable
+import math
+import sys
+from collections.abc import Mapping
+from typing import Optional, Union, Callable
 
 import tkinter as tk
 from tkinter import ttk
@@ -14,7 +16,6 @@ from lib.constant_values import (
     TkAnchorNSticky,
     TkSide,
     TkStates,
-    GradePlayer,
     TenseKey,
     VlColors,
     StyleNamesCustomized,
@@ -22,80 +23,26 @@ from lib.constant_values import (
 
 from tkinter.scrolledtext import ScrolledText
 from lib.img import (
+    LANCZOS,
     PATH_TO_POSITIVE_SMILEY,
     PATH_TO_SAD_SMILEY_2,
     PATH_TO_THUM_UP_SMILEY,
 )
 
-from PIL import ImageTk, Image
+from lib.game.grade import get_player_grade
+from lib.validation import check_input, validate_input
+from lib.windows.image_cache import image_cache
 
 
-def get_player_grade(score: int) -> GradePlayer:
-    """
-    Get the grade according to the score
-        :e.g:
-            CREATOR:20,
-            MASTER:>20-18>=,
-            EXPERT:>18-16>=,
-            ELITE:>16-14>=,
-            DISCIPLE:>14-10>=,
-            OUTSIDER:>10-5>=,
-            ALIEN:>5-0>="""
-
-    if score == 0 or (score > 0 and score < 5):
-        return GradePlayer.ALIEN
-
-    elif score == 5 or (score > 5 and score < 10):
-        return GradePlayer.OUTSIDER
-
-    elif score == 10 or (score > 10 and score < 14):
-        return GradePlayer.DISCIPLE
-
-    elif score == 14 or (score > 14 and score < 16):
-        return GradePlayer.ELITE
-
-    elif score == 16 or (score > 16 and score < 18):
-        return GradePlayer.EXPERT
-
-    elif score == 18 or (score > 18 and score < 20):
-        return GradePlayer.MASTER
-
-    else:
-        return GradePlayer.CREATOR
-
-
-def check_input(value_to_check: Union[tuple, List[tuple]]) -> Union[Exception, None]:
-    """Check if inputs have the right instance type
-
-    :param value_to_check: Inputs values to check their type.
-    It should be a tuple, e.g (input, expected_type)
-
-    :raise TypeError: Error raised when input type is different from expected type"""
-
-    if isinstance(value_to_check, tuple):
-        if not isinstance(value_to_check[0], value_to_check[1]):
-            raise TypeError(
-                f"Your Input has a type:{type(value_to_check[0])}, "
-                + f"which is different from expected input type: {value[1]}"
-            )
-
-    elif isinstance(value_to_check, list):
-        for index, value in enumerate(value_to_check):  # value == tuple
-            if not isinstance(value[0], value[1]):
-                raise TypeError(
-                    f"Your Input in index: {index} has a type: {type(value[0])}, "
-                    + f"which is different from expected input type: {value[1]}"
-                )
-
-    else:
-        raise TypeError(
-            f" parameter value_to_check type: {type(value_to_check[0])}, "
-            + "is different from tuple or list"
-        )
-
-    return
+def _photo_types() -> tuple:
+    """Tk photo types, PIL photos only if Pillow is already imported"""
+    pil_image_tk = sys.modules.get("PIL.ImageTk")
+    if pil_image_tk is None:
+        return (tk.PhotoImage,)
+    return (tk.PhotoImage, pil_image_tk.PhotoImage)
 
 
+@validate_input(frame=ttk.Frame, tk_relief=(TkRelief, str))
 def create_frame(
     frame: ttk.Frame,
     tk_relief: Union[TkRelief, str] = TkRelief.FLAT,
@@ -111,10 +58,6 @@ def create_frame(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [(frame, ttk.Frame), (tk_relief, (TkRelief, str))]
-    check_input(inputs_to_check)
-
     frame = ttk.Frame(frame, relief=tk_relief)
     try:
         frame.pack(
@@ -133,6 +76,13 @@ def create_frame(
     return frame
 
 
+@validate_input(
+    frame=ttk.Frame,
+    text=str,
+    label_style=str,
+    tk_relief=(TkRelief, str),
+    tk_anchor=(TkAnchorNSticky, str),
+)
 def create_label(
     frame: ttk.Frame,
     text: str,
@@ -157,16 +107,6 @@ def create_label(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [
-        (frame, ttk.Frame),
-        (text, str),
-        (label_style, str),
-        (tk_relief, (TkRelief, str)),
-        (tk_anchor, (TkAnchorNSticky, str)),
-    ]
-    check_input(inputs_to_check)
-
     # add check for size parameter ?
 
     tk_label = ttk.Label(
@@ -195,7 +135,7 @@ def create_label(
 
 def create_photo_label(
     frame: ttk.Frame,
-    tk_photo: ImageTk.PhotoImage,
+    tk_photo: Union[tk.PhotoImage, "ImageTk.PhotoImage"],
     tk_compound: Union[TkSide, str] = TkSide.TOP,
     tk_anchor: Union[TkAnchorNSticky, str] = TkAnchorNSticky.CENTER,
     tk_relief: Union[TkRelief, str] = TkRelief.FLAT,
@@ -224,7 +164,7 @@ def create_photo_label(
     # check input
     inputs_to_check = [
         (frame, ttk.Frame),
-        (tk_photo, ImageTk.PhotoImage),
+        (tk_photo, _photo_types()),
         (label_style, str),
         (tk_anchor, (TkAnchorNSticky, str)),
         (tk_compound, (TkSide, str)),
@@ -263,6 +203,15 @@ def create_photo_label(
     return tk_photo_label
 
 
+@validate_input(
+    frame=ttk.Frame,
+    text=str,
+    tk_width=int,
+    tk_height=int,
+    fg_color=str,
+    bg_color=str,
+    tk_state=(TkStates, str),
+)
 def create_text(
     frame: ttk.Frame,
     text: str,
@@ -290,18 +239,6 @@ def create_text(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [
-        (frame, ttk.Frame),
-        (text, str),
-        (tk_width, int),
-        (tk_height, int),
-        (fg_color, str),
-        (bg_color, str),
-        (tk_state, (TkStates, str)),
-    ]
-    check_input(inputs_to_check)
-
     tk_text = tk.Text(
         frame, height=tk_height, width=tk_width, fg=fg_color, background=bg_color
     )
@@ -325,6 +262,29 @@ def create_text(
     return tk_text
 
 
+@validate_input(tk_text=tk.Text, text=str)
+def update_text(tk_text: tk.Text, text: str):
+    """Replace the text of a tkinter text created by create_text, its state is kept
+
+    :param tk_text: Text widget to update
+    :param text: New text
+
+    :raise TypeError: Error raised when input type is different from expected type"""
+
+    tk_state = tk_text.cget("state")
+    tk_text.configure(state=TkStates.NORMAL)
+    tk_text.delete("1.0", tk.END)
+    tk_text.insert(tk.END, text)
+    tk_text.configure(state=tk_state)
+
+
+@validate_input(
+    frame=ttk.Frame,
+    tk_textvariable=tk.StringVar,
+    tk_width=int,
+    fg_color=str,
+    bg_color=str,
+)
 def create_entry(
     frame: ttk.Frame,
     tk_textvariable: tk.StringVar,
@@ -347,16 +307,6 @@ def create_entry(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [
-        (frame, ttk.Frame),
-        (tk_textvariable, tk.StringVar),
-        (tk_width, int),
-        (fg_color, str),
-        (bg_color, str),
-    ]
-    check_input(inputs_to_check)
-
     tk_entry = tk.Entry(
         frame, textvariable=tk_textvariable, width=tk_width, fg=fg_color, bg=bg_color
     )
@@ -376,6 +326,14 @@ def create_entry(
     return tk_entry
 
 
+@validate_input(
+    frame=ttk.Frame,
+    interval_time=int,
+    incrementation_time=float,
+    stop_time=int,
+    tk_orientation=(TkOrientation, str),
+    tk_mode=(TkMode, str),
+)
 def create_progress_bar(
     frame: ttk.Frame,
     tk_orientation: Union[TkOrientation, str] = TkOrientation.HORIZONTAL,
@@ -385,6 +343,7 @@ def create_progress_bar(
     stop_time: int = 40000,
     callable_function=None,
     tk_length: Optional[int] = None,
+    is_started: bool = True,
     **pack_options,
 ) -> ttk.Progressbar:
     """Create a tkinter progressbar that will be contained in an already existing parent frame
@@ -397,6 +356,8 @@ def create_progress_bar(
     :param stop_time: Time needed to reach to stop the progressbar. Default set to 40000 ms
     :param callable_function: Function to call after reaching the end of the progressbar
     :param tk_length: (Optional) Set progressbar length.
+    :param is_started: (Optional) Start the progressbar and its countdown.
+    Default set to True
     :param pack_options: Configuration options to pack the created progressbar.
     Only pack options are expected.
 
@@ -404,22 +365,12 @@ def create_progress_bar(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [
-        (frame, ttk.Frame),
-        (interval_time, int),
-        (incrementation_time, float),
-        (stop_time, int),
-        (tk_orientation, (TkOrientation, str)),
-        (tk_mode, (TkMode, str)),
-    ]
-    check_input(inputs_to_check)
-
     tk_progress_bar = ttk.Progressbar(
         frame, orient=tk_orientation, mode=tk_mode, length=tk_length
     )
-    tk_progress_bar.start(interval_time)
-    tk_progress_bar.step(incrementation_time)
+    if is_started:
+        tk_progress_bar.start(interval_time)
+        tk_progress_bar.step(incrementation_time)
     try:
         tk_progress_bar.pack(
             fill=pack_options.get("fill"),
@@ -433,14 +384,15 @@ def create_progress_bar(
     except:  # to test
         raise PackErrors
 
-    if callable_function:
+    if is_started and callable_function:
         tk_progress_bar.after(stop_time, callable_function)
-    else:
+    elif is_started:
         tk_progress_bar.after(stop_time, tk_progress_bar.stop)
 
     return tk_progress_bar
 
 
+@validate_input(frame=ttk.Frame, text=str, fg_color=str, bg_color=str)
 def create_button(
     frame: ttk.Frame,
     text: str,
@@ -464,15 +416,6 @@ def create_button(
 
     :raise TypeError: Error raised when input type is different from expected type"""
 
-    # check input
-    inputs_to_check = [
-        (frame, ttk.Frame),
-        (text, str),
-        (fg_color, str),
-        (bg_color, str),
-    ]
-    check_input(inputs_to_check)
-
     if not callable_function:
         callable_function = frame.quit
 
@@ -540,6 +483,13 @@ class GamePresentationTemplate(ttk.Frame):
         }
         self._nber_frames = len(self.config_frames)
 
+    @validate_input(
+        frame=ttk.Frame,
+        width=(int, type(None)),
+        height=(int, type(None)),
+        fg_color=str,
+        bg_color=str,
+    )
     def scrolling_text(
         self,
         frame: ttk.Frame,
@@ -556,15 +506,6 @@ class GamePresentationTemplate(ttk.Frame):
         :param heigth: (Optional) define the scrowling text box heigth. Default set to None
         :param fg_color: (Optiobal) Customized foregroung button color
         :param bg_color: (Optiobal) Customized backgroung button color"""
-        inputs_to_check = [
-            (frame, ttk.Frame),
-            (width, (int, type(None))),
-            (height, (int, type(None))),
-            (fg_color, str),
-            (bg_color, str),
-        ]
-        check_input(inputs_to_check)
-
         scrolling_text = ScrolledText(frame, width=width, height=height)
         scrolling_text.insert(tk.END, self.presentation_text)
         scrolling_text.pack(fill=tk.BOTH, side=tk.TOP, expand=True, padx=5)
@@ -574,6 +515,9 @@ class GamePresentationTemplate(ttk.Frame):
             background=bg_color,
         )
 
+    @validate_input(
+        frame=ttk.Frame, button_position=str, fg_color=str, bg_color=str
+    )
     def start_button(
         self,
         frame: ttk.Frame,
@@ -591,24 +535,18 @@ class GamePresentationTemplate(ttk.Frame):
         :param fg_color: (Optiobal) Customized foregroung button color
         :param bg_color: (Optiobal) Customized backgroung button color"""
 
-        inputs_to_check = [
-            (frame, ttk.Frame),
-            (button_position, str),
-            (fg_color, str),
-            (bg_color, str),
-        ]
-        check_input(inputs_to_check)
-
         start_button = tk.Button(
             frame, text=start_text, command=func, fg=fg_color, bg=bg_color
         )
         start_button.pack(side=button_position, ipadx=15, ipady=5, pady=20)
 
+    @validate_input(frame_style=str)
     def template_launcher(self, frame_style: str = StyleNamesCustomized.tframe):
-        """Default function to call to call the template window
+        """Default function to call to call the template window.
+        Widgets are only created on the first call, the presentation never changes.
         :param frame_style: (Optiobal) Customized style frame, see ttk.Style"""
-        inputs_to_check = (frame_style, str)
-        check_input(inputs_to_check)
+        if self.frames:
+            return
         # create frames
         for nber in range(self._nber_frames):
             frame = create_frame(
@@ -673,13 +611,8 @@ class GamePageTemplate(ttk.Frame):
         self.entry_imperfect.delete(0, "end")
         self.entry_preterite.delete(0, "end")
 
-    def template_launcher(self, infinitive_verb: str, left_verb_nb: int, score: int):
-        """Default function to call to call the template window
-        :param infinitive_verb: Infinitive verb
-        :param left_verb_nb: Number of left verb to find
-        :param score: current score"""
-        inputs_to_check = [(infinitive_verb, str), (left_verb_nb, int), (score, int)]
-        check_input(inputs_to_check)
+    def _build_widgets(self):
+        """Create the frames and widgets of the page, only done one time"""
         # create frames
         for nber in range(self._nber_frames):
             frame = create_frame(
@@ -690,8 +623,6 @@ class GamePageTemplate(ttk.Frame):
             )
             self.frames.append(frame)
 
-        left_verbs = remain_verbs_text + str(left_verb_nb)
-        current_score = score_text + str(score)
         # create widgets
 
         self.label_game = create_label(
@@ -714,12 +645,11 @@ class GamePageTemplate(ttk.Frame):
 
         self.text_infinitive = create_text(
             self.frames[1],
-            text=infinitive_verb,
+            text="",
             tk_width=30,
             side=TkSide.LEFT,
             padx=10,
         )
-        self.text_infinitive.focus_get()
 
         self.label_preterite = create_label(
             self.frames[2],
@@ -750,7 +680,6 @@ class GamePageTemplate(ttk.Frame):
             padx=10,
             ipadx=5,
         )
-        self.entry_preterite.focus_get()
 
         self.entry_imperfect = create_entry(
             self.frames[3],
@@ -760,18 +689,27 @@ class GamePageTemplate(ttk.Frame):
             padx=10,
             ipadx=5,
         )
-        self.entry_preterite.focus_get()
 
+        # the countdown is driven by the app (see lib.windows.countdown)
+        self.label_remain_time = create_label(
+            self.frames[4],
+            text=remain_time_text.format(seconds=""),
+            tk_width=18,
+            label_style=StyleNamesCustomized.tlabel_arial_black10,
+            tk_anchor=TkAnchorNSticky.E,
+            side=TkSide.RIGHT,
+            padx=10,
+        )
         self.progress_bar = create_progress_bar(
             self.frames[4],
             fill=tk.X,
             padx=10,
             pady=5,
-            callable_function=self.callable_func,
+            is_started=False,
         )
         self.label_remain_verbs = create_label(
             self.frames[5],
-            text=left_verbs,
+            text=remain_verbs_text,
             tk_width=25,
             label_style=StyleNamesCustomized.tlabel_arial_black10,
             tk_anchor=TkAnchorNSticky.W,
@@ -780,9 +718,9 @@ class GamePageTemplate(ttk.Frame):
             ipadx=5,
         )
 
-        self.label_remain_verbs = create_label(
+        self.label_score = create_label(
             self.frames[5],
-            text=current_score,
+            text=score_text,
             tk_width=25,
             label_style=StyleNamesCustomized.tlabel_arial_black10,
             tk_anchor=TkAnchorNSticky.E,
@@ -800,6 +738,37 @@ class GamePageTemplate(ttk.Frame):
             ipady=5,
         )
 
+    def show_remaining_time(self, remaining: float, duration: float):
+        """Update the progressbar and the remaining seconds of the countdown
+        :param remaining: seconds left to answer
+        :param duration: seconds given to answer"""
+
+        if not self.frames:
+            return
+        elapsed_ratio = 1.0 - remaining / duration if duration else 1.0
+        self.progress_bar.configure(value=100.0 * elapsed_ratio)
+        self.label_remain_time.configure(
+            text=remain_time_text.format(seconds=math.ceil(remaining))
+        )
+
+    @validate_input(infinitive_verb=str, left_verb_nb=int, score=int)
+    def template_launcher(self, infinitive_verb: str, left_verb_nb: int, score: int):
+        """Default function to call to call the template window.
+        Widgets are created on the first call, next calls only update them.
+        :param infinitive_verb: Infinitive verb
+        :param left_verb_nb: Number of left verb to find
+        :param score: current score"""
+
+        if not self.frames:
+            self._build_widgets()
+        else:
+            self.reset()
+
+        update_text(self.text_infinitive, infinitive_verb)
+        self.label_remain_verbs.configure(text=remain_verbs_text + str(left_verb_nb))
+        self.label_score.configure(text=score_text + str(score))
+        self.entry_preterite.focus_set()
+
 
 class GameStateTemplate(ttk.Frame):
     """
@@ -812,7 +781,7 @@ class GameStateTemplate(ttk.Frame):
         func: Callable,
         img_path: str = PATH_TO_POSITIVE_SMILEY,
         resize_values: tuple = (350, 300),
-        type_resize: Image.Resampling = Image.Resampling.LANCZOS,
+        type_resize: int = LANCZOS,
         text_to_display: str = success_text,
     ):
         """
@@ -822,14 +791,14 @@ class GameStateTemplate(ttk.Frame):
         :param func: Callable function
         :param img_path: Path to image. Default set to PATH_TO_POSITIVE_SMILEY
         :param resize_values: Reshape image size as (x,y). Default set to (400,350)
-        :param type_resize: See Image.Resampling. Default set to Resampling.LANCZOS
+        :param type_resize: See PIL Image.Resampling. Default set to LANCZOS
         :param text_to_display: Text to display alongside the image. Default set to success_text
         """
         inputs_to_check = [
             (parent, ttk.Frame),
             (img_path, str),
             (resize_values, tuple),
-            (type_resize, Image.Resampling),
+            (type_resize, int),
             (text_to_display, str),
         ]
         check_input(inputs_to_check)
@@ -845,11 +814,10 @@ class GameStateTemplate(ttk.Frame):
 
         self.callable_func = func
 
-        # prepare image to display
-        path_to_file = Path(img_path).resolve()
-        photo = Image.open(path_to_file)
-        photo = photo.resize(resize_values, type_resize)
-        self._tk_photo = ImageTk.PhotoImage(photo)
+        # image to display, decoded and resized on the first display,
+        # one time by process
+        self._tk_photo = None
+        self._img_options = (img_path, resize_values, type_resize)
 
         self._text_to_display = text_to_display  # add property
 
@@ -869,23 +837,21 @@ class GameStateTemplate(ttk.Frame):
         }
         self._nber_frames = len(self.config_frames)
 
-    def set_tk_photo(self, photo: ImageTk.PhotoImage):
+    def set_tk_photo(self, photo: Union[tk.PhotoImage, "ImageTk.PhotoImage"]):
         """Set directly the tk photo to use for this frame
         :param photo: image to display on the frame"""
 
-        check_input((photo, ImageTk.PhotoImage))
-        self._tk_photo(photo)
+        check_input((photo, _photo_types()))
+        self._tk_photo = photo
 
-    def get_tk_photo(self) -> ImageTk.PhotoImage:
+    def get_tk_photo(self) -> Union[tk.PhotoImage, "ImageTk.PhotoImage"]:
         """Get the current tk photo to use for this frame"""
+        if self._tk_photo is None:
+            self._tk_photo = image_cache.get_photo(self, *self._img_options)
         return self._tk_photo
 
-    def template_launcher(self, verb_to_find: dict):
-        """Default function to call to call the template window
-
-        :param verb_to_find: current tense verb used in the game"""
-        inputs_to_check = (verb_to_find, dict)
-        check_input(inputs_to_check)
+    def _build_widgets(self):
+        """Create the frames and widgets of the page, only done one time"""
 
         for nber in range(self._nber_frames):
             frame = create_frame(
@@ -897,25 +863,18 @@ class GameStateTemplate(ttk.Frame):
             )
             self.frames.append(frame)
 
-        verb_to_find_ans = (
-            f"Infinitive: {verb_to_find[TenseKey.INFINITIVE.value]},\n"
-            + f"Verb singular third form: {verb_to_find[TenseKey.THIRD_FORM.value]},\n"
-            + f"Preterite: {verb_to_find[TenseKey.PRETERITE.value]},\n"
-            + f"Perfect: {verb_to_find[TenseKey.PERFECT.value]},\n"
-            + f"Verb Level: {verb_to_find[TenseKey.LEVEL.value]}"
-        )
         self.photo_label = create_photo_label(
             self.frames[0],
-            tk_photo=self._tk_photo,
+            tk_photo=self.get_tk_photo(),
             tk_compound=TkSide.TOP,
             text=self._text_to_display,
             pady=10,
             label_style=StyleNamesCustomized.tlabel_calibri10,
         )
 
-        self.submit_button = create_label(
+        self.label_answer = create_label(
             self.frames[1],
-            text=verb_to_find_ans,
+            text="",
             anchor=TkAnchorNSticky.NW,
             label_style=StyleNamesCustomized.tlabel_arial_black10,
             side=TkSide.LEFT,
@@ -936,6 +895,31 @@ class GameStateTemplate(ttk.Frame):
             bg_color=VlColors.green_water,
         )
 
+    @validate_input(verb_to_find=Mapping, hint=str)
+    def template_launcher(self, verb_to_find: Mapping, hint: str = ""):
+        """Default function to call to call the template window.
+        Widgets are created on the first call, next calls only update them.
+
+        :param verb_to_find: current tense verb used in the game
+        :param hint: (Optional) Text displayed under the template text,
+        e.g typos of the player. Default set to empty"""
+
+        if not self.frames:
+            self._build_widgets()
+
+        verb_to_find_ans = (
+            f"Infinitive: {verb_to_find[TenseKey.INFINITIVE.value]},\n"
+            + f"Verb singular third form: {verb_to_find[TenseKey.THIRD_FORM.value]},\n"
+            + f"Preterite: {verb_to_find[TenseKey.PRETERITE.value]},\n"
+            + f"Perfect: {verb_to_find[TenseKey.PERFECT.value]},\n"
+            + f"Verb Level: {verb_to_find[TenseKey.LEVEL.value]}"
+        )
+        self.photo_label.configure(
+            image=self._tk_photo,
+            text=f"{self._text_to_display}\n{hint}" if hint else self._text_to_display,
+        )
+        self.label_answer.configure(text=verb_to_find_ans)
+
 
 class GameFailedTemplate(GameStateTemplate):
     """
@@ -948,7 +932,7 @@ class GameFailedTemplate(GameStateTemplate):
         func: Callable,
         img_path: str = PATH_TO_SAD_SMILEY_2,
         resize_values: tuple = (350, 300),
-        type_resize: Image.Resampling = Image.Resampling.LANCZOS,
+        type_resize: int = LANCZOS,
         text_to_display: str = failed_text,
     ):
         """
@@ -958,7 +942,7 @@ class GameFailedTemplate(GameStateTemplate):
         :param func: Callable function
         :param img_path: Path to image. Default set to PATH_TO_SAD_SMILEY
         :param resize_values: Reshape image size as (x,y). Default set to (400,350)
-        :param type_resize: See Image.Resampling. Default set to Resampling.LANCZOS
+        :param type_resize: See PIL Image.Resampling. Default set to LANCZOS
         :param text_to_display: Text to display alongside the image.
         Default set to failed_text
         """
@@ -979,7 +963,7 @@ class GameSuccessTemplate(GameStateTemplate):
         func: Callable,
         img_path: str = PATH_TO_THUM_UP_SMILEY,
         resize_values: tuple = (350, 300),
-        type_resize: Image.Resampling = Image.Resampling.LANCZOS,
+        type_resize: int = LANCZOS,
         text_to_display: str = success_text,
     ):
         """
@@ -989,7 +973,7 @@ class GameSuccessTemplate(GameStateTemplate):
         :param func: Callable function
         :param img_path: Path to image. Default set to PATH_TO_SAD_SMILEY
         :param resize_values: Reshape image size as (x,y). Default set to (400,350)
-        :param type_resize: See Image.Resampling. Default set to Resampling.LANCZOS
+        :param type_resize: See PIL Image.Resampling. Default set to LANCZOS
         :param text_to_display: Text to display alongside the image. Default set to success_text
         """
 
@@ -1032,15 +1016,8 @@ class GameConclusionTemplate(ttk.Frame):
         }
         self._nber_frames = len(self.config_frames)
 
-    def template_launcher(self, score: int):
-        """Default function to call to call the template window
-        :param score: player score"""
-        inputs_to_check = (score, int)
-        check_input(inputs_to_check)
-
-        _score = str(score) + "/20"
-        # _end_score = score_text + _score # choice was to use label and text
-        # but only label can be used, if yes should use _end_score
+    def _build_widgets(self):
+        """Create the frames and widgets of the page, only done one time"""
 
         # create frames
         for nber in range(self._nber_frames):
@@ -1075,7 +1052,7 @@ class GameConclusionTemplate(ttk.Frame):
 
         self.text_final_score = create_text(
             self.frames[1],
-            text=_score,
+            text="",
             tk_width=8,
             bg_color=VlColors.blue_green,
             side=TkSide.LEFT,
@@ -1096,7 +1073,7 @@ class GameConclusionTemplate(ttk.Frame):
 
         self.text_grade = create_text(
             self.frames[2],
-            text=get_player_grade(score).name,
+            text="",
             tk_width=12,
             side=TkSide.LEFT,
             tk_anchor=TkAnchorNSticky.CENTER,
@@ -1107,7 +1084,7 @@ class GameConclusionTemplate(ttk.Frame):
 
         self.grade_message = create_text(
             self.frames[3],
-            text=get_player_grade(score).value,
+            text="",
             fill=tk.BOTH,
             tk_height=3,
             tk_anchor=TkAnchorNSticky.W,
@@ -1135,6 +1112,24 @@ class GameConclusionTemplate(ttk.Frame):
             callable_function=self.callable_func,
         )
 
+    @validate_input(score=int)
+    def template_launcher(self, score: int):
+        """Default function to call to call the template window.
+        Widgets are created on the first call, next calls only update them.
+        :param score: player score"""
+
+        _score = str(score) + "/20"
+        # _end_score = score_text + _score # choice was to use label and text
+        # but only label can be used, if yes should use _end_score
+
+        if not self.frames:
+            self._build_widgets()
+
+        grade = get_player_grade(score)
+        update_text(self.text_final_score, _score)
+        update_text(self.text_grade, grade.name)
+        update_text(self.grade_message, grade.value)
+
 
 def change_frame():
     global frame_root, pr
@@ -0,0 +1,28 @@
+""" Benchmarks for VerbenLernen App
+Each module can be launched from the root project, e.g:
+    python -m scripts.benchmarks.verb_memory"""
+
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+
+ROOT_PROJECT = Path(__file__).resolve().parents[2]
+
+
+def current_commit() -> Optional[str]:
+    """Commit of the benchmarked code, to compare the results of two commits
+
+    :return: commit hash, None outside of a git repository (str)"""
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_PROJECT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
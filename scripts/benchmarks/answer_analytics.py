@@ -0,0 +1,137 @@
+""" Latency analytics of lib.game.analytics on a synthetic answers history:
+    - store_read: PlayerStore.answer_times of all the answers
+    - from_rows: AnswerTimes.from_rows, rows to NumPy columns
+    - latency_by_verb: percentiles and error rate of each verb
+    - latency_by_level: percentiles and error rate of each level
+Response times are log-normal, one answer over twenty is not timed (answers
+saved before the response times). Time of the median run, in seconds.
+
+Launch from the root project:
+    python -m scripts.benchmarks.answer_analytics --answers 1000000"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from lib.edit.player_store import PlayerStore
+from lib.game.analytics import AnswerTimes, latency_by_level, latency_by_verb
+from scripts.benchmarks import current_commit
+from scripts.benchmarks.synthetic import synthetic_records
+
+
+def synthetic_answers(answers: int, verbs: int, seed: int = 0) -> List[tuple]:
+    """Fake answers of the verbs of a synthetic corpus
+
+    :param answers: number of answers
+    :param verbs: number of verbs of the corpus
+    :param seed: (Optional) seed of the random generator. Default set to 0
+
+    :return: (infinitive, level, is_correct, response_time) rows (list)"""
+
+    rng = np.random.default_rng(seed)
+    records = list(synthetic_records(verbs, seed))
+    verb_indexes = rng.integers(0, verbs, answers)
+    is_correct = rng.random(answers) < 0.7
+    response_times = rng.lognormal(2.0, 0.6, answers).round(3)
+    is_timed = rng.random(answers) >= 0.05
+    return [
+        (
+            records[index][0],
+            records[index][5],
+            int(correct),
+            float(response_time) if timed else None,
+        )
+        for index, correct, response_time, timed in zip(
+            verb_indexes.tolist(),
+            is_correct.tolist(),
+            response_times.tolist(),
+            is_timed.tolist(),
+        )
+    ]
+
+
+def write_store(path_to_db: str, rows: List[tuple]):
+    """Save the answers in a new player store, as games of 20 verbs"""
+
+    store = PlayerStore(path_to_db, batch_size=100_000)
+    game_id = None
+    for index, (infinitive, level, is_correct, response_time) in enumerate(rows):
+        if index % 20 == 0:
+            game_id = store.start_game("player", 20)
+        store.record_answer(
+            game_id,
+            "player",
+            {"infinitive": infinitive, "level": level},
+            bool(is_correct),
+            0,
+            response_time=response_time,
+        )
+    store.close()
+
+
+def median_time(run_once: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_once()
+        times.append(time.perf_counter() - start)
+    return round(statistics.median(times), 6)
+
+
+def run(answers: int, verbs: int, repeat: int) -> dict:
+    """Time the analytics of answers answers
+    :param answers: number of answers of the history
+    :param verbs: number of verbs of the corpus
+    :param repeat: number of timed runs"""
+
+    rows = synthetic_answers(answers, verbs)
+    columns = AnswerTimes.from_rows(rows)
+    results = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "answers": answers,
+        "verbs": verbs,
+        "repeat": repeat,
+        "median_s": {},
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path_to_db = os.path.join(directory, "players.sqlite3")
+        write_store(path_to_db, rows)
+        store = PlayerStore(path_to_db)
+        results["median_s"]["store_read"] = median_time(store.answer_times, repeat)
+        store.close()
+
+    results["median_s"]["from_rows"] = median_time(
+        lambda: AnswerTimes.from_rows(rows), repeat
+    )
+    results["median_s"]["latency_by_verb"] = median_time(
+        lambda: latency_by_verb(columns), repeat
+    )
+    results["median_s"]["latency_by_level"] = median_time(
+        lambda: latency_by_level(columns), repeat
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--answers", type=int, default=1_000_000)
+    parser.add_argument("--verbs", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="JSON file, printed if not set")
+    args = parser.parse_args()
+
+    results = run(args.answers, args.verbs, args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
@@ -0,0 +1,317 @@
+""" Data layer hot paths on synthetic corpora of several sizes:
+    - read_txt: Editfile.read_txt of the whole corpus
+    - add_txt_in_file_first: first add of an Editfile, known verbs indexed
+    - add_txt_in_file: next adds, known verbs already indexed
+    - clean_file: clean of a corpus with unwanted characters (file rewritten)
+    - clean_file_unchanged: clean of an already clean corpus (one operation)
+    - handler_init_compile: HandlerTenseVerbs.__init__, corpus compiled
+      (one operation by verb)
+    - handler_init: HandlerTenseVerbs.__init__, compiled corpus reused
+    - select_verb: HandlerTenseVerbs.select_verb of all verbs of a game
+    - get_player_grade: grade of every score
+For each benchmark: throughput (operations by second, on the median run),
+bytes allocated during one run and still allocated after it (tracemalloc),
+and peak RSS of the process. Each benchmark of each size runs in its own
+interpreter, so peak RSS is not shared between benchmarks.
+
+Launch from the root project:
+    python -m scripts.benchmarks.data_layer --output data_layer.json"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional
+
+from lib.edit.corpus import compiled_path_for
+from lib.edit.editfile import Editfile
+from lib.game.grade import get_player_grade
+from lib.game.verbs_handler import HandlerTenseVerbs
+from scripts import clean_file
+from scripts.benchmarks import ROOT_PROJECT, current_commit
+from scripts.benchmarks.synthetic import synthetic_records, write_synthetic_corpus
+from scripts.file_cleaner import CLEAN_STATE_EXTENSION
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+MAX_GAME = 20
+ADDED_VERBS = 1000
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of the process in KB, None if unknown"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KB on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def write_dirty_corpus(path_to_file: str, size: int):
+    """Write a fake corpus where one verb over ten has unwanted characters,
+    e.g "verb0en* (verb0t)"
+    :param path_to_file: path to the corpus to create
+    :param size: number of verbs"""
+
+    lines = []
+    for index, record in enumerate(synthetic_records(size)):
+        if index % 10 == 0:
+            record = (record[0] + "*", f"({record[1]})") + record[2:]
+        lines.append(" ".join(record))
+    with open(path_to_file, "w", encoding="utf-8") as txt_file:
+        txt_file.write("\n".join(lines))
+
+
+def measure(
+    run_once: Callable[[], object],
+    operations: int,
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> dict:
+    """Time run_once repeat times, then trace the allocations of one more run
+
+    :param run_once: benchmarked code, doing operations operations
+    :param operations: number of operations of one run
+    :param repeat: number of timed runs
+    :param setup: (Optional) called before each run, not timed
+
+    :return: throughput and allocations (dict)"""
+
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run_once()
+        times.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    run_once()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "operations": operations,
+        "repeat": repeat,
+        "median_s": round(median, 6),
+        "min_s": round(min(times), 6),
+        "ops_per_s": round(operations / median, 1) if median else None,
+        "allocated_peak_bytes": peak,
+        "allocated_retained_bytes": retained,
+    }
+
+
+def _new_row(index: int) -> list:
+    stem = f"neuverb{index}"
+    return [stem + "en", stem + "t", stem + "te", f"hat ge{stem}t", "A1"]
+
+
+def bench_read_txt(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    return measure(lambda: Editfile(paths["corpus"]).read_txt(), size, repeat)
+
+
+def bench_add_txt_in_file_first(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    state = {}
+
+    def setup():
+        shutil.copyfile(paths["corpus"], paths["work"])
+        state["editfile"] = Editfile(paths["work"])
+
+    return measure(
+        lambda: state["editfile"].add_txt_in_file(_new_row(0)), 1, repeat, setup
+    )
+
+
+def bench_add_txt_in_file(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    state = {}
+
+    def setup():
+        shutil.copyfile(paths["corpus"], paths["work"])
+        state["editfile"] = Editfile(paths["work"])
+        state["editfile"].infinitive_index
+
+    def run_once():
+        editfile = state["editfile"]
+        for index in range(ADDED_VERBS):
+            editfile.add_txt_in_file(_new_row(index))
+
+    return measure(run_once, ADDED_VERBS, repeat, setup)
+
+
+def bench_clean_file(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    def setup():
+        shutil.copyfile(paths["dirty"], paths["work"])
+        if os.path.exists(paths["work"] + CLEAN_STATE_EXTENSION):
+            os.unlink(paths["work"] + CLEAN_STATE_EXTENSION)
+
+    return measure(lambda: clean_file(paths["work"]), size, repeat, setup)
+
+
+def bench_clean_file_unchanged(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    shutil.copyfile(paths["dirty"], paths["work"])
+    clean_file(paths["work"])
+    return measure(lambda: clean_file(paths["work"]), 1, repeat)
+
+
+def bench_handler_init_compile(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    def setup():
+        if os.path.exists(compiled_path_for(paths["corpus"])):
+            os.unlink(compiled_path_for(paths["corpus"]))
+
+    return measure(
+        lambda: HandlerTenseVerbs(paths["corpus"], MAX_GAME), size, repeat, setup
+    )
+
+
+def bench_handler_init(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    HandlerTenseVerbs(paths["corpus"], MAX_GAME)  # compile the corpus
+    return measure(lambda: HandlerTenseVerbs(paths["corpus"], MAX_GAME), 1, repeat)
+
+
+def bench_select_verb(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    state = {}
+
+    def setup():
+        state["handler"] = HandlerTenseVerbs(paths["corpus"], MAX_GAME)
+
+    def run_once():
+        select_verb = state["handler"].select_verb
+        for _ in range(MAX_GAME):
+            select_verb()
+
+    return measure(run_once, MAX_GAME, repeat, setup)
+
+
+def bench_get_player_grade(paths: Dict[str, str], size: int, repeat: int) -> dict:
+    scores = list(range(MAX_GAME + 1)) * 1000
+
+    def run_once():
+        for score in scores:
+            get_player_grade(score)
+
+    return measure(run_once, len(scores), repeat)
+
+
+BENCHMARKS = {
+    "read_txt": bench_read_txt,
+    "add_txt_in_file_first": bench_add_txt_in_file_first,
+    "add_txt_in_file": bench_add_txt_in_file,
+    "clean_file": bench_clean_file,
+    "clean_file_unchanged": bench_clean_file_unchanged,
+    "handler_init_compile": bench_handler_init_compile,
+    "handler_init": bench_handler_init,
+    "select_verb": bench_select_verb,
+    "get_player_grade": bench_get_player_grade,
+}
+
+
+def run_benchmark(name: str, directory: str, size: int, repeat: int) -> dict:
+    """Run one benchmark in the current process
+    :param name: BENCHMARKS key
+    :param directory: directory of the corpora of this size (see write_corpora)
+    :param size: number of verbs of the corpora
+    :param repeat: number of timed runs"""
+
+    paths = {
+        "corpus": os.path.join(directory, "corpus.txt"),
+        "dirty": os.path.join(directory, "dirty.txt"),
+        "work": os.path.join(directory, "work.txt"),
+    }
+    baseline_rss = peak_rss_kb()
+    result = BENCHMARKS[name](paths, size, repeat)
+    result["baseline_rss_kb"] = baseline_rss
+    result["peak_rss_kb"] = peak_rss_kb()
+    return result
+
+
+def write_corpora(directory: str, size: int):
+    """Write the clean and dirty corpora of a size
+    :param directory: existing directory
+    :param size: number of verbs"""
+
+    write_synthetic_corpus(os.path.join(directory, "corpus.txt"), size)
+    write_dirty_corpus(os.path.join(directory, "dirty.txt"), size)
+
+
+def run(sizes, repeat: int, benchmarks=tuple(BENCHMARKS)) -> dict:
+    """Run the benchmarks on each size, each one in a new interpreter
+    :param sizes: numbers of verbs of the corpora
+    :param repeat: number of timed runs of each benchmark
+    :param benchmarks: (Optional) BENCHMARKS keys. Default set to all"""
+
+    results = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {},
+    }
+    for size in sizes:
+        results["sizes"][str(size)] = size_results = {}
+        with tempfile.TemporaryDirectory() as directory:
+            # the peak RSS of a process is inherited by the processes it starts:
+            # this process should stay small, corpora are written by a child too
+            _run_child(["--write-corpora"], directory, size, repeat)
+            for name in benchmarks:
+                size_results[name] = json.loads(
+                    _run_child(["--child", name], directory, size, repeat)
+                )
+    return results
+
+
+def _run_child(arguments: list, directory: str, size: int, repeat: int) -> str:
+    """Run this module in a new interpreter, return its standard output"""
+    completed = subprocess.run(
+        [sys.executable, "-m", "scripts.benchmarks.data_layer", *arguments]
+        + ["--directory", directory, "--sizes", str(size), "--repeat", str(repeat)],
+        cwd=ROOT_PROJECT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS)
+    )
+    parser.add_argument("--output", default=None, help="JSON file, printed if not set")
+    # internal: run one benchmark in this interpreter
+    parser.add_argument("--child", choices=list(BENCHMARKS), help=argparse.SUPPRESS)
+    parser.add_argument("--write-corpora", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--directory", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.write_corpora:
+        write_corpora(args.directory, args.sizes[0])
+    elif args.child:
+        result = run_benchmark(args.child, args.directory, args.sizes[0], args.repeat)
+        print(json.dumps(result))
+    else:
+        results = run(args.sizes, args.repeat, args.benchmarks)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as json_file:
+                json.dump(results, json_file, indent=2)
+        else:
+            print(json.dumps(results, indent=2))
@@ -0,0 +1,137 @@
+""" Latency of a page transition (game page -> success or failed page -> game
+page), with the two strategies of VerbenLernenApp.switch_frame:
+    - rebuild: destroy the current page and create a new template, as
+      done before pages were kept
+    - persistent: one instance of each page, unpacked and packed again
+Each transition is timed until Tk has processed its idle tasks (geometry
+and redraw), which is what the player waits for.
+
+Needs a display, e.g Xvfb. Launch from the root project:
+    python -m scripts.benchmarks.frame_transitions --rounds 200"""
+
+import argparse
+import json
+import statistics
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List
+
+from lib.constant_values import TkFilling, TkSide
+from lib.edit.verb import Verb
+from lib.windows import GameFailedTemplate, GamePageTemplate, GameSuccessTemplate
+from lib.windows.templates import configure_style
+
+
+VERB = Verb("fahren", "fährt", "fuhr", "ist", "gefahren", "A1")
+
+
+def _noop():
+    pass
+
+
+def _summary(latencies: List[float]) -> dict:
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "transitions": len(latencies),
+        "median_ms": round(statistics.median(latencies) * 1e3, 3),
+        "p95_ms": round(quantiles[94] * 1e3, 3),
+        "max_ms": round(max(latencies) * 1e3, 3),
+    }
+
+
+def _show(root: tk.Tk, launch: Callable) -> float:
+    start = time.perf_counter()
+    launch()
+    root.update_idletasks()
+    return time.perf_counter() - start
+
+
+def run_rebuild(root: tk.Tk, container: ttk.Frame, rounds: int) -> List[float]:
+    """Destroy the current page and create the next one at each transition"""
+
+    latencies = []
+    page = GamePageTemplate(container, _noop)
+    page.template_launcher(VERB.infinitive, rounds, 0)
+    for nber in range(rounds):
+        state_class = GameSuccessTemplate if nber % 2 else GameFailedTemplate
+
+        def launch_state():
+            nonlocal page
+            page.destroy()
+            page = state_class(container, _noop)
+            page.template_launcher(VERB)
+
+        def launch_game():
+            nonlocal page
+            page.destroy()
+            page = GamePageTemplate(container, _noop)
+            page.template_launcher(VERB.infinitive, rounds - nber, nber)
+
+        latencies.append(_show(root, launch_state))
+        latencies.append(_show(root, launch_game))
+    page.destroy()
+    return latencies
+
+
+def run_persistent(root: tk.Tk, container: ttk.Frame, rounds: int) -> List[float]:
+    """Keep one instance of each page, only pack the current one"""
+
+    game_page = GamePageTemplate(container, _noop)
+    state_pages = (
+        GameFailedTemplate(container, _noop),
+        GameSuccessTemplate(container, _noop),
+    )
+    for page in state_pages:
+        page.pack_forget()
+    game_page.template_launcher(VERB.infinitive, rounds, 0)
+
+    def switch(hidden: ttk.Frame, shown: ttk.Frame):
+        hidden.pack_forget()
+        shown.pack(side=TkSide.TOP, fill=TkFilling.BOTH, expand=True)
+        shown.tkraise()
+
+    latencies = []
+    for nber in range(rounds):
+        state_page = state_pages[nber % 2]
+
+        def launch_state():
+            switch(game_page, state_page)
+            state_page.template_launcher(VERB)
+
+        def launch_game():
+            switch(state_page, game_page)
+            game_page.template_launcher(VERB.infinitive, rounds - nber, nber)
+
+        latencies.append(_show(root, launch_state))
+        latencies.append(_show(root, launch_game))
+
+    for page in (game_page, *state_pages):
+        page.destroy()
+    return latencies
+
+
+def run(rounds: int) -> dict:
+    """Time both strategies on the same Tk root
+    :param rounds: number of game page -> state page -> game page rounds"""
+
+    root = tk.Tk()
+    root.geometry("550x500")
+    container = ttk.Frame(root)
+    container.pack(side=TkSide.TOP, fill=TkFilling.BOTH, expand=True)
+    configure_style(container)
+    try:
+        return {
+            "rebuild": _summary(run_rebuild(root, container, rounds)),
+            "persistent": _summary(run_persistent(root, container, rounds)),
+        }
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rounds), indent=2))
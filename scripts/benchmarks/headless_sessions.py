@@ -0,0 +1,72 @@
+""" Cost of the game logic alone: full GameSession games without display.
+Each session selects its verbs, answers all of them (one answer over two
+is correct) and finishes. The corpus is opened once, before the timing, and
+shared by all the sessions.
+
+Launch from the root project:
+    python -m scripts.benchmarks.headless_sessions --sessions 5000"""
+
+import argparse
+import json
+import time
+
+from lib.constant_values import TenseKey
+from lib.edit import STARKE_UNREGELMEASSIE
+from lib.edit.corpus import CompiledCorpus
+from lib.edit.editfile import Editfile
+from lib.game import GameSession, HandlerTenseVerbs
+from scripts import clean_file
+
+
+def play_session(corpus: CompiledCorpus, seed: int, max_game: int = 20) -> int:
+    """Play one full headless game
+    :param corpus: opened corpus, shared by the sessions
+    :param seed: seed of the verbs selection
+    :param max_game: number of verbs to play
+
+    :return: final score (int)"""
+
+    session = GameSession(
+        HandlerTenseVerbs(max_game=max_game, seed=seed, corpus=corpus)
+    )
+    answer_nb = 0
+    while not session.is_finished:
+        verb = session.current_verb
+        if answer_nb % 2:
+            session.submit(verb[TenseKey.PERFECT.value], verb[TenseKey.PRETERITE.value])
+        else:
+            session.submit("", "")
+        session.next_verb()
+        answer_nb += 1
+    return session.score
+
+
+def run(sessions: int, max_game: int = 20) -> dict:
+    """Play sessions headless games and measure the throughput
+    :param sessions: number of games
+    :param max_game: number of verbs per game"""
+
+    clean_file()
+    corpus = Editfile(STARKE_UNREGELMEASSIE).load_corpus()
+
+    start = time.perf_counter()
+    for seed in range(sessions):
+        play_session(corpus, seed, max_game)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "sessions": sessions,
+        "max_game": max_game,
+        "elapsed_s": round(elapsed, 4),
+        "sessions_per_s": round(sessions / elapsed, 1),
+        "us_per_answer": round(elapsed / (sessions * max_game) * 1e6, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--max-game", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sessions, args.max_game), indent=2))
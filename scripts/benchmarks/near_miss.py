@@ -0,0 +1,66 @@
+""" Cost of the near-miss classification of wrong answers, for growing
+corpora of random verb stems: typo, exact form of another verb (dict
+lookup), misspelled form of another verb (deletion index search) and wrong answer.
+
+Launch from the root project:
+    python -m scripts.benchmarks.near_miss --sizes 100 10000 100000"""
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, List
+
+from lib.edit.verb import Verb
+from lib.game.near_miss import NearMissClassifier
+from scripts.benchmarks.synthetic import synthetic_records
+
+
+def _time_per_call(function: Callable, calls: List[tuple]) -> float:
+    """Mean time of function(*args) in microseconds"""
+    start = time.perf_counter()
+    for args in calls:
+        function(*args)
+    return round((time.perf_counter() - start) / len(calls) * 1e6, 2)
+
+
+def run(size: int, queries: int = 200, seed: int = 0) -> dict:
+    """Build a classifier of size verbs and time each kind of answer
+    :param size: number of verbs
+    :param queries: number of answers of each kind
+    :param seed: seed of the corpus and the answers"""
+
+    records = list(synthetic_records(size, seed, random_stems=True))
+    start = time.perf_counter()
+    classifier = NearMissClassifier(records)
+    build = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    verbs = [Verb(*rng.choice(records)) for _ in range(queries)]
+    others = [rng.choice(records) for _ in range(queries)]
+    answers = {
+        "typo": [
+            (verb, verb.perfect[:-1] + "x", verb.preterite + "q") for verb in verbs
+        ],
+        "other_verb": [
+            (verb, other[4], other[2]) for verb, other in zip(verbs, others)
+        ],
+        "misspelled_other_verb": [
+            (verb, other[4] + "x", other[2] + "x") for verb, other in zip(verbs, others)
+        ],
+        "wrong": [(verb, "hat qqqqqqqq", "qqqqqq") for verb in verbs],
+    }
+
+    result = {"verbs": size, "build_s": round(build, 3)}
+    for kind, calls in answers.items():
+        result[f"{kind}_us"] = _time_per_call(classifier.classify, calls)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    print(json.dumps([run(size, args.queries) for size in args.sizes], indent=2))
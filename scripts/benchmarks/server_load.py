@@ -0,0 +1,138 @@
+""" Load test of the quiz server: many concurrent clients play full games
+over keep-alive HTTP connections. Reports the finished sessions per second
+and the answer latency percentiles seen by the clients.
+
+Launch from the root project (the server is started in the same process,
+on a free port, unless --port is given):
+    python -m scripts.benchmarks.server_load --clients 50 --sessions 1000"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import List, Optional
+
+from lib.server import QuizServer
+
+
+async def request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: Optional[dict] = None,
+) -> dict:
+    """Send one HTTP request on a keep-alive connection, return the JSON body"""
+
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n".encode(
+            "latin-1"
+        )
+        + payload
+    )
+    await writer.drain()
+
+    await reader.readline()  # status line
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(
+    port: int, games: int, max_game: int, latencies: List[float], answers: dict
+):
+    """Play games full games, answers are not known by the client so all are wrong"""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(games):
+        state = await request(
+            reader,
+            writer,
+            "POST",
+            "/sessions",
+            {"player": "load", "max_game": max_game},
+        )
+        session_id = state["session_id"]
+        while not state["finished"]:
+            body = {"perfect": "", "preterite": ""}
+            start = time.perf_counter()
+            state = await request(
+                reader, writer, "POST", f"/sessions/{session_id}/answer", body
+            )
+            latencies.append(time.perf_counter() - start)
+        await request(reader, writer, "DELETE", f"/sessions/{session_id}")
+        answers["sessions"] += 1
+    writer.close()
+
+
+async def run(
+    clients: int, sessions: int, max_game: int = 20, port: Optional[int] = None
+) -> dict:
+    """Play sessions games spread over clients concurrent connections
+
+    :param clients: number of concurrent connections
+    :param sessions: total number of games
+    :param max_game: number of verbs per game
+    :param port: (Optional) port of a running server. Default set to None,
+    a server is started in this process"""
+
+    server = None
+    if port is None:
+        server = QuizServer()
+        await server.start(port=0)
+        port = server.port
+
+    latencies: List[float] = []
+    answers = {"sessions": 0}
+    games_per_client = [
+        sessions // clients + (nber < sessions % clients) for nber in range(clients)
+    ]
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            client(port, games, max_game, latencies, answers)
+            for games in games_per_client
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        await server.stop()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "clients": clients,
+        "sessions": answers["sessions"],
+        "max_game": max_game,
+        "elapsed_s": round(elapsed, 4),
+        "sessions_per_s": round(answers["sessions"] / elapsed, 1),
+        "answers_per_s": round(len(latencies) / elapsed, 1),
+        "answer_latency_p50_ms": round(quantiles[49] * 1e3, 3),
+        "answer_latency_p99_ms": round(quantiles[98] * 1e3, 3),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--max-game", type=int, default=20)
+    parser.add_argument("--port", type=int, default=None)
+    args = parser.parse_args()
+
+    print(
+        json.dumps(
+            asyncio.run(run(args.clients, args.sessions, args.max_game, args.port)),
+            indent=2,
+        )
+    )
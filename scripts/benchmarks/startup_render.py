@@ -0,0 +1,347 @@
+""" Startup and render latency of VerbenLernenApp, run under a virtual display:
+    - import_time: `python -X importtime -c "import VerbenLernen"`, total and
+      self time of the slowest modules and of each top-level package
+    - first_frame: from the process spawn (and from the app import) until the
+      presentation page is viewable, in a new interpreter for each run
+    - template_launcher: render time of each page template, on its first
+      launch (widgets created) and on the next ones (widgets updated)
+    - round_transition: game page -> success or failed page -> game page,
+      driven by the app itself
+Render times are measured until Tk has processed its idle tasks (geometry
+and redraw). Results are written as JSON, with the commit they were
+measured on, so that two commits can be compared.
+
+Xvfb is started when there is no display. Launch from the root project:
+    python -m scripts.benchmarks.startup_render --output startup_render.json"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter as tk
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from tkinter import ttk
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from lib.constant_values import TenseKey, TkFilling, TkSide
+from lib.edit.verb import Verb
+from scripts.benchmarks import ROOT_PROJECT, current_commit
+
+
+VERB = Verb("fahren", "fährt", "fuhr", "ist", "gefahren", "A1")
+
+# run by a new interpreter: prints the monotonic times of its first frame
+FIRST_FRAME_PROBE = """
+import json, time
+start = time.monotonic()
+from VerbenLernen import VerbenLernenApp
+imported = time.monotonic()
+app = VerbenLernenApp(review_state=None, player_store=None)
+while not app.presentation_page.winfo_viewable():
+    app.update()
+app.update_idletasks()
+first_frame = time.monotonic()
+app.destroy()
+print(json.dumps({"start": start, "imported": imported, "first_frame": first_frame}))
+"""
+
+
+def _noop():
+    pass
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1e3, 3)
+
+
+def _summary(latencies: List[float]) -> dict:
+    summary = {
+        "runs": len(latencies),
+        "median_ms": _ms(statistics.median(latencies)),
+        "max_ms": _ms(max(latencies)),
+    }
+    if len(latencies) > 1:
+        summary["p95_ms"] = _ms(statistics.quantiles(latencies, n=100)[94])
+    return summary
+
+
+@contextmanager
+def virtual_display(screen: str = "1024x768x24") -> Iterator[Optional[str]]:
+    """Start Xvfb if there is no display
+    :param screen: Xvfb screen geometry and depth
+
+    :return: display used, None if no display is available"""
+
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+    if shutil.which("Xvfb") is None:
+        yield None
+        return
+
+    # first free display number
+    display_nb = 99
+    while Path(f"/tmp/.X11-unix/X{display_nb}").exists():
+        display_nb += 1
+    display = f":{display_nb}"
+    xvfb = subprocess.Popen(
+        ["Xvfb", display, "-screen", "0", screen, "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not Path(f"/tmp/.X11-unix/X{display_nb}").exists():
+            if xvfb.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"Xvfb could not be started on {display}")
+            time.sleep(0.05)
+        os.environ["DISPLAY"] = display
+        yield display
+    finally:
+        os.environ.pop("DISPLAY", None)
+        xvfb.terminate()
+        xvfb.wait()
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """Parse the -X importtime output
+
+    :param stderr: standard error of the interpreter
+
+    :return: (module, self us, cumulative us), in import order (list)"""
+
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():  # header line
+            continue
+        modules.append((module.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def run_import_time(runs: int, top: int = 15) -> dict:
+    """Import VerbenLernen in runs new interpreters
+    :param runs: number of interpreters
+    :param top: number of slowest modules reported"""
+
+    totals = []
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import VerbenLernen"],
+            cwd=ROOT_PROJECT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for module, self_us, cumulative_us in parse_importtime(completed.stderr):
+            self_times[module].append(self_us)
+            if module == "VerbenLernen":
+                totals.append(cumulative_us / 1e6)
+
+    median_self = {
+        module: statistics.median(times) / 1e6 for module, times in self_times.items()
+    }
+    packages: Dict[str, float] = defaultdict(float)
+    for module, seconds in median_self.items():
+        packages[module.split(".")[0]] += seconds
+    slowest = sorted(median_self.items(), key=lambda item: item[1], reverse=True)
+
+    return {
+        "total": _summary(totals),
+        "modules": len(median_self),
+        "slowest_modules_ms": {
+            module: _ms(seconds) for module, seconds in slowest[:top]
+        },
+        "packages_ms": {
+            package: _ms(seconds)
+            for package, seconds in sorted(
+                packages.items(), key=lambda item: item[1], reverse=True
+            )[:top]
+        },
+        "pil_imported": "PIL" in self_times,
+    }
+
+
+def run_first_frame(runs: int) -> dict:
+    """Start the app in runs new interpreters
+    :param runs: number of interpreters"""
+
+    from_spawn, from_import, import_only = [], [], []
+    for _ in range(runs):
+        spawn = time.monotonic()
+        completed = subprocess.run(
+            [sys.executable, "-c", FIRST_FRAME_PROBE],
+            cwd=ROOT_PROJECT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        # time.monotonic is shared by all the processes of the machine
+        times = json.loads(completed.stdout.splitlines()[-1])
+        from_spawn.append(times["first_frame"] - spawn)
+        from_import.append(times["first_frame"] - times["start"])
+        import_only.append(times["imported"] - times["start"])
+
+    return {
+        "from_spawn": _summary(from_spawn),
+        "from_import": _summary(from_import),
+        "import": _summary(import_only),
+    }
+
+
+def _render(root: tk.Tk, launch: Callable) -> float:
+    start = time.perf_counter()
+    launch()
+    root.update_idletasks()
+    return time.perf_counter() - start
+
+
+def run_template_launcher(root: tk.Tk, container: ttk.Frame, runs: int) -> dict:
+    """Render each page template runs times on a new instance (first launch),
+    and runs times on the same instance (next launches)"""
+
+    from lib.windows import (
+        GameConclusionTemplate,
+        GameFailedTemplate,
+        GamePageTemplate,
+        GamePresentationTemplate,
+        GameSuccessTemplate,
+    )
+
+    templates = {
+        "presentation_page": (
+            GamePresentationTemplate,
+            lambda page, nber: page.template_launcher(),
+        ),
+        "game_pages": (
+            GamePageTemplate,
+            lambda page, nber: page.template_launcher(
+                VERB.infinitive, runs - nber, nber
+            ),
+        ),
+        "success_page": (
+            GameSuccessTemplate,
+            lambda page, nber: page.template_launcher(VERB),
+        ),
+        "fail_page": (
+            GameFailedTemplate,
+            lambda page, nber: page.template_launcher(VERB, "preterite tense typo"),
+        ),
+        "conclusion_page": (
+            GameConclusionTemplate,
+            lambda page, nber: page.template_launcher(nber),
+        ),
+    }
+
+    results = {}
+    for page_name, (template_class, launch) in templates.items():
+        first, update = [], []
+        for nber in range(runs):
+            page = template_class(container, _noop)
+            first.append(_render(root, lambda: launch(page, nber)))
+            page.destroy()
+        page = template_class(container, _noop)
+        launch(page, 0)
+        root.update_idletasks()
+        for nber in range(runs):
+            update.append(_render(root, lambda: launch(page, nber)))
+        page.destroy()
+        results[page_name] = {
+            "first_launch": _summary(first),
+            "next_launch": _summary(update),
+        }
+    return results
+
+
+def run_round_transition(rounds: int) -> dict:
+    """Play rounds verbs with the app, one answer over two is correct"""
+
+    from VerbenLernen import VerbenLernenApp
+
+    app = VerbenLernenApp(max_game=rounds, review_state=None, player_store=None)
+    try:
+        app.update()
+        start_latency = _render(app, app.switch_to_game_page)
+        to_state, to_game = [], []
+        for nber in range(rounds):
+            verb = app.session.current_verb
+            if nber % 2:
+                app.game_pages.imperfect_entried.set(verb[TenseKey.PERFECT.value])
+                app.game_pages.preterite_entried.set(verb[TenseKey.PRETERITE.value])
+            to_state.append(_render(app, app.choose_failed_or_success_page))
+            to_game.append(_render(app, app.choose_game_or_conclusion_page))
+        return {
+            "start": _summary([start_latency]),
+            "game_to_state": _summary(to_state),
+            # the last transition goes to the conclusion page
+            "state_to_game": _summary(to_game[:-1] or to_game),
+            "round": _summary([state + game for state, game in zip(to_state, to_game)]),
+        }
+    finally:
+        app.destroy()
+
+
+def run(import_runs: int, first_frame_runs: int, render_runs: int, rounds: int) -> dict:
+    """Run the whole suite
+    :param import_runs: interpreters started to measure the import time
+    :param first_frame_runs: interpreters started to measure the first frame
+    :param render_runs: launches of each page template
+    :param rounds: verbs played to measure the round transitions"""
+
+    results = {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+        "platform": platform.platform(),
+        "import_time": run_import_time(import_runs),
+    }
+    with virtual_display() as display:
+        if display is None:
+            raise SystemExit("No display and Xvfb is not installed")
+        results["display"] = display
+        results["first_frame"] = run_first_frame(first_frame_runs)
+
+        from lib.windows.templates import configure_style
+
+        root = tk.Tk()
+        root.geometry("550x500")
+        container = ttk.Frame(root)
+        container.pack(side=TkSide.TOP, fill=TkFilling.BOTH, expand=True)
+        configure_style(container)
+        try:
+            results["template_launcher"] = run_template_launcher(
+                root, container, render_runs
+            )
+        finally:
+            root.destroy()
+        results["round_transition"] = run_round_transition(rounds)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--import-runs", type=int, default=10)
+    parser.add_argument("--first-frame-runs", type=int, default=10)
+    parser.add_argument("--render-runs", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--output", default=None, help="JSON file, printed if not set")
+    args = parser.parse_args()
+
+    results = run(
+        args.import_runs, args.first_frame_runs, args.render_runs, args.rounds
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
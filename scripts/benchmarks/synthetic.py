@@ -0,0 +1,55 @@
+""" Synthetic tense verbs corpus, in starke_unregelmeassie.txt format"""
+
+import random
+import string
+from typing import Iterator, Optional, Tuple
+
+from lib.edit.verb import AUXILIARIES, LEVELS
+
+
+def synthetic_records(
+    size: int, seed: Optional[int] = 0, random_stems: bool = False
+) -> Iterator[Tuple[str, ...]]:
+    """Generate fake tense verbs records
+    :param size: number of records
+    :param seed: (Optional) seed of the random generator. Default set to 0
+    :param random_stems: (Optional) stems of 4 to 9 random letters instead of
+    verb<index>, closer to the edit distances of a real corpus. Default set to False
+
+    :return: (infinitive, third form, preterite, auxiliary, participle, level)"""
+
+    rng = random.Random(seed)
+    stems = set()
+    for index in range(size):
+        stem = f"verb{index}"
+        if random_stems:
+            while stem in stems or stem.startswith("verb"):
+                stem = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+            stems.add(stem)
+        yield (
+            stem + "en",
+            stem + "t",
+            stem + "te",
+            rng.choice(AUXILIARIES[:2]),
+            "ge" + stem + "t",
+            rng.choice(LEVELS),
+        )
+
+
+def synthetic_lines(size: int, seed: Optional[int] = 0) -> Iterator[str]:
+    """Generate fake tense verbs lines, same format as read_txt lines
+    :param size: number of lines
+    :param seed: (Optional) seed of the random generator. Default set to 0"""
+
+    for record in synthetic_records(size, seed):
+        yield " ".join(record) + "\n"
+
+
+def write_synthetic_corpus(path_to_file: str, size: int, seed: Optional[int] = 0):
+    """Write a fake corpus, without line break after the last line
+    :param path_to_file: path to the corpus to create
+    :param size: number of verbs
+    :param seed: (Optional) seed of the random generator. Default set to 0"""
+
+    with open(path_to_file, "w", encoding="utf-8") as txt_file:
+        txt_file.write("".join(synthetic_lines(size, seed)).rstrip("\n"))
@@ -0,0 +1,148 @@
+""" Cost of the input validation of the templates, by validation mode:
+    - check_input: check lists built at each call, as done before validate_input
+      (arguments are also mapped to their names: an upper bound)
+    - strict: checkers compiled by validate_input
+    - off: functions not wrapped
+A round calls the validated functions of one verb: game page launcher,
+update of the infinitive verb, success or failed page launcher. The page
+build calls all the widget factories of the game page, only done one time.
+
+The real functions need a display: each one is replaced by a function doing
+nothing with the same signature and the same expected types, so only the
+validation is measured.
+
+Launch from the root project:
+    python -m scripts.benchmarks.validation --rounds 100000"""
+
+import argparse
+import inspect
+import json
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Tuple
+
+from lib.constant_values import TkSide, ValidationMode
+from lib.edit.verb import Verb
+from lib.validation import (
+    VALIDATION_MODE_ENV,
+    check_input,
+    set_validation_mode,
+    validate_input,
+)
+from lib.windows import templates
+
+
+VERB = Verb("fahren", "fährt", "fuhr", "ist", "gefahren", "A1")
+# widgets created without Tk interpreter: only their type is needed
+FRAME = ttk.Frame.__new__(ttk.Frame)
+TEXT = tk.Text.__new__(tk.Text)
+STRING_VAR = tk.StringVar.__new__(tk.StringVar)
+
+Call = Tuple[str, tuple, dict]
+
+ROUND_CALLS: List[Call] = [
+    ("GamePageTemplate.template_launcher", (None, "fahren", 12, 7), {}),
+    ("update_text", (TEXT, "fahren"), {}),
+    ("GameStateTemplate.template_launcher", (None, VERB, "typo"), {}),
+]
+PAGE_BUILD_CALLS: List[Call] = (
+    [("create_frame", (FRAME,), {"fill": "x", "side": TkSide.TOP, "pady": 10})] * 7
+    + [("create_label", (FRAME, "Infinitive verb:"), {"tk_width": 30})] * 6
+    + [("create_text", (FRAME, ""), {"tk_width": 30})]
+    + [("create_entry", (FRAME, STRING_VAR, 35), {"side": TkSide.LEFT})] * 2
+    + [("create_progress_bar", (FRAME,), {"fill": "x", "is_started": False})]
+    + [("create_button", (FRAME, "SUBMIT"), {"callable_function": print})]
+)
+
+
+def _validated_functions() -> Dict[str, Callable]:
+    """Decorated functions of the templates, by qualified name"""
+    functions = {}
+    for name in {name for name, _, _ in ROUND_CALLS + PAGE_BUILD_CALLS}:
+        owner = templates
+        for attribute in name.split("."):
+            owner = getattr(owner, attribute)
+        if not hasattr(owner, "expected_types"):
+            raise SystemExit(
+                f"Templates imported without validation, unset {VALIDATION_MODE_ENV}"
+            )
+        functions[name] = owner
+    return functions
+
+
+def _stand_in(function: Callable) -> Callable:
+    """Function doing nothing, with the signature of the decorated function"""
+
+    def stand_in(*args, **kwargs):
+        pass
+
+    stand_in.__signature__ = inspect.signature(function.__wrapped__)
+    return stand_in
+
+
+def _check_input_stand_in(function: Callable) -> Callable:
+    """Stand in validating its inputs with check_input at each call"""
+    parameters = list(inspect.signature(function.__wrapped__).parameters)
+    expected_types = function.expected_types
+
+    def stand_in(*args, **kwargs):
+        values = dict(zip(parameters, args), **kwargs)
+        check_input(
+            [
+                (values[name], expected_type)
+                for name, expected_type in expected_types.items()
+                if name in values
+            ]
+        )
+
+    return stand_in
+
+
+def _time_calls(
+    functions: Dict[str, Callable], calls: List[Call], rounds: int
+) -> float:
+    bound_calls = [(functions[name], args, kwargs) for name, args, kwargs in calls]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for function, args, kwargs in bound_calls:
+            function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(rounds: int) -> dict:
+    """Time rounds rounds and page builds in each mode
+    :param rounds: number of rounds"""
+
+    decorated = _validated_functions()
+    stand_ins = {name: _stand_in(function) for name, function in decorated.items()}
+    modes = {
+        "check_input": {
+            name: _check_input_stand_in(function)
+            for name, function in decorated.items()
+        }
+    }
+    for mode in ValidationMode:
+        set_validation_mode(mode)
+        modes[mode.value] = {
+            name: validate_input(**decorated[name].expected_types)(stand_in)
+            for name, stand_in in stand_ins.items()
+        }
+    set_validation_mode(ValidationMode.STRICT)
+
+    results = {"rounds": rounds}
+    for calls_name, calls in (("round", ROUND_CALLS), ("page_build", PAGE_BUILD_CALLS)):
+        baseline = _time_calls(stand_ins, calls, rounds)
+        results[calls_name] = {"validated_calls": len(calls), "overhead_us": {}}
+        for mode, functions in modes.items():
+            overhead = (_time_calls(functions, calls, rounds) - baseline) / rounds
+            results[calls_name]["overhead_us"][mode] = round(overhead * 1e6, 3)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rounds), indent=2))
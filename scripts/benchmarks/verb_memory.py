@@ -0,0 +1,73 @@
+""" Memory used per tense verb by the different storages:
+    - list of raw lines (Editfile.read_txt)
+    - list of Verb records
+    - compiled corpus (CompiledCorpus, used by HandlerTenseVerbs): the
+      records are in a mmap of the compiled file, paged in by the system
+      when read, so its file size is given with the heap memory
+The game only builds Verb records for the verbs it plays.
+
+Launch from the root project:
+    python -m scripts.benchmarks.verb_memory --size 1000000"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import tracemalloc
+
+from lib.edit.corpus import (
+    CompiledCorpus,
+    compile_corpus,
+    compiled_path_for,
+    parse_line,
+)
+from lib.edit.verb import Verb
+from scripts.benchmarks.synthetic import synthetic_lines, write_synthetic_corpus
+
+
+def _measure(build) -> int:
+    """Bytes still allocated by the object returned by build"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    storage = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del storage
+    gc.collect()
+    return after - before
+
+
+def run(size: int) -> dict:
+    """Measure each storage for size synthetic verbs
+    :param size: number of verbs
+
+    :return: bytes per verb by storage (dict)"""
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus_path = os.path.join(directory, "corpus.txt")
+        write_synthetic_corpus(corpus_path, size)
+        compile_corpus(corpus_path)
+
+        storages = {
+            "raw_lines": lambda: list(synthetic_lines(size)),
+            "verb_records": lambda: [
+                Verb.from_fields(parse_line(line)) for line in synthetic_lines(size)
+            ],
+            "compiled_corpus_heap": lambda: CompiledCorpus(corpus_path),
+        }
+        results = {
+            name: round(_measure(build) / size, 1) for name, build in storages.items()
+        }
+        compiled_size = os.path.getsize(compiled_path_for(corpus_path))
+        results["compiled_corpus_file"] = round(compiled_size / size, 1)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(json.dumps({"size": args.size, "bytes_per_verb": run(args.size)}, indent=2))
@@ -0,0 +1,114 @@
+""" Build the pre-sized images of the templates
+
+Each image displayed by a template is resized one time here, and saved
+as PNG and GIF: tk.PhotoImage reads them natively (GIF for Tk older than
+8.6), so the game never imports Pillow to display them. The manifest
+lists the variants of each image, see lib.img.sized_image_path.
+
+Launch from the root project after changing an image or a template size:
+    python -m scripts.build_assets"""
+
+import argparse
+import json
+import os
+from typing import Dict, Iterable, Tuple
+
+from PIL import Image
+
+from lib.edit.corpus import file_checksum
+from lib.img import (
+    LANCZOS,
+    PATH_TO_IMG_MANIFEST,
+    PATH_TO_POSITIVE_SMILEY,
+    PATH_TO_SAD_SMILEY_2,
+    PATH_TO_SIZED_IMG,
+    PATH_TO_THUM_UP_SMILEY,
+)
+
+# images and sizes used by the templates, see lib.windows.templates
+TEMPLATE_ASSETS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    PATH_TO_POSITIVE_SMILEY: ((350, 300),),
+    PATH_TO_SAD_SMILEY_2: ((350, 300),),
+    PATH_TO_THUM_UP_SMILEY: ((350, 300),),
+}
+
+
+def _save_gif(image: Image.Image, path_to_file: str):
+    """Save as GIF, the alpha channel becomes a single transparent color"""
+
+    if image.mode != "RGBA":
+        image.convert("RGB").quantize(256).save(path_to_file)
+        return
+    alpha = image.getchannel("A")
+    palette_image = image.convert("RGB").quantize(255)
+    # palette index 255 is kept for the transparent pixels
+    palette_image.paste(255, mask=alpha.point(lambda value: 255 if value < 128 else 0))
+    palette_image.save(path_to_file, transparency=255)
+
+
+def build_assets(
+    assets: Dict[str, Iterable[Tuple[int, int]]] = TEMPLATE_ASSETS,
+    output_dir: str = PATH_TO_SIZED_IMG,
+    manifest_path: str = PATH_TO_IMG_MANIFEST,
+) -> dict:
+    """Resize the images and write the manifest.
+    Images whose checksum did not change since the last build are skipped.
+
+    :param assets: (Optional) {path to image: sizes}. Default set to TEMPLATE_ASSETS
+    :param output_dir: (Optional) Directory of the pre-sized images
+    :param manifest_path: (Optional) Path to the manifest
+
+    :return: manifest (dict)"""
+
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            previous_manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        previous_manifest = {}
+
+    manifest = {}
+    for img_path, sizes in assets.items():
+        name = os.path.basename(img_path)
+        stem = os.path.splitext(name)[0]
+        checksum = file_checksum(img_path).hex()
+        source = {"size": os.path.getsize(img_path), "sha256": checksum, "variants": {}}
+        previous = previous_manifest.get(name, {})
+
+        with Image.open(img_path) as image:
+            image.load()
+            for width, height in sizes:
+                size_name = f"{width}x{height}"
+                variant = {
+                    "resample": LANCZOS,
+                    "png": f"{stem}_{size_name}.png",
+                    "gif": f"{stem}_{size_name}.gif",
+                }
+                is_built = previous.get("sha256") == checksum and all(
+                    os.path.exists(os.path.join(output_dir, variant[image_format]))
+                    for image_format in ("png", "gif")
+                )
+                if not is_built:
+                    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+                    resized.save(
+                        os.path.join(output_dir, variant["png"]), optimize=True
+                    )
+                    _save_gif(resized, os.path.join(output_dir, variant["gif"]))
+                source["variants"][size_name] = variant
+        manifest[name] = source
+
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output-dir", default=PATH_TO_SIZED_IMG)
+    parser.add_argument("--manifest", default=PATH_TO_IMG_MANIFEST)
+    args = parser.parse_args()
+
+    manifest = build_assets(output_dir=args.output_dir, manifest_path=args.manifest)
+    print(
+        f"{sum(len(source['variants']) for source in manifest.values())} sized images"
+    )
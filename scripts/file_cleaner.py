@@ -1,37 +1,113 @@
 """ Cleaner for starke_unregelmäßie
-Delete from file: (,),*"""
+Delete from file: (,),*
 
+The result of the last clean (size, mtime and checksum of the file) is
+recorded next to the file, so cleaning an already clean file is a no-op."""
+
+import json
+import os
+import shutil
+import tempfile
+from functools import lru_cache
 from typing import Union
 
 from lib.edit import PATH_TO_STARKE_UNREGELMEASSIE
+from lib.edit.corpus import file_checksum
+
+
+CLEAN_STATE_EXTENSION = ".clean"
+
+
+@lru_cache(maxsize=8)
+def _translation_table(unwanted_char: str) -> dict:
+    """Translation table deleting every unwanted character
+    :param unwanted_char: all characters to delete, concatenated"""
+    return str.maketrans("", "", unwanted_char)
+
+
+def _read_clean_state(path_to_state: str) -> dict:
+    """Read the recorded result of the last clean, empty dict if missing"""
+    try:
+        with open(path_to_state, "r", encoding="utf-8") as state_file:
+            return json.load(state_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_clean_state(path_to_file: str, path_to_state: str, unwanted_char: str):
+    """Record size, mtime and checksum of the clean file"""
+    file_stat = os.stat(path_to_file)
+    state = {
+        "size": file_stat.st_size,
+        "mtime_ns": file_stat.st_mtime_ns,
+        "sha256": file_checksum(path_to_file).hex(),
+        "unwanted_char": unwanted_char,
+    }
+    try:
+        with open(path_to_state, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file)
+    except OSError:
+        pass  # read only installation: the file will be checked again next time
 
 
 def clean_file(
     path_to_file: str = PATH_TO_STARKE_UNREGELMEASSIE,
-    unwanted_char: Union[str, list] = ["(", ")", "*"],
-):
-    """Delete unwanted characters from file
+    unwanted_char: Union[str, list, tuple] = ("(", ")", "*"),
+) -> bool:
+    """Delete unwanted characters from file.
+    The file is processed line by line into a temporary file, which replaces
+    the file only when a character has been deleted.
 
     :param path_to_file: path to filename
-    :param unwanted_char: character(s) to delete"""
+    :param unwanted_char: character(s) to delete
+
+    :return: True if the file has been rewritten (bool)"""
+
+    unwanted_char = "".join(unwanted_char)
+    path_to_state = path_to_file + CLEAN_STATE_EXTENSION
+
+    # skip if nothing changed since the last clean
+    state = _read_clean_state(path_to_state)
+    if state.get("unwanted_char") == unwanted_char:
+        file_stat = os.stat(path_to_file)
+        if (
+            state.get("size") == file_stat.st_size
+            and state.get("mtime_ns") == file_stat.st_mtime_ns
+        ):
+            return False
+        if state.get("sha256") == file_checksum(path_to_file).hex():
+            _write_clean_state(path_to_file, path_to_state, unwanted_char)
+            return False
 
-    clean_text = []
+    table = _translation_table(unwanted_char)
+    is_changed = False
 
-    with open(path_to_file, "r") as txt_file:
-        text = txt_file.readlines()
+    directory = os.path.dirname(os.path.abspath(path_to_file))
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(
+            file_descriptor, "w", encoding="utf-8", newline=""
+        ) as tmp_file, open(
+            path_to_file, "r", encoding="utf-8", newline=""
+        ) as txt_file:
+            for line in txt_file:
+                new_line = line.translate(table)
+                if new_line != line:
+                    is_changed = True
+                tmp_file.write(new_line)
 
-    for line in text:
-        # replace all (, ), and *
-        new_line = (
-            line.replace(unwanted_char[0], "")
-            .replace(unwanted_char[1], "")
-            .replace(unwanted_char[2], "")
-        )
-        clean_text.append(new_line)
+        if is_changed:
+            shutil.copymode(path_to_file, tmp_path)
+            os.replace(tmp_path, path_to_file)
+        else:
+            os.unlink(tmp_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
-    with open(path_to_file, "w") as txt_file:
-        for text in clean_text:
-            txt_file.write(text)
+    _write_clean_state(path_to_file, path_to_state, unwanted_char)
+    return is_changed
 
 
 if __name__ == "__main__":
@@ -0,0 +1 @@
+"""TESTS package"""
@@ -0,0 +1,146 @@
+"""CountdownScheduler with a fake clock and a fake Tk widget"""
+
+import pytest
+
+from lib.windows.countdown import CountdownScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeWidget:
+    """after / after_cancel of a Tk widget, callbacks run by run_until"""
+
+    def __init__(self, clock: FakeClock, lateness: float = 0.0):
+        """
+        :param clock: clock moved forward when a callback is run
+        :param lateness: (Optional) seconds each callback runs late. Default set to 0
+        """
+        self.clock = clock
+        self.lateness = lateness
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, delay_ms: int, callback) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.pending[after_id] = (self.clock.now + delay_ms / 1000.0, callback)
+        return after_id
+
+    def after_cancel(self, after_id: str):
+        self.pending.pop(after_id, None)
+
+    def run_until(self, end: float):
+        """Run the callbacks due before end, moving the clock to each of them"""
+        while self.pending:
+            after_id = min(self.pending, key=lambda key: self.pending[key][0])
+            due, callback = self.pending[after_id]
+            if due + self.lateness > end:
+                break
+            del self.pending[after_id]
+            self.clock.now = due + self.lateness
+            callback()
+        self.clock.now = max(self.clock.now, end)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_scheduler(clock, lateness=0.0):
+    widget = FakeWidget(clock, lateness)
+    return CountdownScheduler(widget, tick_ms=200, clock=clock), widget
+
+
+@pytest.mark.parametrize("lateness", [0.0, 0.05, 0.15])
+def test_expires_once_without_drift(clock, lateness):
+    scheduler, widget = make_scheduler(clock, lateness)
+    expired_at = []
+    scheduler.start("game", 10, lambda: expired_at.append(clock.now))
+
+    widget.run_until(30.0)
+
+    assert len(expired_at) == 1
+    # late ticks do not add up: only the lateness of the last tick is added,
+    # plus the rounding of the after() delays to whole milliseconds
+    assert 10.0 <= expired_at[0] <= 10.0 + lateness + 0.001
+    assert "game" not in scheduler
+    assert not widget.pending
+
+
+def test_cancel_never_expires(clock):
+    scheduler, widget = make_scheduler(clock)
+    expired = []
+    scheduler.start("game", 5, lambda: expired.append("game"))
+    widget.run_until(2.0)
+
+    assert scheduler.cancel("game")
+    widget.run_until(20.0)
+
+    assert expired == []
+    assert not scheduler.cancel("game")
+    assert not widget.pending
+
+
+def test_cancel_all_never_expires(clock):
+    scheduler, widget = make_scheduler(clock)
+    expired = []
+    scheduler.start("game", 5, lambda: expired.append("game"))
+    scheduler.start("hint", 3, lambda: expired.append("hint"))
+    widget.run_until(1.0)
+
+    scheduler.cancel_all()
+    widget.run_until(20.0)
+
+    assert expired == []
+    assert scheduler.remaining("game") is None
+    assert not widget.pending
+
+
+def test_pause_resume_keeps_remaining_time(clock):
+    scheduler, widget = make_scheduler(clock)
+    expired_at = []
+    scheduler.start("game", 10, lambda: expired_at.append(clock.now))
+    widget.run_until(4.0)
+
+    scheduler.pause()
+    assert scheduler.remaining("game") == pytest.approx(6.0)
+    widget.run_until(100.0)  # minimized window: nothing runs
+    assert expired_at == []
+    assert scheduler.remaining("game") == pytest.approx(6.0)
+
+    scheduler.resume()
+    widget.run_until(200.0)
+
+    assert expired_at == [pytest.approx(106.0)]
+
+
+def test_restart_replaces_countdown(clock):
+    scheduler, widget = make_scheduler(clock)
+    expired = []
+    scheduler.start("game", 5, lambda: expired.append(("first", clock.now)))
+    widget.run_until(3.0)
+
+    scheduler.start("game", 5, lambda: expired.append(("second", clock.now)))
+    widget.run_until(20.0)
+
+    assert expired == [("second", pytest.approx(8.0))]
+
+
+def test_on_tick_reports_remaining_time(clock):
+    scheduler, widget = make_scheduler(clock)
+    ticks = []
+    scheduler.start(
+        "game", 1, lambda: None, lambda remaining, duration: ticks.append(remaining)
+    )
+    widget.run_until(5.0)
+
+    assert ticks[0] == 1.0
+    assert ticks[-1] == 0.0
+    assert ticks == sorted(ticks, reverse=True)
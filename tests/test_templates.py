@@ -0,0 +1,59 @@
+"""Widgets of the templates are built once, then only updated"""
+
+import tkinter as tk
+from pathlib import Path
+from tkinter import ttk
+
+import pytest
+
+from lib.edit.verb import Verb
+from lib.windows.templates import GamePageTemplate, GameStateTemplate
+
+
+ROOT_PROJECT = Path(__file__).resolve().parents[1]
+ROUNDS = 1000
+VERB = Verb("fahren", "fährt", "fuhr", "ist", "gefahren", "A1")
+
+
+def count_widgets(widget: tk.Misc) -> int:
+    """Number of widgets under widget, at any depth"""
+    children = widget.winfo_children()
+    return len(children) + sum(count_widgets(child) for child in children)
+
+
+@pytest.fixture
+def container(monkeypatch):
+    # image paths of the templates are relative to the root project
+    monkeypatch.chdir(ROOT_PROJECT)
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display available")
+    root.withdraw()
+    frame = ttk.Frame(root)
+    yield frame
+    root.destroy()
+
+
+def test_game_page_widgets_constant(container):
+    page = GamePageTemplate(container, lambda: None)
+    page.template_launcher("fahren", 20, 0)
+    frames, widgets = len(page.frames), count_widgets(page)
+
+    for round_nber in range(ROUNDS):
+        page.template_launcher("fahren", 19 - round_nber % 20, round_nber % 20)
+
+    assert len(page.frames) == frames
+    assert count_widgets(page) == widgets
+
+
+def test_game_state_widgets_constant(container):
+    page = GameStateTemplate(container, lambda: None)
+    page.template_launcher(VERB)
+    frames, widgets = len(page.frames), count_widgets(page)
+
+    for round_nber in range(ROUNDS):
+        page.template_launcher(VERB, "typo" if round_nber % 2 else "")
+
+    assert len(page.frames) == frames
+    assert count_widgets(page) == widgets